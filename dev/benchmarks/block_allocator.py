@@ -0,0 +1,66 @@
+#! /usr/bin/env python
+"""
+Churn a BlockAllocator with random allocations and frees, reporting throughput
+and how fragmented the free space ends up.
+"""
+
+import argparse
+import random
+import time
+
+from supriya.allocators import BlockAllocator
+
+
+def measure(live_count, operations, maximum_size):
+    heap_maximum = live_count * maximum_size
+    allocator = BlockAllocator(heap_maximum=heap_maximum)
+    used = []
+    # Fill the heap about halfway before churning.
+    while len(used) < live_count:
+        used.append(allocator.allocate(random.randint(1, maximum_size)))
+    failures = 0
+    start_time = time.perf_counter()
+    for _ in range(operations):
+        index = random.randrange(len(used))
+        allocator.free(used[index])
+        block_id = allocator.allocate(random.randint(1, maximum_size))
+        if block_id is None:
+            failures += 1
+            used[index] = used[-1]
+            used.pop()
+        else:
+            used[index] = block_id
+    elapsed = time.perf_counter() - start_time
+    free_sizes = [
+        stop_offset - start_offset
+        for start_offset, stop_offset in allocator._free_stops_by_start.items()
+    ]
+    return {
+        "us/op": elapsed / (operations * 2) * 1e6,
+        "free blocks": len(free_sizes),
+        "largest free": max(free_sizes, default=0) / max(sum(free_sizes), 1),
+        "failures": failures,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--operations", type=int, default=100000)
+    parser.add_argument("--maximum-size", type=int, default=16)
+    args = parser.parse_args()
+    random.seed(0)
+    print(
+        f"{'live':>8} {'us/op':>8} {'free blocks':>12} "
+        f"{'largest free':>13} {'failures':>9}"
+    )
+    for count in args.counts:
+        stats = measure(count, args.operations, args.maximum_size)
+        print(
+            f"{count:>8} {stats['us/op']:>8.3f} {stats['free blocks']:>12} "
+            f"{stats['largest free']:>12.1%} {stats['failures']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#! /usr/bin/env python
+"""
+Time EventQueue operations, per event, at increasing queue sizes.
+"""
+
+import argparse
+import random
+import time
+
+from supriya.clocks.eventqueue import EventQueue
+
+OPERATIONS = ("put", "peek", "reschedule", "rekey", "remove")
+
+
+def measure(count):
+    items = [(random.random(), i) for i in range(count)]
+    event_queue = EventQueue()
+    timings = {}
+    start_time = time.perf_counter()
+    for item in items:
+        event_queue.put(item)
+    timings["put"] = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for item in items:
+        event_queue.peek()
+    timings["peek"] = time.perf_counter() - start_time
+    rescheduled = []
+    start_time = time.perf_counter()
+    for item in items:
+        new_item = (random.random(), item[1])
+        event_queue.reschedule(item, new_item)
+        rescheduled.append(new_item)
+    timings["reschedule"] = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    event_queue.rekey(lambda item: (item[0] * 0.5, item[1]))
+    timings["rekey"] = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for seconds, i in rescheduled:
+        event_queue.remove((seconds * 0.5, i))
+    timings["remove"] = time.perf_counter() - start_time
+    assert not event_queue.queue and not event_queue.positions
+    return {key: value / count * 1e6 for key, value in timings.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10**5, 10**6])
+    args = parser.parse_args()
+    random.seed(0)
+    print(f"{'events':>8} " + " ".join(f"{name:>12}" for name in OPERATIONS))
+    for count in args.counts:
+        timings = measure(count)
+        print(
+            f"{count:>8} "
+            + " ".join(f"{timings[name]:>9.3f} us" for name in OPERATIONS)
+        )
+
+
+if __name__ == "__main__":
+    main()
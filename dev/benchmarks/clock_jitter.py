@@ -0,0 +1,73 @@
+#! /usr/bin/env python
+"""
+Compare callback jitter and CPU use of the deadline-driven Clock against a
+clock polling its event queue every ``slop`` seconds.
+"""
+
+import argparse
+import statistics
+import time
+
+from supriya.clocks import Clock, TimeUnit
+
+
+class PollingClock(Clock):
+    def _wait_for_event(self, sleep_time):
+        if sleep_time is None:
+            sleep_time = self._slop
+        self._event.wait(timeout=min(sleep_time, self._slop))
+
+
+def callback(context, lateness, count, interval):
+    lateness.append(time.time() - context.desired_moment.seconds)
+    if context.event.invocations < count:
+        return interval, TimeUnit.SECONDS
+
+
+def measure(clock_class, count, interval, idle):
+    # Jitter: a single callback rescheduling itself every ``interval`` seconds.
+    clock = clock_class()
+    lateness = []
+    clock.start()
+    clock.schedule(callback, schedule_at=interval, args=[lateness, count, interval])
+    start_cpu = time.process_time()
+    time.sleep(interval * (count + 2))
+    busy_cpu = time.process_time() - start_cpu
+    clock.stop()
+    # Idle: the only event is far in the future.
+    clock = clock_class()
+    clock.start()
+    clock.schedule(callback, schedule_at=3600, args=[[], 0, 0.0])
+    start_cpu = time.process_time()
+    time.sleep(idle)
+    idle_cpu = time.process_time() - start_cpu
+    clock.stop()
+    return lateness, busy_cpu, idle_cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--interval", type=float, default=0.005)
+    parser.add_argument("--idle", type=float, default=2.0)
+    args = parser.parse_args()
+    print(
+        f"{'clock':<14} {'median (us)':>12} {'p99 (us)':>10} {'max (us)':>10} "
+        f"{'busy cpu':>9} {'idle cpu':>9}"
+    )
+    for clock_class in (PollingClock, Clock):
+        lateness, busy_cpu, idle_cpu = measure(
+            clock_class, args.count, args.interval, args.idle
+        )
+        lateness.sort()
+        print(
+            f"{clock_class.__name__:<14} "
+            f"{statistics.median(lateness) * 1e6:>12.1f} "
+            f"{lateness[int(len(lateness) * 0.99)] * 1e6:>10.1f} "
+            f"{lateness[-1] * 1e6:>10.1f} "
+            f"{busy_cpu:>8.3f}s {idle_cpu:>8.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
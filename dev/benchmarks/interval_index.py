@@ -0,0 +1,63 @@
+#! /usr/bin/env python
+"""
+Compare bulk loading and stabbing queries of IntervalIndex against
+IntervalTree.
+"""
+
+import argparse
+import random
+import time
+
+from supriya.intervals import Interval, IntervalIndex, IntervalTree
+
+
+def measure(factory, intervals, offsets):
+    start_time = time.perf_counter()
+    index = factory(intervals)
+    build_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    found = sum(len(index.find_intersection(offset)) for offset in offsets)
+    query_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for offset in offsets:
+        index.get_moment_at(offset)
+    moment_time = time.perf_counter() - start_time
+    return build_time, query_time, moment_time, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    span = args.count / 10
+    intervals = []
+    for _ in range(args.count):
+        start_offset = random.uniform(0, span)
+        intervals.append(Interval(start_offset, start_offset + random.expovariate(1)))
+    offsets = [random.uniform(0, span) for _ in range(args.queries)]
+    print(f"intervals: {args.count}, queries: {args.queries}")
+    print(f"{'structure':<24} {'build (s)':>10} {'stab (us)':>10} {'moment (us)':>12}")
+    expected = None
+    for name, factory in (
+        ("IntervalTree", lambda x: IntervalTree(x, accelerated=False)),
+        ("IntervalTree (Cython)", lambda x: IntervalTree(x, accelerated=True)),
+        ("IntervalIndex", IntervalIndex),
+    ):
+        build_time, query_time, moment_time, found = measure(
+            factory, intervals, offsets
+        )
+        if expected is None:
+            expected = found
+        assert found == expected
+        print(
+            f"{name:<24} {build_time:>10.3f} "
+            f"{query_time / args.queries * 1e6:>10.2f} "
+            f"{moment_time / args.queries * 1e6:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
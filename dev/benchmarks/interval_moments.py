@@ -0,0 +1,48 @@
+#! /usr/bin/env python
+"""
+Compare IntervalTree.iterate_moments' sweep against chaining
+Moment.next_moment, which queries the tree at every start offset.
+"""
+
+import argparse
+import random
+import time
+
+from supriya.intervals import Interval, IntervalTree
+
+
+def iterate_moments_by_query(interval_tree):
+    moment = interval_tree.get_moment_at(interval_tree.earliest_start_offset)
+    while moment is not None:
+        yield moment
+        moment = moment.next_moment
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    span = args.count / 10
+    intervals = []
+    for _ in range(args.count):
+        start_offset = round(random.uniform(0, span), 2)
+        intervals.append(Interval(start_offset, start_offset + random.expovariate(1)))
+    print(f"intervals: {args.count}")
+    for accelerated in (False, True):
+        interval_tree = IntervalTree(intervals, accelerated=accelerated)
+        timings = []
+        for iterator in (iterate_moments_by_query, IntervalTree.iterate_moments):
+            start_time = time.perf_counter()
+            moments = sum(1 for _ in iterator(interval_tree))
+            timings.append(time.perf_counter() - start_time)
+        print(
+            f"accelerated={accelerated!s:<5} moments: {moments} "
+            f"query: {timings[0]:.3f}s sweep: {timings[1]:.3f}s "
+            f"({timings[0] / timings[1]:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#! /usr/bin/env python
+"""
+Churn permanent node IDs, comparing NodeIdAllocator's freed-ID heap against
+scanning a set of freed IDs with min().
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from supriya.allocators import NodeIdAllocator
+
+
+class SetScanAllocator:
+    def __init__(self, initial_node_id):
+        self._freed_permanent_ids = set()
+        self._initial_node_id = initial_node_id
+        self._lock = threading.Lock()
+        self._next_permanent_id = 1
+
+    def allocate_permanent_node_id(self):
+        with self._lock:
+            if self._freed_permanent_ids:
+                x = min(self._freed_permanent_ids)
+                self._freed_permanent_ids.remove(x)
+            else:
+                x = self._next_permanent_id
+                self._next_permanent_id = min(x + 1, self._initial_node_id - 1)
+        return x
+
+    def free_permanent_node_id(self, node_id):
+        with self._lock:
+            if node_id < self._initial_node_id:
+                self._freed_permanent_ids.add(node_id)
+
+
+def measure(allocator, live_count, operations):
+    live = [allocator.allocate_permanent_node_id() for _ in range(live_count)]
+    # Free half up front so every allocation has freed IDs to choose from.
+    random.shuffle(live)
+    for node_id in live[live_count // 2 :]:
+        allocator.free_permanent_node_id(node_id)
+    del live[live_count // 2 :]
+    start_time = time.perf_counter()
+    for _ in range(operations):
+        index = random.randrange(len(live))
+        allocator.free_permanent_node_id(live[index])
+        live[index] = allocator.allocate_permanent_node_id()
+    return (time.perf_counter() - start_time) / operations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--operations", type=int, default=20000)
+    args = parser.parse_args()
+    random.seed(0)
+    print(f"{'live':>8} {'set scan (us)':>14} {'heap (us)':>10} {'speedup':>9}")
+    for count in args.counts:
+        initial_node_id = count + 1
+        scan = measure(SetScanAllocator(initial_node_id), count, args.operations)
+        heap = measure(
+            NodeIdAllocator(initial_node_id=initial_node_id), count, args.operations
+        )
+        print(f"{count:>8} {scan:>14.3f} {heap:>10.3f} {scan / heap:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#! /usr/bin/env python
+"""
+Compare the time and peak memory of preparing a long non-realtime session's
+score in memory against streaming it to disk.
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+
+import supriya.nonrealtime
+import supriya.ugens
+from supriya.synthdefs import SynthDefBuilder
+
+
+def build_session(event_count):
+    with SynthDefBuilder(frequency=440, out=0) as builder:
+        supriya.ugens.Out.ar(
+            bus=builder["out"], source=supriya.ugens.SinOsc.ar(builder["frequency"])
+        )
+    synthdef = builder.build()
+    session = supriya.nonrealtime.Session()
+    for i in range(event_count):
+        with session.at(i * 0.01):
+            session.add_synth(synthdef=synthdef, duration=0.05, frequency=i)
+    return session
+
+
+def measure(session, streaming, directory):
+    renderer = supriya.nonrealtime.Renderer(
+        session, render_directory_path=directory, streaming=streaming
+    )
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    renderer.render()
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, nargs="+", default=[1000, 4000, 16000])
+    args = parser.parse_args()
+    print(
+        f"{'events':>6} {'memory (s)':>10} {'peak (KiB)':>10} "
+        f"{'streaming (s)':>13} {'peak (KiB)':>10}"
+    )
+    for event_count in args.events:
+        session = build_session(event_count)
+        with tempfile.TemporaryDirectory() as directory:
+            memory_time, memory_peak = measure(session, False, directory)
+            streaming_time, streaming_peak = measure(session, True, directory)
+        print(
+            f"{event_count:>6} {memory_time:>10.3f} {memory_peak / 1024:>10.0f} "
+            f"{streaming_time:>13.3f} {streaming_peak / 1024:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#! /usr/bin/env python
+"""
+Time indexing a non-realtime session's offsets with a plain list, as
+``list.index()`` plus ``list.insert()``, against a SortedOffsetList, and time
+building sessions with many offsets.
+"""
+
+import argparse
+import bisect
+import random
+import time
+
+import supriya.nonrealtime
+import supriya.ugens
+from supriya.nonrealtime.states import SortedOffsetList
+from supriya.synthdefs import SynthDefBuilder
+
+
+def index_offsets(offsets, sorted_=True):
+    start_time = time.perf_counter()
+    if sorted_:
+        offset_list = SortedOffsetList([float("-inf")])
+        for offset in offsets:
+            # Sessions look up the preceding state before adding each offset
+            next(offset_list.iterate_before(offset))
+            offset_list.add(offset)
+    else:
+        offset_list = [float("-inf")]
+        for offset in offsets:
+            previous_offset = offset_list[bisect.bisect_left(offset_list, offset) - 1]
+            offset_list.insert(offset_list.index(previous_offset) + 1, offset)
+    return time.perf_counter() - start_time
+
+
+def build_session(offset_count):
+    with SynthDefBuilder(frequency=440) as builder:
+        supriya.ugens.Out.ar(
+            bus=0, source=supriya.ugens.SinOsc.ar(builder["frequency"])
+        )
+    synthdef = builder.build()
+    start_time = time.perf_counter()
+    session = supriya.nonrealtime.Session()
+    for i in range(offset_count):
+        with session.at(i * 0.5):
+            session.add_synth(synthdef=synthdef, duration=0.25, frequency=i)
+    elapsed = time.perf_counter() - start_time
+    assert len(session.offsets) == 2 * offset_count + 1
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--offsets", type=int, nargs="+", default=[25000, 100000])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1000, 4000])
+    args = parser.parse_args()
+    print(f"{'offsets':>7} {'list (s)':>8} {'sorted (s)':>10}")
+    for offset_count in args.offsets:
+        offsets = [float(x) for x in range(offset_count)]
+        random.Random(0).shuffle(offsets)
+        list_time = index_offsets(offsets, sorted_=False)
+        sorted_time = index_offsets(offsets)
+        print(f"{offset_count:>7} {list_time:>8.3f} {sorted_time:>10.3f}")
+    print()
+    print(f"{'synths':>7} {'build (s)':>9} {'per synth (ms)':>14}")
+    for offset_count in args.sessions:
+        elapsed = build_session(offset_count)
+        print(
+            f"{offset_count:>7} {elapsed:>9.3f} {elapsed / offset_count * 1000:>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
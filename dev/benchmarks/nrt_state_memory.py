@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+"""
+Compare the time and memory of building a non-realtime session whose large
+node tree states are copy-on-write against states always holding plain dicts.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import supriya.nonrealtime
+import supriya.ugens
+from supriya.nonrealtime import State
+from supriya.synthdefs import SynthDefBuilder
+
+
+def build_session(node_count, offset_count):
+    with SynthDefBuilder(frequency=440, out=0) as builder:
+        supriya.ugens.Out.ar(
+            bus=builder["out"], source=supriya.ugens.SinOsc.ar(builder["frequency"])
+        )
+    synthdef = builder.build()
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        for _ in range(node_count):
+            session.add_group(duration=offset_count + 1)
+    for i in range(offset_count):
+        with session.at(i + 0.5):
+            session.add_synth(synthdef=synthdef, duration=0.25, frequency=i)
+    return session
+
+
+def measure(maximum_dict_length, node_count, offset_count):
+    State._maximum_dict_length = maximum_dict_length
+    start_time = time.perf_counter()
+    build_session(node_count, offset_count)
+    elapsed = time.perf_counter() - start_time
+    # Tracing slows allocation-heavy code unevenly, so trace a second build
+    tracemalloc.start()
+    session = build_session(node_count, offset_count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(session.states) > offset_count
+    return elapsed, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=300)
+    parser.add_argument("--offsets", type=int, nargs="+", default=[100, 400])
+    args = parser.parse_args()
+    maximum_dict_length = State._maximum_dict_length
+    print(
+        f"{'nodes':>6} {'offsets':>7} {'dict (s)':>8} {'memory (KiB)':>12} "
+        f"{'cow (s)':>8} {'memory (KiB)':>12}"
+    )
+    for offset_count in args.offsets:
+        dict_time, dict_memory = measure(float("inf"), args.nodes, offset_count)
+        cow_time, cow_memory = measure(maximum_dict_length, args.nodes, offset_count)
+        print(
+            f"{args.nodes:>6} {offset_count:>7} "
+            f"{dict_time:>8.3f} {dict_memory / 1024:>12.0f} "
+            f"{cow_time:>8.3f} {cow_memory / 1024:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
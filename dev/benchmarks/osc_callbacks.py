@@ -0,0 +1,41 @@
+#! /usr/bin/env python
+"""
+Register many concurrent one-shot /synced waiters and time matching them.
+"""
+
+import argparse
+import time
+
+from supriya.osc import OscMessage
+from supriya.osc.protocols import OscProtocol
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+    osc_protocol = OscProtocol()
+    osc_protocol._add_callback(
+        osc_protocol._validate_callback(pattern="/done", procedure=print)
+    )
+    start_time = time.perf_counter()
+    for i in range(args.count):
+        osc_protocol._add_callback(
+            osc_protocol._validate_callback(
+                pattern=["/synced", i], procedure=print, once=True
+            )
+        )
+    register_time = time.perf_counter() - start_time
+    messages = [OscMessage("/synced", i) for i in reversed(range(args.count))]
+    start_time = time.perf_counter()
+    for message in messages:
+        assert len(osc_protocol._match_callbacks(message)) == 1
+    match_time = time.perf_counter() - start_time
+    assert list(osc_protocol.callbacks) == [("/done",)]
+    print(f"waiters:  {args.count}")
+    print(f"register: {register_time / args.count * 1e6:.3f} us/callback")
+    print(f"match:    {match_time / args.count * 1e6:.3f} us/message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#! /usr/bin/env python
+"""
+Compare OscMessage.to_datagram and OscMessageTemplate against the generic
+per-value encoder.
+"""
+
+import argparse
+import timeit
+
+from supriya.osc import OscMessage, OscMessageTemplate
+
+MESSAGES = {
+    "/n_set": OscMessage("/n_set", 1000, "frequency", 443.0, "amplitude", 0.5),
+    "/s_new": OscMessage(
+        "/s_new", "default", 1001, 0, 1, "frequency", 443.0, "pan", -0.25
+    ),
+    "/c_set": OscMessage("/c_set", 0, 0.5, 1, 0.25, 2, 0.125),
+    "/n_free": OscMessage("/n_free", 1000),
+    "/sync": OscMessage("/sync", 2),
+}
+
+TEMPLATES = {
+    "/n_set": (
+        OscMessageTemplate("/n_set", int, "frequency", float, "amplitude", float),
+        (1000, 443.0, 0.5),
+    ),
+    "/s_new": (
+        OscMessageTemplate(
+            "/s_new", "default", int, int, int, "frequency", float, "pan", float
+        ),
+        (1001, 0, 1, 443.0, -0.25),
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+    print(f"{'message':<10} {'generic (us)':>14} {'fast (us)':>12} {'speedup':>9}")
+    for name, message in MESSAGES.items():
+        assert message.to_datagram() == message._to_datagram_generic()
+        generic = timeit.timeit(message._to_datagram_generic, number=args.number)
+        fast = timeit.timeit(message.to_datagram, number=args.number)
+        print(
+            f"{name:<10} {generic / args.number * 1e6:>14.3f} "
+            f"{fast / args.number * 1e6:>12.3f} {generic / fast:>8.2f}x"
+        )
+    print()
+    print(f"{'template':<10} {'generic (us)':>14} {'render (us)':>12} {'speedup':>9}")
+    for name, (template, values) in TEMPLATES.items():
+        message = MESSAGES[name]
+        assert template.to_datagram(*values) == message._to_datagram_generic()
+        generic = timeit.timeit(message._to_datagram_generic, number=args.number)
+        render = timeit.timeit(
+            lambda: template.to_datagram(*values), number=args.number
+        )
+        print(
+            f"{name:<10} {generic / args.number * 1e6:>14.3f} "
+            f"{render / args.number * 1e6:>12.3f} {generic / render:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#! /usr/bin/env python
+"""
+Compare building factory SynthDefs cold against loading them from a warm
+SynthDefCache.
+"""
+
+import argparse
+import tempfile
+import time
+
+import supriya.ugens
+from supriya.synthdefs import SynthDefCache, SynthDefFactory
+
+
+def signal_block(builder, source, state):
+    for _ in range(state["iterations"]):
+        source = supriya.ugens.AllpassC.ar(
+            decay_time=supriya.ugens.ExpRand.ir(minimum=0.01, maximum=0.1),
+            delay_time=supriya.ugens.ExpRand.ir(minimum=0.01, maximum=0.1),
+            source=source,
+            maximum_delay_time=0.1,
+        )
+    return source
+
+
+def build_all(factory, count, cache=None):
+    start_time = time.perf_counter()
+    for i in range(count):
+        factory.build(
+            name=f"allpass-{i}",
+            cache=cache,
+            channel_count=i % 4 + 1,
+            iterations=i % 8 + 1,
+        )
+    return time.perf_counter() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=300)
+    args = parser.parse_args()
+    factory = (
+        SynthDefFactory()
+        .with_input()
+        .with_output(crossfaded=True)
+        .with_gate()
+        .with_signal_block(signal_block)
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        uncached_time = build_all(factory, args.count)
+        cold_time = build_all(factory, args.count, SynthDefCache(directory))
+        cache = SynthDefCache(directory)
+        warm_time = build_all(factory, args.count, cache)
+        assert cache.hits == args.count
+    print(f"synthdefs: {args.count}")
+    print(f"uncached: {uncached_time:.3f}s")
+    print(f"cold:     {cold_time:.3f}s")
+    print(f"warm:     {warm_time:.3f}s ({uncached_time / warm_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#! /usr/bin/env python
+"""
+Time building and compiling large generated SynthDefs against their UGen
+count.
+"""
+
+import argparse
+import time
+
+import supriya.ugens
+from supriya.synthdefs import SynthDefBuilder
+
+
+def build_additive_bank(voices):
+    with SynthDefBuilder(frequency=110, amplitude=0.1, out=0) as builder:
+        partials = [
+            supriya.ugens.SinOsc.ar(frequency=builder["frequency"] * (i + 1))
+            * (builder["amplitude"] / (i + 1))
+            for i in range(voices)
+        ]
+        supriya.ugens.Out.ar(bus=builder["out"], source=supriya.ugens.Mix.new(partials))
+    return builder
+
+
+def build_splay(voices):
+    with SynthDefBuilder(frequency=110, spread=1, out=0) as builder:
+        sources = [
+            supriya.ugens.Saw.ar(frequency=builder["frequency"] + i)
+            for i in range(voices)
+        ]
+        supriya.ugens.Out.ar(
+            bus=builder["out"],
+            source=supriya.ugens.Splay.ar(source=sources, spread=builder["spread"]),
+        )
+    return builder
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--voices", type=int, nargs="+", default=[64, 128, 256, 512, 1024]
+    )
+    args = parser.parse_args()
+    print(f"{'graph':<10} {'voices':>6} {'ugens':>6} {'build (s)':>10} {'us/ugen':>8}")
+    for name, factory in (("additive", build_additive_bank), ("splay", build_splay)):
+        for voices in args.voices:
+            builder = factory(voices)
+            start_time = time.perf_counter()
+            synthdef = builder.build()
+            synthdef.compile()
+            elapsed = time.perf_counter() - start_time
+            ugen_count = len(synthdef.ugens)
+            print(
+                f"{name:<10} {voices:>6} {ugen_count:>6} {elapsed:>10.3f} "
+                f"{elapsed / ugen_count * 1e6:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
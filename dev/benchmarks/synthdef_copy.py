@@ -0,0 +1,60 @@
+#! /usr/bin/env python
+"""
+Compare the time and peak memory of deep copying a builder's UGen graph
+against SynthDef's single-pass copy, and of a whole build.
+"""
+
+import argparse
+import copy
+import time
+import tracemalloc
+
+import supriya.ugens
+from supriya.synthdefs import SynthDef, SynthDefBuilder
+
+
+def build_additive_bank(voices):
+    with SynthDefBuilder(frequency=110, amplitude=0.1, out=0) as builder:
+        partials = [
+            supriya.ugens.SinOsc.ar(frequency=builder["frequency"] * (i + 1))
+            * (builder["amplitude"] / (i + 1))
+            for i in range(voices)
+        ]
+        supriya.ugens.Out.ar(bus=builder["out"], source=supriya.ugens.Mix.new(partials))
+    return builder
+
+
+def measure(function, *args):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--voices", type=int, nargs="+", default=[256, 1024, 4096])
+    args = parser.parse_args()
+    print(
+        f"{'voices':>6} {'ugens':>6} {'deepcopy (s)':>12} {'peak (KiB)':>10} "
+        f"{'copy (s)':>9} {'peak (KiB)':>10} {'build (s)':>10} {'peak (KiB)':>10}"
+    )
+    for voices in args.voices:
+        builder = build_additive_bank(voices)
+        ugens = list(builder._parameters.values()) + builder._ugens
+        deepcopy_time, deepcopy_peak = measure(copy.deepcopy, ugens)
+        copy_time, copy_peak = measure(SynthDef._copy_ugens, ugens)
+        build_time, build_peak = measure(builder.build)
+        print(
+            f"{voices:>6} {len(builder._ugens):>6} "
+            f"{deepcopy_time:>12.3f} {deepcopy_peak / 1024:>10.0f} "
+            f"{copy_time:>9.3f} {copy_peak / 1024:>10.0f} "
+            f"{build_time:>10.3f} {build_peak / 1024:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
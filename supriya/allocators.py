@@ -1,10 +1,10 @@
+import bisect
+import heapq
 import threading
-from typing import Set
-
-from uqbar.objects import new
+from typing import Dict, List, Optional, Set, Tuple
 
+from .exceptions import NodeIdsExhausted
 from .intervals.Interval import Interval
-from .intervals.IntervalTree import IntervalTree
 from .system import SupriyaObject
 
 
@@ -36,6 +36,13 @@ class BlockAllocator(SupriyaObject):
     """
     A block allocator.
 
+    Allocation is first-fit: it picks the lowest free block large enough to
+    satisfy the request. Free blocks are grouped into power-of-two size
+    classes, each sorted by start offset, so only the request's own size class
+    is searched and larger classes contribute their lowest block. Free blocks
+    are also indexed by their start and stop offsets, so freed blocks coalesce
+    with their neighbors in constant time.
+
     ::
 
         >>> from supriya.allocators import BlockAllocator
@@ -73,113 +80,190 @@ class BlockAllocator(SupriyaObject):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_free_heap", "_heap_maximum", "_heap_minimum", "_lock", "_used_heap")
+    __slots__ = (
+        "_free_starts",
+        "_free_starts_by_class",
+        "_free_stops_by_start",
+        "_free_starts_by_stop",
+        "_heap_maximum",
+        "_heap_minimum",
+        "_lock",
+        "_used_starts",
+        "_used_stops_by_start",
+    )
+
+    _size_class_count = 64
 
     ### INITIALIZER ###
 
     def __init__(self, heap_maximum=None, heap_minimum=0):
-        self._free_heap = IntervalTree(accelerated=True)
         self._heap_maximum = heap_maximum
         self._heap_minimum = heap_minimum
         self._lock = threading.Lock()
-        self._used_heap = IntervalTree(accelerated=True)
-        free_block = Block(
-            start_offset=heap_minimum, stop_offset=heap_maximum, used=False
+        # Free blocks, as sorted starts overall and per size class, plus
+        # start -> stop and stop -> start maps for coalescing.
+        self._free_starts: List[int] = []
+        self._free_starts_by_class: List[List[int]] = [
+            [] for _ in range(self._size_class_count)
+        ]
+        self._free_stops_by_start: Dict[int, float] = {}
+        self._free_starts_by_stop: Dict[float, int] = {}
+        # Used blocks, as sorted starts plus a start -> stop map.
+        self._used_starts: List[int] = []
+        self._used_stops_by_start: Dict[int, int] = {}
+        self._add_free_block(
+            heap_minimum, float("inf") if heap_maximum is None else heap_maximum
         )
-        self._free_heap.add(free_block)
+
+    ### PRIVATE METHODS ###
+
+    def _add_free_block(self, start_offset, stop_offset):
+        bisect.insort(
+            self._free_starts_by_class[
+                self._get_size_class(stop_offset - start_offset)
+            ],
+            start_offset,
+        )
+        bisect.insort(self._free_starts, start_offset)
+        self._free_stops_by_start[start_offset] = stop_offset
+        self._free_starts_by_stop[stop_offset] = start_offset
+
+    def _add_used_block(self, start_offset, stop_offset):
+        bisect.insort(self._used_starts, start_offset)
+        self._used_stops_by_start[start_offset] = stop_offset
+
+    def _allocate(self, desired_block_size):
+        # Every block in a larger size class fits, so only the lowest of each
+        # matters. Blocks in the request's own class may be too small.
+        size_class = self._get_size_class(desired_block_size)
+        start_offset = None
+        for free_starts in self._free_starts_by_class[size_class + 1 :]:
+            if free_starts and (start_offset is None or free_starts[0] < start_offset):
+                start_offset = free_starts[0]
+        for free_start in self._free_starts_by_class[size_class]:
+            if start_offset is not None and start_offset < free_start:
+                break
+            if desired_block_size <= self._free_stops_by_start[free_start] - free_start:
+                start_offset = free_start
+                break
+        if start_offset is None:
+            return None
+        stop_offset = self._free_stops_by_start[start_offset]
+        self._remove_free_block(start_offset, stop_offset)
+        split_offset = start_offset + desired_block_size
+        if split_offset < stop_offset:
+            self._add_free_block(split_offset, stop_offset)
+        self._add_used_block(start_offset, split_offset)
+        return int(start_offset)
+
+    def _free(self, block_id):
+        # Freeing any index within a used block frees the whole block.
+        position = bisect.bisect_right(self._used_starts, block_id) - 1
+        if position < 0:
+            return
+        start_offset = self._used_starts[position]
+        stop_offset = self._used_stops_by_start[start_offset]
+        if stop_offset <= block_id:
+            return
+        del self._used_starts[position]
+        del self._used_stops_by_start[start_offset]
+        previous_start_offset = self._free_starts_by_stop.get(start_offset)
+        if previous_start_offset is not None:
+            self._remove_free_block(previous_start_offset, start_offset)
+            start_offset = previous_start_offset
+        next_stop_offset = self._free_stops_by_start.get(stop_offset)
+        if next_stop_offset is not None:
+            self._remove_free_block(stop_offset, next_stop_offset)
+            stop_offset = next_stop_offset
+        self._add_free_block(start_offset, stop_offset)
+
+    def _get_size_class(self, size):
+        if size == float("inf"):
+            return self._size_class_count - 1
+        return min(int(size).bit_length() - 1, self._size_class_count - 1)
+
+    def _remove_free_block(self, start_offset, stop_offset):
+        free_starts = self._free_starts_by_class[
+            self._get_size_class(stop_offset - start_offset)
+        ]
+        del free_starts[bisect.bisect_left(free_starts, start_offset)]
+        del self._free_starts[bisect.bisect_left(self._free_starts, start_offset)]
+        del self._free_stops_by_start[start_offset]
+        del self._free_starts_by_stop[stop_offset]
 
     ### PUBLIC METHODS ###
 
     def allocate(self, desired_block_size=1):
         desired_block_size = int(desired_block_size)
         assert 0 < desired_block_size
-        block_id = None
         with self._lock:
-            free_block = None
-            for block in self._free_heap:
-                if desired_block_size <= block.duration:
-                    free_block = block
-                    break
-            if free_block is not None:
-                split_offset = free_block.start_offset + desired_block_size
-                self._free_heap.remove(free_block)
-                if desired_block_size < free_block.duration:
-                    new_free_block = new(
-                        free_block, start_offset=split_offset, used=False
-                    )
-                    self._free_heap.add(new_free_block)
-                    used_block = new(free_block, stop_offset=split_offset, used=True)
-                else:
-                    used_block = new(free_block, used=True)
-                self._used_heap.add(used_block)
-                block_id = used_block.start_offset
-        if block_id is None:
-            return block_id
-        return int(block_id)
+            return self._allocate(desired_block_size)
 
     def allocate_at(self, index=None, desired_block_size=1):
         index = int(index)
         desired_block_size = int(desired_block_size)
-        block_id = None
+        start_offset = index
+        stop_offset = index + desired_block_size
+        with self._lock:
+            position = bisect.bisect_right(self._free_starts, start_offset) - 1
+            if position < 0:
+                return None
+            free_start_offset = self._free_starts[position]
+            free_stop_offset = self._free_stops_by_start[free_start_offset]
+            if free_stop_offset < stop_offset:
+                return None
+            self._remove_free_block(free_start_offset, free_stop_offset)
+            if free_start_offset < start_offset:
+                self._add_free_block(free_start_offset, start_offset)
+            if stop_offset < free_stop_offset:
+                self._add_free_block(stop_offset, free_stop_offset)
+            self._add_used_block(start_offset, stop_offset)
+        return index
+
+    def allocate_many(self, count, desired_block_size=1) -> Optional[List[int]]:
+        """
+        Allocate ``count`` blocks of ``desired_block_size`` under a single lock.
+
+        Returns none, allocating nothing, if not every block fits.
+
+        ::
+
+            >>> allocator = BlockAllocator(heap_maximum=16)
+            >>> allocator.allocate_many(3, 4)
+            [0, 4, 8]
+
+        ::
+
+            >>> allocator.allocate_many(2, 4) is None
+            True
+
+        """
+        desired_block_size = int(desired_block_size)
+        assert 0 < desired_block_size
+        block_ids: List[int] = []
         with self._lock:
-            start_offset = index
-            stop_offset = index + desired_block_size
-            start_cursor = self._free_heap.get_moment_at(start_offset)
-            starting_blocks = sorted(
-                start_cursor.start_intervals + start_cursor.overlap_intervals
-            )
-            stop_cursor = self._free_heap.get_moment_at(stop_offset)
-            stop_blocks = sorted(
-                stop_cursor.overlap_intervals + stop_cursor.stop_intervals
-            )
-            if starting_blocks == stop_blocks:
-                if len(starting_blocks) == 0:
+            for _ in range(int(count)):
+                block_id = self._allocate(desired_block_size)
+                if block_id is None:
+                    for block_id in block_ids:
+                        self._free(block_id)
                     return None
-                assert len(starting_blocks) == 1
-                free_block = starting_blocks[0]
-                used_block = Block(
-                    start_offset=start_offset, stop_offset=stop_offset, used=True
-                )
-                self._used_heap.add(used_block)
-                self._free_heap.remove(free_block)
-                free_blocks = free_block - used_block
-                for free_block in free_blocks:
-                    self._free_heap.add(free_block)
-                block_id = index
-        if block_id is None:
-            return block_id
-        return int(block_id)
+                block_ids.append(block_id)
+        return block_ids
 
     def free(self, block_id):
         block_id = int(block_id)
         with self._lock:
-            cursor = self._used_heap.get_moment_at(block_id)
-            blocks = sorted(
-                set(cursor.start_intervals) or set(cursor.overlap_intervals)
-            )
-            if len(blocks) == 0:
-                return None
-            assert len(blocks) == 1
-            used_block = blocks[0]
-            self._used_heap.remove(used_block)
-            start_offset = used_block.start_offset
-            stopping_blocks = self._free_heap.find_intervals_stopping_at(start_offset)
-            if stopping_blocks:
-                assert len(stopping_blocks) == 1
-                stopping_block = stopping_blocks[0]
-                self._free_heap.remove(stopping_block)
-                start_offset = stopping_block.start_offset
-            stop_offset = used_block.stop_offset
-            starting_blocks = self._free_heap.find_intervals_starting_at(stop_offset)
-            if starting_blocks:
-                assert len(starting_blocks) == 1
-                starting_block = starting_blocks[0]
-                self._free_heap.remove(starting_block)
-                stop_offset = starting_block.stop_offset
-            free_block = Block(
-                start_offset=start_offset, stop_offset=stop_offset, used=False
-            )
-            self._free_heap.add(free_block)
+            self._free(block_id)
+
+    def free_many(self, block_ids) -> None:
+        """
+        Free each of ``block_ids`` under a single lock.
+        """
+        block_ids = [int(block_id) for block_id in block_ids]
+        with self._lock:
+            for block_id in block_ids:
+                self._free(block_id)
 
     ### PUBLIC PROPERTIES ###
 
@@ -231,26 +315,104 @@ class NodeIdAllocator(SupriyaObject):
         >>> allocator.allocate_permanent_node_id()
         2
 
+    Permanent node IDs are drawn from below ``initial_node_id``, lowest freed
+    ID first. ``exhaustion_policy`` decides what happens once they run out:
+    ``"error"`` raises :py:class:`~supriya.exceptions.NodeIdsExhausted`,
+    ``"wrap"`` starts over from ``1`` regardless of which IDs are still in use,
+    and ``"expand"`` reserves another ``initial_node_id - 1`` IDs from the
+    temporary node ID sequence.
+
+    ::
+
+        >>> allocator = NodeIdAllocator(initial_node_id=3, exhaustion_policy="expand")
+        >>> [allocator.allocate_permanent_node_id() for _ in range(4)]
+        [1, 2, 3, 4]
+
+    ::
+
+        >>> allocator.allocate_node_id()
+        5
+
+    ::
+
+        >>> allocator.permanent_exhaustion_count
+        1
+
     """
 
+    ### CLASS VARIABLES ###
+
+    _exhaustion_policies = ("error", "expand", "wrap")
+
     ### INITIALIZER ###
 
-    def __init__(self, client_id: int = 0, initial_node_id: int = 1000):
+    def __init__(
+        self,
+        client_id: int = 0,
+        initial_node_id: int = 1000,
+        exhaustion_policy: str = "error",
+    ):
         if client_id > 31:
             raise ValueError
+        if exhaustion_policy not in self._exhaustion_policies:
+            raise ValueError(exhaustion_policy)
         self._initial_node_id = initial_node_id
         self._client_id = client_id
+        self._exhaustion_policy = exhaustion_policy
         self._mask = self._client_id << 26
         self._temp = self._initial_node_id
         self._next_permanent_id = 1
-        self._freed_permanent_ids: Set[int] = set()
+        # Freed permanent IDs, as a min-heap plus a set for membership tests
+        self._freed_permanent_ids: List[int] = []
+        self._freed_permanent_id_set: Set[int] = set()
+        # Half-open ranges of IDs reserved for permanent nodes
+        self._permanent_id_ranges: List[Tuple[int, int]] = [(1, initial_node_id)]
+        self._permanent_exhaustion_count = 0
+        self._permanent_ids_in_use = 0
         self._lock = threading.Lock()
 
+    ### PRIVATE METHODS ###
+
+    def _handle_permanent_exhaustion(self) -> None:
+        self._permanent_exhaustion_count += 1
+        if self._exhaustion_policy == "error":
+            raise NodeIdsExhausted
+        elif self._exhaustion_policy == "wrap":
+            self._next_permanent_id = self._permanent_id_ranges[0][0]
+            return
+        # Take the next chunk of the temporary ID sequence
+        size = self._initial_node_id - 1
+        start = self._temp
+        if 0x03FFFFFF < start + size:
+            start = self._initial_node_id
+        start = self._skip_permanent_node_ids(start, size)
+        self._temp = start + size
+        self._permanent_id_ranges.append((start, start + size))
+        self._next_permanent_id = start
+
+    def _is_permanent_node_id(self, node_id: int) -> bool:
+        return any(start <= node_id < stop for start, stop in self._permanent_id_ranges)
+
+    def _skip_permanent_node_ids(self, node_id: int, count: int = 1) -> int:
+        # Temporary IDs wrap around into ranges the "expand" policy reserved,
+        # so step ``count`` consecutive IDs past any they would overlap.
+        if len(self._permanent_id_ranges) == 1:
+            return node_id
+        while True:
+            if 0x03FFFFFF < node_id + count - 1:
+                node_id = self._initial_node_id
+            for start, stop in self._permanent_id_ranges[1:]:
+                if start < node_id + count and node_id < stop:
+                    node_id = stop
+                    break
+            else:
+                return node_id
+
     ### PUBLIC METHODS ###
 
     def allocate_node_id(self, count: int = 1) -> int:
         with self._lock:
-            x = self._temp
+            x = self._skip_permanent_node_ids(self._temp, count)
             temp = x + count
             if 0x03FFFFFF < temp:
                 temp = (temp % 0x03FFFFFF) + self._initial_node_id
@@ -258,19 +420,80 @@ class NodeIdAllocator(SupriyaObject):
             x = x | self._mask
         return x
 
+    def allocate_many(self, count: int) -> List[int]:
+        """
+        Allocate ``count`` node IDs under a single lock.
+
+        ::
+
+            >>> allocator = NodeIdAllocator()
+            >>> allocator.allocate_many(3)
+            [1000, 1001, 1002]
+
+        """
+        node_ids = []
+        with self._lock:
+            x = self._temp
+            for _ in range(count):
+                x = self._skip_permanent_node_ids(x)
+                node_ids.append(x | self._mask)
+                x += 1
+                if 0x03FFFFFF < x:
+                    x = (x % 0x03FFFFFF) + self._initial_node_id
+            self._temp = x
+        return node_ids
+
     def allocate_permanent_node_id(self) -> int:
         with self._lock:
             if self._freed_permanent_ids:
-                x = min(self._freed_permanent_ids)
-                self._freed_permanent_ids.remove(x)
+                x = heapq.heappop(self._freed_permanent_ids)
+                self._freed_permanent_id_set.remove(x)
             else:
+                if self._next_permanent_id == self._permanent_id_ranges[-1][1]:
+                    self._handle_permanent_exhaustion()
                 x = self._next_permanent_id
-                self._next_permanent_id = min(x + 1, self._initial_node_id - 1)
+                self._next_permanent_id += 1
+            self._permanent_ids_in_use += 1
             x = x | self._mask
         return x
 
     def free_permanent_node_id(self, node_id: int) -> None:
         with self._lock:
             node_id = node_id & 0x03FFFFFF
-            if node_id < self._initial_node_id:
-                self._freed_permanent_ids.add(node_id)
+            if node_id in self._freed_permanent_id_set:
+                return
+            if self._is_permanent_node_id(node_id):
+                heapq.heappush(self._freed_permanent_ids, node_id)
+                self._freed_permanent_id_set.add(node_id)
+                self._permanent_ids_in_use = max(self._permanent_ids_in_use - 1, 0)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def client_id(self) -> int:
+        return self._client_id
+
+    @property
+    def exhaustion_policy(self) -> str:
+        """
+        What to do when permanent node IDs run out.
+        """
+        return self._exhaustion_policy
+
+    @property
+    def initial_node_id(self) -> int:
+        return self._initial_node_id
+
+    @property
+    def permanent_exhaustion_count(self) -> int:
+        """
+        How many times permanent node IDs have run out.
+        """
+        return self._permanent_exhaustion_count
+
+    @property
+    def permanent_ids_in_use(self) -> int:
+        """
+        How many permanent node IDs are allocated and not yet freed.
+        """
+        return self._permanent_ids_in_use
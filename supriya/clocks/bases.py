@@ -61,8 +61,6 @@ class BaseClock:
         self._is_running = False
         self._slop = 0.001
         self._events_by_id = {}
-        self._measure_relative_event_ids = set()
-        self._offset_relative_event_ids = set()
         self._state = ClockState(
             beats_per_minute=120.0,
             initial_seconds=0.0,
@@ -193,10 +191,6 @@ class BaseClock:
             event, (CallbackCommand, ChangeCommand)
         ):
             self._event_queue.remove(event)
-            if event.offset is not None:
-                self._offset_relative_event_ids.remove(event.event_id)
-                if event.measure is not None:
-                    self._measure_relative_event_ids.remove(event.event_id)
         return event
 
     def _enqueue_command(self, command):
@@ -214,14 +208,8 @@ class BaseClock:
     def _enqueue_event(self, event):
         self._events_by_id[event.event_id] = event
         self._event_queue.put(event)
-        if event.offset is not None:
-            self._offset_relative_event_ids.add(event.event_id)
-            if event.measure is not None:
-                self._measure_relative_event_ids.add(event.event_id)
 
     def _process_perform_event_loop(self, current_moment):
-        # There may be items in the queue which have been flagged "removed".
-        # They contribute to the queue's size, but cannot be retrieved by .get().
         try:
             event = self._event_queue.get()
         except queue.Empty:
@@ -415,33 +403,31 @@ class BaseClock:
             )
 
     def _reschedule_offset_relative_events(self):
-        for event_id in tuple(self._offset_relative_event_ids):
-            event = self._cancel(event_id)
-            if event is None:
-                self._offset_relative_event_ids.remove(event_id)
-                continue
-            seconds = self._offset_to_seconds(event.offset)
-            logger.debug(
-                f"[{self.name}] ... ... ... Rescheduling offset-relative event "
-                f"({event.event_id}) from "
-                f"{event.seconds - self._state.initial_seconds}:s to "
-                f"{seconds - self._state.initial_seconds}:s"
-            )
-            self._enqueue_event(event._replace(seconds=seconds))
+        # Re-key every beat-relative event in one pass over the queue
+        def procedure(event):
+            if event.offset is None:
+                return event
+            event = event._replace(seconds=self._offset_to_seconds(event.offset))
+            self._events_by_id[event.event_id] = event
+            return event
+
+        logger.debug(f"[{self.name}] ... ... ... Rescheduling offset-relative events")
+        self._event_queue.rekey(procedure)
 
     def _reschedule_measure_relative_events(self):
-        for event_id in tuple(self._measure_relative_event_ids):
-            event = self._cancel(event_id)
-            if event is None:
-                self._measure_relative_event_ids.remove(event_id)
-                continue
+        # Re-key every measure-relative event in one pass over the queue
+        def procedure(event):
+            if event.measure is None:
+                return event
             offset = self._measure_to_offset(event.measure)
-            seconds = self._offset_to_seconds(offset)
-            logger.debug(
-                f"[{self.name}] ... ... ... Rescheduling measure-relative event from "
-                f"offset {event.offset} to {offset}"
+            event = event._replace(
+                offset=offset, seconds=self._offset_to_seconds(offset)
             )
-            self._enqueue_event(event._replace(offset=offset, seconds=seconds))
+            self._events_by_id[event.event_id] = event
+            return event
+
+        logger.debug(f"[{self.name}] ... ... ... Rescheduling measure-relative events")
+        self._event_queue.rekey(procedure)
 
     def _start(
         self,
@@ -1,28 +1,78 @@
+import heapq
 import queue
 
 
 class EventQueue(queue.PriorityQueue):
+    """
+    An indexed priority queue.
+
+    Items live in a binary min-heap alongside a map of each item's position in
+    the heap, so items can be removed or re-keyed in place in O(log n) time
+    without leaving inactive entries behind.
+    """
 
     ### PRIVATE METHODS ###
 
     def _init(self, maxsize):
         self.queue = []
-        self.items = {}
+        self.positions = {}
+
+    def _pop_at(self, position):
+        item = self.queue[position]
+        del self.positions[item]
+        last = self.queue.pop()
+        if position < len(self.queue):
+            self.queue[position] = last
+            self.positions[last] = position
+            self._sift(position)
+        return item
 
     def _put(self, item):
-        entry = [item, True]
-        if item in self.items:
-            self.items[item][-1] = False
-        self.items[item] = entry
-        super()._put(entry)
+        position = self.positions.get(item)
+        if position is not None:
+            self.queue[position] = item
+        else:
+            position = len(self.queue)
+            self.queue.append(item)
+        self.positions[item] = position
+        self._sift(position)
 
     def _get(self):
-        while self.queue:
-            item, active = super()._get()
-            if active:
-                del self.items[item]
-                return item
-        raise queue.Empty
+        if not self.queue:
+            raise queue.Empty
+        return self._pop_at(0)
+
+    def _qsize(self):
+        return len(self.queue)
+
+    def _sift(self, position):
+        heap, positions = self.queue, self.positions
+        item = heap[position]
+        # Towards the root ...
+        while position:
+            parent_position = (position - 1) >> 1
+            parent = heap[parent_position]
+            if not item < parent:
+                break
+            heap[position] = parent
+            positions[parent] = position
+            position = parent_position
+        # ... or towards the leaves.
+        length = len(heap)
+        child_position = 2 * position + 1
+        while child_position < length:
+            right_position = child_position + 1
+            if right_position < length and heap[right_position] < heap[child_position]:
+                child_position = right_position
+            child = heap[child_position]
+            if not child < item:
+                break
+            heap[position] = child
+            positions[child] = position
+            position = child_position
+            child_position = 2 * position + 1
+        heap[position] = item
+        positions[item] = position
 
     ### PUBLIC METHODS ###
 
@@ -32,14 +82,34 @@ class EventQueue(queue.PriorityQueue):
 
     def peek(self):
         with self.mutex:
-            item = self._get()
-            entry = [item, True]
-            self.items[item] = entry
-            super()._put(entry)
-        return item
+            if not self.queue:
+                raise queue.Empty
+            return self.queue[0]
+
+    def rekey(self, procedure):
+        """
+        Replace every item with ``procedure(item)`` and restore heap order in
+        a single O(n) pass.
+        """
+        with self.mutex:
+            self.queue[:] = [procedure(item) for item in self.queue]
+            heapq.heapify(self.queue)
+            self.positions = {item: i for i, item in enumerate(self.queue)}
 
     def remove(self, item):
         with self.mutex:
-            entry = self.items.pop(item, None)
-            if entry is not None:
-                entry[-1] = False
+            position = self.positions.get(item)
+            if position is not None:
+                self._pop_at(position)
+
+    def reschedule(self, item, new_item):
+        """
+        Replace ``item`` with ``new_item`` in O(log n) time.
+        """
+        with self.mutex:
+            position = self.positions.pop(item, None)
+            if position is None:
+                raise KeyError(item)
+            self.queue[position] = new_item
+            self.positions[new_item] = position
+            self._sift(position)
@@ -2,6 +2,7 @@ import atexit
 import logging
 import queue
 import threading
+import time
 from typing import Optional, Tuple
 
 from .bases import BaseClock
@@ -21,6 +22,7 @@ class Clock(BaseClock):
     def __init__(self):
         BaseClock.__init__(self)
         self._event = threading.Event()
+        self._is_steady = False
         self._thread = threading.Thread(target=self._run, daemon=True)
         atexit.register(self.stop)
 
@@ -48,10 +50,23 @@ class Clock(BaseClock):
                 previous_seconds=current_moment.seconds,
                 previous_offset=current_moment.offset,
             )
-            if not offline:
-                self._event.wait(timeout=self._slop)
         logger.debug(f"[{self.name}] Terminating")
 
+    def _wait_for_event(self, sleep_time):
+        # Sleep until the deadline, or until a command or cancellation sets
+        # the event. Until the time source is seen keeping pace with real
+        # time, e.g. after the system clock is adjusted or while time is
+        # driven externally, only sleep ``slop`` seconds before re-reading it.
+        if sleep_time is not None and not self._is_steady:
+            sleep_time = min(sleep_time, self._slop)
+        start_time = self.get_current_time()
+        start_monotonic = time.monotonic()
+        if self._event.wait(timeout=sleep_time):
+            return
+        elapsed = time.monotonic() - start_monotonic
+        advanced = self.get_current_time() - start_time
+        self._is_steady = abs(advanced - elapsed) <= elapsed / 2
+
     def _wait_for_moment(self, offline=False) -> Optional[Moment]:
         current_time = self.get_current_time()
         next_time = self._event_queue.peek().seconds
@@ -60,26 +75,33 @@ class Clock(BaseClock):
         )
         while current_time < next_time:
             if not offline:
-                self._event.wait(timeout=self._slop)
+                # Wake up ``slop`` seconds early to absorb timer overshoot, then
+                # wait out the remainder.
+                sleep_time = next_time - current_time
+                if sleep_time > self._slop:
+                    sleep_time -= self._slop
+                self._wait_for_event(sleep_time)
+            # Clear before draining commands so a command enqueued while
+            # draining still wakes the next wait.
+            self._event.clear()
             if not self._is_running:
                 return None
             self._process_command_deque()
             next_time = self._event_queue.peek().seconds
             current_time = self.get_current_time()
-            self._event.clear()
         return self._seconds_to_moment(current_time)
 
     def _wait_for_queue(self, offline=False) -> bool:
         logger.debug(f"[{self.name}] ... Waiting for events")
-        self._process_command_deque()
         self._event.clear()
+        self._process_command_deque()
         while not self._event_queue.qsize():
             if not offline:
-                self._event.wait(timeout=self._slop)
+                self._wait_for_event(None)
+            self._event.clear()
             if not self._is_running:
                 return False
             self._process_command_deque()
-            self._event.clear()
         return True
 
     ### PUBLIC METHODS ###
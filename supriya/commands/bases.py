@@ -1,6 +1,9 @@
 import abc
 import asyncio
+import concurrent.futures
+import functools
 import logging
+import struct
 import threading
 import time
 from collections import deque
@@ -8,12 +11,57 @@ from collections import deque
 from uqbar.objects import new
 
 from supriya.exceptions import ServerOffline
-from supriya.osc.messages import BUNDLE_PREFIX, OscBundle
+from supriya.osc.messages import BUNDLE_PREFIX, OscBundle, OscMessageTemplate
 from supriya.system import SupriyaValueObject
 
 logger = logging.getLogger("supriya.osc")
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_osc_message_template(address, *contents):
+    return OscMessageTemplate(address, *contents)
+
+
+class _ResponseDemultiplexer:
+    """
+    Routes responses for many in-flight requests through one OSC callback per
+    response address.
+
+    Waiters are keyed on their full response (and failure) pattern. Each
+    response resolves the oldest pending waiter with the longest matching
+    pattern.
+    """
+
+    def __init__(self):
+        self.max_pattern_length = 0
+        self.waiters = {}
+
+    def __call__(self, message):
+        items = (message.address,) + message.contents
+        for length in range(min(len(items), self.max_pattern_length), 0, -1):
+            try:
+                waiters = self.waiters.get(items[:length])
+            except TypeError:  # unhashable contents, e.g. arrays
+                continue
+            while waiters:
+                future = waiters.popleft()
+                if not future.done():
+                    future.set_result(Response.from_osc_message(message))
+                    return
+
+    def add(self, future, *patterns):
+        for pattern in patterns:
+            if not pattern:
+                continue
+            pattern = tuple(pattern)
+            self.waiters.setdefault(pattern, deque()).append(future)
+            self.max_pattern_length = max(self.max_pattern_length, len(pattern))
+
+    @property
+    def addresses(self):
+        return sorted({pattern[0] for pattern in self.waiters}, key=str)
+
+
 class Requestable(SupriyaValueObject):
 
     ### INITIALIZER ###
@@ -47,6 +95,42 @@ class Requestable(SupriyaValueObject):
         self._response = Response.from_osc_message(message)
         self._response_future.set_result(True)
 
+    @staticmethod
+    def _gather_pipeline(requestables, futures):
+        responses = []
+        for requestable, future in zip(requestables, futures):
+            if future.done():
+                requestable._response = future.result()
+            else:
+                future.cancel()
+                logger.warning("Timed out: {!r}".format(requestable))
+                requestable._response = None
+            responses.append(requestable._response)
+        return responses
+
+    @staticmethod
+    def _prepare_pipeline(requestables, server, future_factory):
+        demultiplexer = _ResponseDemultiplexer()
+        futures, outgoing = [], []
+        for requestable in requestables:
+            (
+                success_pattern,
+                failure_pattern,
+                requestable_,
+            ) = requestable._get_response_patterns_and_requestable(server)
+            future = future_factory()
+            if success_pattern is None:
+                future.set_result(None)
+            else:
+                demultiplexer.add(future, success_pattern, failure_pattern)
+            futures.append(future)
+            outgoing.append(requestable_)
+        callbacks = [
+            server.osc_protocol.register(pattern=address, procedure=demultiplexer)
+            for address in demultiplexer.addresses
+        ]
+        return futures, outgoing, callbacks
+
     ### PUBLIC METHODS ###
 
     def communicate(self, server, sync=True, timeout=1.0, apply_local=True):
@@ -81,7 +165,7 @@ class Requestable(SupriyaValueObject):
             except Exception:
                 print(self)
                 raise
-            server.send(requestable.to_osc())
+            server.send(requestable)
             while self.response is None:
                 self.condition.wait(timeout)
                 current_time = time.time()
@@ -110,10 +194,66 @@ class Requestable(SupriyaValueObject):
             procedure=self._set_response_async,
             once=True,
         )
-        server.send(requestable.to_osc())
+        server.send(requestable)
         await asyncio.wait_for(self._response_future, timeout=timeout)
         return self._response
 
+    @staticmethod
+    def communicate_many(requestables, server, timeout=1.0, apply_local=True):
+        """
+        Send ``requestables`` back-to-back and wait for all their responses.
+
+        Responses are matched by a single demultiplexer rather than one
+        callback per request, so N queries cost roughly one round trip instead
+        of N. Returns responses in request order, with ``None`` for requests
+        without a response or which timed out.
+        """
+        from ..realtime.servers import BaseServer
+
+        if not isinstance(server, BaseServer):
+            raise ValueError(server)
+        if not server.is_running:
+            raise ServerOffline
+        requestables = list(requestables)
+        if apply_local:
+            with server._lock:
+                for requestable in requestables:
+                    for request in requestable._linearize():
+                        request._apply_local(server)
+        futures, outgoing, callbacks = Requestable._prepare_pipeline(
+            requestables, server, concurrent.futures.Future
+        )
+        try:
+            for requestable in outgoing:
+                server.send(requestable)
+            concurrent.futures.wait(futures, timeout=timeout)
+        finally:
+            for callback in callbacks:
+                server.osc_protocol.unregister(callback)
+        return Requestable._gather_pipeline(requestables, futures)
+
+    @staticmethod
+    async def communicate_many_async(requestables, server, timeout=1.0):
+        """
+        Send ``requestables`` back-to-back and await all their responses.
+
+        See :py:meth:`communicate_many`.
+        """
+        requestables = list(requestables)
+        loop = asyncio.get_running_loop()
+        futures, outgoing, callbacks = Requestable._prepare_pipeline(
+            requestables, server, loop.create_future
+        )
+        try:
+            for requestable in outgoing:
+                server.send(requestable)
+            if futures:
+                await asyncio.wait(futures, timeout=timeout)
+        finally:
+            for callback in callbacks:
+                server.osc_protocol.unregister(callback)
+        return Requestable._gather_pipeline(requestables, futures)
+
     def to_datagram(self, *, with_placeholders=False):
         return self.to_osc(with_placeholders=with_placeholders).to_datagram()
 
@@ -144,8 +284,7 @@ class Request(Requestable):
 
     def _handle_async(self, sync, server):
         if not sync or self.response_patterns[0] is None:
-            message = self.to_osc()
-            server.send(message)
+            server.send(self)
             return True
 
     def _linearize(self):
@@ -244,8 +383,7 @@ class RequestBundle(Requestable):
 
     def _handle_async(self, sync, server):
         if not sync:
-            message = self.to_osc()
-            server.send(message)
+            server.send(self)
             return True
 
     def _linearize(self):
@@ -254,6 +392,16 @@ class RequestBundle(Requestable):
 
     ### PUBLIC METHODS ###
 
+    def to_datagram(self, *, with_placeholders=False):
+        # Contents render their own datagrams, so templated requests skip
+        # building intermediate messages.
+        datagram = BUNDLE_PREFIX + OscBundle._encode_date(self.timestamp)
+        for x in self.contents:
+            content_datagram = x.to_datagram(with_placeholders=with_placeholders)
+            datagram += struct.pack(">i", len(content_datagram))
+            datagram += content_datagram
+        return datagram
+
     def to_osc(self, *, with_placeholders=False):
         contents = []
         for x in self.contents:
@@ -4,7 +4,7 @@ from typing import NamedTuple, Tuple, Union
 import supriya.osc
 from supriya.enums import NodeAction, RequestId
 
-from .bases import Request, Response
+from .bases import Request, Response, _get_osc_message_template
 
 
 class NodeFreeRequest(Request):
@@ -530,6 +530,19 @@ class NodeSetRequest(Request):
 
     ### PUBLIC METHODS ###
 
+    def to_datagram(self, *, with_placeholders=False):
+        # Numeric-only requests render through a template cached per shape.
+        contents = [int]
+        values = [int(self.node_id)]
+        for key, value in sorted(self._kwargs.items()):
+            value_type = type(value)
+            if value_type is not float and value_type is not int:
+                return super().to_datagram(with_placeholders=with_placeholders)
+            contents.extend((key, value_type))
+            values.append(value)
+        template = _get_osc_message_template(self.request_name, *contents)
+        return template.to_datagram(*values)
+
     def to_osc(self, *, with_placeholders=False):
         request_id = self.request_name
         node_id = int(self.node_id)
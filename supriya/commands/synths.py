@@ -2,7 +2,7 @@ from supriya import AddAction
 from supriya.enums import RequestId
 
 from ..osc import OscMessage
-from .bases import Request, Response
+from .bases import Request, Response, _get_osc_message_template
 
 
 class SynthNewRequest(Request):
@@ -84,6 +84,28 @@ class SynthNewRequest(Request):
 
     ### PUBLIC METHODS ###
 
+    def to_datagram(self, *, with_placeholders=False):
+        from ..synthdefs import SynthDef
+
+        synthdef = self.synthdef
+        if isinstance(synthdef, SynthDef):
+            synthdef = synthdef.actual_name
+        # Numeric-only requests render through a template cached per shape.
+        contents = [synthdef, int, int, int]
+        values = [
+            self._sanitize_node_id(self.node_id, with_placeholders),
+            int(self.add_action),
+            self._sanitize_node_id(self.target_node_id, with_placeholders),
+        ]
+        for key, value in self._kwargs:
+            value_type = type(value)
+            if value_type is not float and value_type is not int:
+                return super().to_datagram(with_placeholders=with_placeholders)
+            contents.extend((key, value_type))
+            values.append(value)
+        template = _get_osc_message_template(self.request_name, *contents)
+        return template.to_datagram(*values)
+
     def to_osc(self, *, with_placeholders=False):
         from ..synthdefs import SynthDef
 
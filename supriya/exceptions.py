@@ -35,6 +35,10 @@ class NodeAlreadyAllocated(AlreadyAllocated):
     pass
 
 
+class NodeIdsExhausted(Exception):
+    pass
+
+
 class NodeNotAllocated(NotAllocated):
     pass
 
@@ -0,0 +1,333 @@
+import bisect
+from array import array
+
+from uqbar.objects import get_repr
+
+from supriya.system import SupriyaObject
+
+from .Moment import Moment
+
+
+class IntervalIndex(SupriyaObject):
+    """
+    An immutable, array-backed index of intervals.
+
+    Intervals are bulk-loaded into arrays sorted by start and stop offset,
+    laid out as an implicit binary tree over the start-sorted array and
+    augmented with each subtree's maximum stop offset. Queries are binary
+    searches or a pruned walk of that tree, and no per-interval objects are
+    allocated.
+
+    ::
+
+        >>> from supriya.intervals import Interval, IntervalIndex
+        >>> intervals = (
+        ...     Interval(0, 3),
+        ...     Interval(1, 3),
+        ...     Interval(1, 2),
+        ...     Interval(2, 5),
+        ...     Interval(6, 9),
+        ... )
+        >>> interval_index = IntervalIndex(intervals)
+
+    ::
+
+        >>> for interval in interval_index.find_intersection(1.5):
+        ...     interval
+        ...
+        Interval(start_offset=0.0, stop_offset=3.0)
+        Interval(start_offset=1.0, stop_offset=2.0)
+        Interval(start_offset=1.0, stop_offset=3.0)
+
+    ::
+
+        >>> for intervals in interval_index.find_intersections([0, 2.5, 5.5]):
+        ...     len(intervals)
+        ...
+        1
+        3
+        0
+
+    ::
+
+        >>> interval_index.get_moment_at(1)
+        <Moment(1 <<3>>)>
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_intervals",
+        "_max_stop_offsets",
+        "_root_level",
+        "_sorted_stop_offsets",
+        "_start_offsets",
+        "_stop_offsets",
+        "_stop_order",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, intervals=None):
+        self._intervals = sorted(
+            (interval for interval in intervals or () if self._is_interval(interval)),
+            key=lambda x: (float(x.start_offset), float(x.stop_offset)),
+        )
+        self._start_offsets = array("d", (x.start_offset for x in self._intervals))
+        self._stop_offsets = array("d", (x.stop_offset for x in self._intervals))
+        self._max_stop_offsets, self._root_level = self._build_max_stop_offsets(
+            self._stop_offsets
+        )
+        # Stable, so intervals sharing a stop offset stay in start order
+        self._stop_order = array(
+            "q", sorted(range(len(self._intervals)), key=self._stop_offsets.__getitem__)
+        )
+        self._sorted_stop_offsets = array(
+            "d", (self._stop_offsets[i] for i in self._stop_order)
+        )
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, interval):
+        if not self._is_interval(interval):
+            raise ValueError(interval)
+        return interval in self.find_intervals_starting_at(interval.start_offset)
+
+    def __getitem__(self, item):
+        return self._intervals[item]
+
+    def __getstate__(self):
+        return tuple(self._intervals)
+
+    def __iter__(self):
+        return iter(self._intervals)
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def __repr__(self):
+        return get_repr(self, multiline=bool(len(self)))
+
+    def __setstate__(self, state):
+        self.__init__(intervals=state)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _build_max_stop_offsets(stop_offsets):
+        # Each odd index i at level k is the root of the subtree spanning
+        # [i - 2**k + 1, i + 2**k - 1]; even indices are leaves.
+        count = len(stop_offsets)
+        max_stop_offsets = array("d", stop_offsets)
+        if not count:
+            return max_stop_offsets, -1
+        last_index = count - 1 - (count - 1) % 2
+        last_max = max_stop_offsets[last_index]
+        level = 1
+        while (1 << level) <= count:
+            half = 1 << (level - 1)
+            for i in range((half << 1) - 1, count, half << 2):
+                right_max = max_stop_offsets[i + half] if i + half < count else last_max
+                max_stop_offsets[i] = max(
+                    stop_offsets[i], max_stop_offsets[i - half], right_max
+                )
+            if (last_index >> level) & 1:
+                last_index -= half
+            else:
+                last_index += half
+            if last_index < count and last_max < max_stop_offsets[last_index]:
+                last_max = max_stop_offsets[last_index]
+            level += 1
+        return max_stop_offsets, level - 1
+
+    @staticmethod
+    def _is_interval(expr):
+        if hasattr(expr, "start_offset") and hasattr(expr, "stop_offset"):
+            return True
+        return False
+
+    def _stab(self, offset):
+        # Indices of intervals where start_offset <= offset < stop_offset, in
+        # sorted order.
+        start_offsets = self._start_offsets
+        stop_offsets = self._stop_offsets
+        max_stop_offsets = self._max_stop_offsets
+        count = len(start_offsets)
+        indices = []
+        if not count:
+            return indices
+        stack = [(self._root_level, (1 << self._root_level) - 1, False)]
+        while stack:
+            level, i, left_visited = stack.pop()
+            if level <= 3:
+                # Small subtrees are cheaper to scan linearly
+                start = i >> level << level
+                stop = min(start + (1 << (level + 1)) - 1, count)
+                for j in range(start, stop):
+                    if offset < start_offsets[j]:
+                        break
+                    if offset < stop_offsets[j]:
+                        indices.append(j)
+            elif not left_visited:
+                stack.append((level, i, True))
+                left = i - (1 << (level - 1))
+                if count <= left or offset < max_stop_offsets[left]:
+                    stack.append((level - 1, left, False))
+            elif i < count and start_offsets[i] <= offset:
+                if offset < stop_offsets[i]:
+                    indices.append(i)
+                stack.append((level - 1, i + (1 << (level - 1)), False))
+        return indices
+
+    ### PUBLIC METHODS ###
+
+    def find_intersection(self, interval_or_offset):
+        """
+        Find intervals intersecting an interval or offset.
+
+        ::
+
+            >>> from supriya.intervals import Interval, IntervalIndex
+            >>> interval_index = IntervalIndex(
+            ...     [Interval(0, 3), Interval(1, 3), Interval(2, 5), Interval(6, 9)]
+            ... )
+            >>> for interval in interval_index.find_intersection(Interval(2, 4)):
+            ...     interval
+            ...
+            Interval(start_offset=0.0, stop_offset=3.0)
+            Interval(start_offset=1.0, stop_offset=3.0)
+            Interval(start_offset=2.0, stop_offset=5.0)
+
+        """
+        intervals = self._intervals
+        if not self._is_interval(interval_or_offset):
+            return [intervals[i] for i in self._stab(float(interval_or_offset))]
+        start_offset = float(interval_or_offset.start_offset)
+        stop_offset = float(interval_or_offset.stop_offset)
+        if stop_offset <= start_offset:
+            return [intervals[i] for i in self._stab(start_offset)]
+        # Intervals containing the start offset, then those starting within
+        result = [
+            intervals[i]
+            for i in self._stab(start_offset)
+            if self._start_offsets[i] < start_offset
+        ]
+        result.extend(
+            intervals[
+                bisect.bisect_left(
+                    self._start_offsets, start_offset
+                ) : bisect.bisect_left(self._start_offsets, stop_offset)
+            ]
+        )
+        return result
+
+    def find_intersections(self, offsets):
+        """
+        Find intervals intersecting each of ``offsets``.
+        """
+        intervals = self._intervals
+        stab = self._stab
+        return [[intervals[i] for i in stab(float(offset))] for offset in offsets]
+
+    def find_intervals_starting_at(self, offset):
+        offset = float(offset)
+        return self._intervals[
+            bisect.bisect_left(self._start_offsets, offset) : bisect.bisect_right(
+                self._start_offsets, offset
+            )
+        ]
+
+    def find_intervals_stopping_at(self, offset):
+        offset = float(offset)
+        start = bisect.bisect_left(self._sorted_stop_offsets, offset)
+        stop = bisect.bisect_right(self._sorted_stop_offsets, offset)
+        return [self._intervals[i] for i in self._stop_order[start:stop]]
+
+    def get_moment_at(self, offset):
+        """
+        Gets moment at ``offset``.
+        """
+        start_intervals, overlap_intervals = [], []
+        for i in self._stab(float(offset)):
+            if self._start_offsets[i] == offset:
+                start_intervals.append(self._intervals[i])
+            else:
+                overlap_intervals.append(self._intervals[i])
+        return Moment(
+            interval_tree=self,
+            overlap_intervals=overlap_intervals,
+            start_intervals=start_intervals,
+            start_offset=offset,
+            stop_intervals=self.find_intervals_stopping_at(offset),
+        )
+
+    def get_moments_at(self, offsets):
+        """
+        Gets moments at each of ``offsets``.
+        """
+        return [self.get_moment_at(offset) for offset in offsets]
+
+    def get_offset_after(self, offset):
+        """
+        Gets first start or stop offset after ``offset``, otherwise None.
+        """
+        offset = float(offset)
+        candidates = []
+        for offsets in (self._start_offsets, self._sorted_stop_offsets):
+            i = bisect.bisect_right(offsets, offset)
+            if i < len(offsets):
+                candidates.append(offsets[i])
+        return min(candidates, default=None)
+
+    def get_start_offset_after(self, offset):
+        i = bisect.bisect_right(self._start_offsets, float(offset))
+        if i == len(self._start_offsets):
+            return None
+        return self._start_offsets[i]
+
+    def get_start_offset_before(self, offset):
+        i = bisect.bisect_left(self._start_offsets, float(offset))
+        if not i:
+            return None
+        return self._start_offsets[i - 1]
+
+    def index(self, interval):
+        assert self._is_interval(interval)
+        start_offset = float(interval.start_offset)
+        start = bisect.bisect_left(self._start_offsets, start_offset)
+        stop = bisect.bisect_right(self._start_offsets, start_offset)
+        for i in range(start, stop):
+            if self._intervals[i] == interval:
+                return i
+        raise ValueError("{} not in interval index.".format(interval))
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def earliest_start_offset(self):
+        if self._start_offsets:
+            return self._start_offsets[0]
+        return float("-inf")
+
+    @property
+    def earliest_stop_offset(self):
+        if self._sorted_stop_offsets:
+            return self._sorted_stop_offsets[0]
+        return float("inf")
+
+    @property
+    def intervals(self):
+        return list(self._intervals)
+
+    @property
+    def latest_start_offset(self):
+        if self._start_offsets:
+            return self._start_offsets[-1]
+        return float("-inf")
+
+    @property
+    def latest_stop_offset(self):
+        if self._sorted_stop_offsets:
+            return self._sorted_stop_offsets[-1]
+        return float("inf")
@@ -1,3 +1,6 @@
+import bisect
+import collections
+
 from uqbar.objects import get_repr
 
 from supriya.system import SupriyaObject
@@ -261,12 +264,86 @@ class IntervalTree(SupriyaObject):
 
     ### PRIVATE METHODS ###
 
+    def _get_sweep_events(self):
+        intervals = list(self)
+        start_offsets = [float(x.start_offset) for x in intervals]
+        stop_offsets = [float(x.stop_offset) for x in intervals]
+        # Stable, so intervals sharing a stop offset stay in tree order
+        stop_order = sorted(range(len(intervals)), key=stop_offsets.__getitem__)
+        return intervals, start_offsets, stop_offsets, stop_order
+
     @staticmethod
     def _is_interval(expr):
         if hasattr(expr, "start_offset") and hasattr(expr, "stop_offset"):
             return True
         return False
 
+    def _iterate_moments_forward(self):
+        intervals, start_offsets, stop_offsets, stop_order = self._get_sweep_events()
+        count = len(intervals)
+        # Insertion-ordered, so overlapping intervals stay in tree order
+        active = {}
+        start_index = stop_index = 0
+        while start_index < count:
+            offset = start_offsets[start_index]
+            stop_intervals = []
+            while stop_index < count and stop_offsets[stop_order[stop_index]] <= offset:
+                index = stop_order[stop_index]
+                active.pop(index, None)
+                if stop_offsets[index] == offset:
+                    stop_intervals.append(intervals[index])
+                stop_index += 1
+            overlap_intervals = list(active.values())
+            start_intervals = []
+            while start_index < count and start_offsets[start_index] == offset:
+                if offset < stop_offsets[start_index]:
+                    active[start_index] = intervals[start_index]
+                    start_intervals.append(intervals[start_index])
+                start_index += 1
+            yield Moment(
+                interval_tree=self,
+                overlap_intervals=overlap_intervals,
+                start_intervals=start_intervals,
+                start_offset=offset,
+                stop_intervals=stop_intervals,
+            )
+
+    def _iterate_moments_reversed(self):
+        intervals, start_offsets, stop_offsets, stop_order = self._get_sweep_events()
+        sorted_stop_offsets = [stop_offsets[i] for i in stop_order]
+        # Sweeping backwards, intervals enter at their stop offset and leave at
+        # their start offset
+        active = set()
+        start_index = len(intervals) - 1
+        stop_index = len(intervals) - 1
+        while 0 <= start_index:
+            offset = start_offsets[start_index]
+            start_intervals = []
+            while 0 <= start_index and start_offsets[start_index] == offset:
+                active.discard(start_index)
+                if offset < stop_offsets[start_index]:
+                    start_intervals.append(intervals[start_index])
+                start_index -= 1
+            start_intervals.reverse()
+            while 0 <= stop_index and offset < sorted_stop_offsets[stop_index]:
+                index = stop_order[stop_index]
+                if start_offsets[index] < offset:
+                    active.add(index)
+                stop_index -= 1
+            yield Moment(
+                interval_tree=self,
+                overlap_intervals=[intervals[i] for i in sorted(active)],
+                start_intervals=start_intervals,
+                start_offset=offset,
+                stop_intervals=[
+                    intervals[stop_order[i]]
+                    for i in range(
+                        bisect.bisect_left(sorted_stop_offsets, offset),
+                        bisect.bisect_right(sorted_stop_offsets, offset),
+                    )
+                ],
+            )
+
     ### PUBLIC METHODS ###
 
     def find_intersection(self, interval_or_offset):
@@ -547,25 +624,20 @@ class IntervalTree(SupriyaObject):
             <Moment(1.0 <<3>>)>
             <Moment(0.0 <<1>>)>
 
+        Moments are found with a single sweep over the intervals' sorted start
+        and stop offsets, maintaining the set of overlapping intervals
+        incrementally rather than querying the tree at each offset. The sweep
+        works on a snapshot of the tree taken when iteration begins.
+
         Returns generator.
         """
-
+        if not len(self):
+            yield self.get_moment_at(self.earliest_start_offset)
+            return
         if reverse:
-            start_offset = self.latest_start_offset
-            moment = self.get_moment_at(start_offset)
-            yield moment
-            moment = moment.previous_moment
-            while moment is not None:
-                yield moment
-                moment = moment.previous_moment
+            yield from self._iterate_moments_reversed()
         else:
-            start_offset = self.earliest_start_offset
-            moment = self.get_moment_at(start_offset)
-            yield moment
-            moment = moment.next_moment
-            while moment is not None:
-                yield moment
-                moment = moment.next_moment
+            yield from self._iterate_moments_forward()
 
     def iterate_moments_nwise(self, n=3, reverse=False):
         """
@@ -606,26 +678,14 @@ class IntervalTree(SupriyaObject):
         """
         n = int(n)
         assert 0 < n
-        if reverse:
-            for moment in self.iterate_moments(reverse=True):
-                moments = [moment]
-                while len(moments) < n:
-                    next_moment = moments[-1].next_moment
-                    if next_moment is None:
-                        break
-                    moments.append(next_moment)
-                if len(moments) == n:
-                    yield moments
-        else:
-            for moment in self.iterate_moments():
-                moments = [moment]
-                while len(moments) < n:
-                    previous_moment = moments[-1].previous_moment
-                    if previous_moment is None:
-                        break
-                    moments.append(previous_moment)
-                if len(moments) == n:
-                    yield list(reversed(moments))
+        moments = collections.deque(maxlen=n)
+        for moment in self.iterate_moments(reverse=reverse):
+            if reverse:
+                moments.appendleft(moment)
+            else:
+                moments.append(moment)
+            if len(moments) == n:
+                yield list(moments)
 
     def remove(self, interval):
         """
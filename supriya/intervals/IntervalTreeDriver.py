@@ -241,6 +241,12 @@ class IntervalTreeDriver:
                 node.left_child, cinterval
             )
             result.extend(subresult)
+        elif cinterval.start_offset == node.stop_offset_high:
+            # Zero-length intervals at the query's start offset may follow
+            subresult = self._recurse_find_intervals_intersecting_interval(
+                node.right_child, cinterval
+            )
+            result.extend(subresult)
         return result
 
     def _recurse_find_intervals_intersecting_offset(self, node, offset):
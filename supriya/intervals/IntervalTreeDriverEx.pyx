@@ -266,6 +266,11 @@ cdef class IntervalTreeDriverEx:
             subresult = self._recurse_find_intervals_intersecting_interval(
                 node.left_child, cinterval)
             result.extend(subresult)
+        elif cinterval.start_offset == node.stop_offset_high:
+            # Zero-length intervals at the query's start offset may follow
+            subresult = self._recurse_find_intervals_intersecting_interval(
+                node.right_child, cinterval)
+            result.extend(subresult)
         return result
 
     cdef object _recurse_find_intervals_stopping_at(
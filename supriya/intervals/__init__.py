@@ -1,7 +1,9 @@
 """
 Tools for modeling overlapping time structures with timespans.
 """
+
 from .Interval import Interval
+from .IntervalIndex import IntervalIndex
 from .IntervalTree import IntervalTree
 from .IntervalTreeDriver import IntervalTreeDriver  # noqa
 from .Moment import Moment
@@ -11,4 +13,4 @@ try:
 except ModuleNotFoundError:
     pass
 
-__all__ = ["Interval", "IntervalTree", "Moment"]
+__all__ = ["Interval", "IntervalIndex", "IntervalTree", "Moment"]
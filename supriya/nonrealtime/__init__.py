@@ -5,6 +5,7 @@ Tools for working in non-realtime.
 from .bases import SessionObject
 from .buffers import Buffer, BufferGroup
 from .buses import AudioInputBusGroup, AudioOutputBusGroup, Bus, BusGroup
+from .caches import RenderCache
 from .nodes import Group, Node, RootNode, Synth
 from .sessions import Renderer, Session
 from .states import DoNotPropagate, Moment, NodeTransition, State
@@ -21,6 +22,7 @@ __all__ = [
     "Moment",
     "Node",
     "NodeTransition",
+    "RenderCache",
     "Renderer",
     "RootNode",
     "Session",
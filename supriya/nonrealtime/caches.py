@@ -0,0 +1,317 @@
+import contextlib
+import json
+import os
+import pathlib
+import struct
+import tempfile
+import time
+from typing import Dict, Iterable, Iterator, Optional, Set, Union
+
+from ..system import SupriyaObject
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+
+class RenderCache(SupriyaObject):
+    """
+    A persistent, size-bounded cache of non-realtime render outputs.
+
+    Rendered files live in the cache's directory under their content-hashed
+    names, described by a small JSON index recording each entry's size (and
+    that of the score rendered beside it, if any), duration, sample format and
+    last access. Entries are only hits while their
+    files still match the index and carry an intact header, so a partially
+    written file never passes for a finished render. The least recently used
+    entries are evicted once the cache outgrows ``maximum_size`` bytes.
+
+    Lookups only update the index in memory. :py:meth:`evict` and
+    :py:meth:`set` write it back, so a renderer writes it once per render
+    rather than once per lookup. Writes hold a lock on the index and merge
+    this cache's changes into the entries on disk, so caches sharing a
+    directory keep each other's entries.
+
+    ::
+
+        >>> import tempfile
+        >>> from supriya.nonrealtime import RenderCache
+        >>> cache = RenderCache(tempfile.mkdtemp())
+        >>> cache.get("session-0123.aiff") is None
+        True
+
+    ::
+
+        >>> cache.hits, cache.misses
+        (0, 1)
+
+    Pass a cache to :py:class:`~supriya.nonrealtime.Renderer`, or as the
+    ``cache`` keyword to ``Session.render()`` or ``supriya.io.render()``, to
+    render into it.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_directory_path",
+        "_entries",
+        "_hits",
+        "_maximum_size",
+        "_misses",
+        "_removed_keys",
+        "_touched_keys",
+    )
+
+    _index_filename = "index.json"
+
+    _lock_filename = "index.lock"
+
+    _version = 1
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        directory_path: Optional[Union[os.PathLike, str]] = None,
+        maximum_size: int = 1024 * 1024 * 1024,
+    ):
+        if directory_path is None:
+            import supriya
+
+            directory_path = supriya.output_path / "renders"
+        self._directory_path = pathlib.Path(directory_path).resolve()
+        self._directory_path.mkdir(parents=True, exist_ok=True)
+        self._maximum_size = int(maximum_size)
+        self._hits = 0
+        self._misses = 0
+        self._entries: Dict[str, Dict] = self._read_index()
+        # Changes not yet merged into the index on disk
+        self._removed_keys: Set[str] = set()
+        self._touched_keys: Set[str] = set()
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_entry_size(entry: Dict) -> int:
+        # Scores are removed with their outputs, so count against the budget
+        return entry["size"] + entry.get("score_size", 0)
+
+    @contextlib.contextmanager
+    def _lock_index(self) -> Iterator[None]:
+        with (self._directory_path / self._lock_filename).open("a") as file_pointer:
+            if fcntl is not None:
+                fcntl.flock(file_pointer.fileno(), fcntl.LOCK_EX)
+            # Closing the file releases the lock
+            yield
+
+    def _merge_index(self) -> bool:
+        # Re-read the index under its lock, then apply this cache's removals
+        # and touched entries on top. Untouched entries take the index's
+        # version, and drop out if another cache removed them.
+        is_dirty = bool(self._removed_keys or self._touched_keys)
+        entries = self._read_index()
+        for key in self._removed_keys:
+            entries.pop(key, None)
+        for key in self._touched_keys:
+            entry = self._entries[key]
+            if key in entries:
+                entry["last_access"] = max(
+                    entry["last_access"], entries[key]["last_access"]
+                )
+            entries[key] = entry
+        self._entries = entries
+        return is_dirty
+
+    def _read_index(self) -> Dict[str, Dict]:
+        try:
+            index = json.loads(self.index_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+        if not isinstance(index, dict) or index.get("version") != self._version:
+            return {}
+        return index.get("entries", {})
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._removed_keys.add(key)
+        self._touched_keys.discard(key)
+        path = self._directory_path / key
+        # Scores rendered alongside an output go with it
+        for path_ in (path, path.with_suffix(".osc")):
+            try:
+                path_.unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _verify_header(path: pathlib.Path, size: int) -> bool:
+        with path.open("rb") as file_pointer:
+            header = file_pointer.read(12)
+        suffix = path.suffix.lower()
+        if suffix in (".aif", ".aifc", ".aiff"):
+            return (
+                len(header) == 12
+                and header[:4] == b"FORM"
+                and header[8:] in (b"AIFC", b"AIFF")
+                and struct.unpack(">I", header[4:8])[0] + 8 == size
+            )
+        elif suffix == ".wav":
+            if header[:4] == b"RF64":
+                return header[8:] == b"WAVE"
+            return (
+                len(header) == 12
+                and header[:4] == b"RIFF"
+                and header[8:] == b"WAVE"
+                and struct.unpack("<I", header[4:8])[0] + 8 == size
+            )
+        elif suffix in (".au", ".next", ".snd"):
+            return header[:4] == b".snd"
+        return True
+
+    def _write_index(self) -> None:
+        # Callers hold the index lock, and have merged the index on disk
+        data = json.dumps(
+            {"version": self._version, "entries": self._entries},
+            indent=2,
+            sort_keys=True,
+        )
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self._directory_path, prefix="index-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w") as file_pointer:
+                file_pointer.write(data)
+            os.replace(temporary_path, self.index_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+        self._removed_keys.clear()
+        self._touched_keys.clear()
+
+    ### PUBLIC METHODS ###
+
+    def clear(self) -> None:
+        with self._lock_index():
+            self._merge_index()
+            for key in list(self._entries):
+                self._remove(key)
+            # Other temporary files may be renders still being written
+            for path in self._directory_path.glob("index-*.tmp"):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            self._write_index()
+
+    def evict(self, retained: Iterable[str] = ()) -> None:
+        """
+        Evict least recently used entries until the cache fits its maximum
+        size, never evicting any key in ``retained``, and write back the index
+        if it changed.
+        """
+        retained = set(retained)
+        with self._lock_index():
+            is_dirty = self._merge_index()
+            total_size = sum(self._get_entry_size(x) for x in self._entries.values())
+            if self._maximum_size < total_size:
+                for key, entry in sorted(
+                    self._entries.items(), key=lambda x: x[1]["last_access"]
+                ):
+                    if total_size <= self._maximum_size:
+                        break
+                    if key in retained:
+                        continue
+                    self._remove(key)
+                    total_size -= self._get_entry_size(entry)
+                    is_dirty = True
+            if is_dirty:
+                self._write_index()
+
+    def get(self, key: str) -> Optional[pathlib.Path]:
+        """
+        Get the path of the intact output cached under ``key``, otherwise None.
+
+        Outputs whose size or header no longer match the index are removed.
+        Neither removals nor access times are written back until
+        :py:meth:`evict` or :py:meth:`set` is called.
+        """
+        entry = self._entries.get(key)
+        path = self._directory_path / key
+        if entry is not None:
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                size = None
+            if size != entry["size"] or not self._verify_header(path, size):
+                self._remove(key)
+                entry = None
+        if entry is None:
+            self._misses += 1
+            return None
+        entry["last_access"] = time.time()
+        self._touched_keys.add(key)
+        self._hits += 1
+        return path
+
+    def set(
+        self,
+        key: str,
+        duration: Optional[float] = None,
+        sample_format: Optional[str] = None,
+    ) -> None:
+        """
+        Index the output already rendered into the cache directory as ``key``.
+
+        Raises ``ValueError`` if the output's header is missing or truncated.
+        """
+        path = self._directory_path / key
+        size = path.stat().st_size
+        if not self._verify_header(path, size):
+            raise ValueError(f"Invalid header: {path}")
+        try:
+            score_size = path.with_suffix(".osc").stat().st_size
+        except FileNotFoundError:
+            score_size = 0
+        self._entries[key] = dict(
+            duration=duration,
+            last_access=time.time(),
+            sample_format=sample_format,
+            score_size=score_size,
+            size=size,
+        )
+        self._touched_keys.add(key)
+        self._removed_keys.discard(key)
+        with self._lock_index():
+            self._merge_index()
+            self._write_index()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self) -> pathlib.Path:
+        return self._directory_path
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def index_path(self) -> pathlib.Path:
+        return self._directory_path / self._index_filename
+
+    @property
+    def maximum_size(self) -> int:
+        return self._maximum_size
+
+    @property
+    def misses(self) -> int:
+        return self._misses
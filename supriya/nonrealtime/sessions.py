@@ -1,20 +1,23 @@
 import asyncio
-import bisect
 import dataclasses
 import hashlib
+import heapq
 import logging
+import os
 import platform
 import shutil
 import struct
+import tempfile
+import time
 from os import PathLike
 from pathlib import Path
-from queue import PriorityQueue
 from types import MappingProxyType
 from typing import (
     Any,
     Callable,
     Coroutine,
     Dict,
+    Generator,
     List,
     Optional,
     Set,
@@ -56,6 +59,7 @@ from ..commands import (
     SynthDefReceiveRequest,
 )
 from ..enums import CalculationRate, HeaderFormat, ParameterRate, SampleFormat
+from ..intervals.IntervalIndex import IntervalIndex
 from ..intervals.IntervalTree import IntervalTree
 from ..osc import OscBundle, OscMessage
 from ..querytree import QueryTreeGroup
@@ -73,8 +77,9 @@ from ..utils import iterate_nwise
 from .bases import SessionObject
 from .buffers import Buffer, BufferGroup
 from .buses import AudioInputBusGroup, AudioOutputBusGroup, Bus, BusGroup
+from .caches import RenderCache
 from .nodes import Group, Node, RootNode, Synth
-from .states import Moment, State
+from .states import Moment, SortedOffsetList, State
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +95,9 @@ class RenderableMemo:
 class SessionRenderableMemo(RenderableMemo):
     datagram: bytes = b""
     input_path: Optional[Path] = None
+    md5: Any = None
     osc_bundles: List[OscBundle] = dataclasses.field(default_factory=list)
+    score_path: Optional[Path] = None
     xrefable_osc_messages: List[OscMessage] = dataclasses.field(default_factory=list)
 
 
@@ -142,32 +149,47 @@ class Renderer:
         self,
         session: "Session",
         *,
+        cache: Optional[RenderCache] = None,
         duration: Optional[float] = None,
         executable: Optional[str] = None,
         header_format: HeaderFormatLike = HeaderFormat.AIFF,
+        max_workers: int = 1,
         output_file_path: Optional[PathLike] = None,
         render_directory_path: Optional[PathLike] = None,
         sample_format: SampleFormatLike = SampleFormat.INT24,
         sample_rate: int = 44100,
+        streaming: bool = False,
         suppress_output: bool = False,
         **kwargs,
     ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"Invalid max workers: {max_workers}")
+        if cache is not None:
+            if render_directory_path is not None and (
+                Path(render_directory_path).resolve() != cache.directory_path
+            ):
+                raise ValueError("Cached renders must use the cache's directory")
+            render_directory_path = cache.directory_path
+        self.cache = cache
         self.compiled_sessions: Dict = {}
         self.dependency_graph = DependencyGraph()
         self.duration = duration
         self.executable = executable
         self.header_format = HeaderFormat.from_expr(header_format)
         self.kwargs = kwargs
+        self.max_workers = int(max_workers)
         self.prerender_tuples: List[Tuple] = []
         self.render_directory_path = Path(
             render_directory_path or output_path
         ).resolve()
+        self.render_timings: Dict[SupportsRender, float] = {}
         self.renderable_prefixes: Dict = {}
         self.sample_format = SampleFormat.from_expr(sample_format)
         self.sample_rate = int(sample_rate)
         self.session = session
         self.session_input_paths: Dict = {}
         self.sessionables_to_sessions: Dict = {}
+        self.streaming = streaming
         self.suppress_output = suppress_output
         self.output_file_path = (
             Path(output_file_path).resolve() if output_file_path is not None else None
@@ -188,50 +210,60 @@ class Renderer:
         return datagram
 
     def _build_dependency_graph(
-        self,
+        self, *, streaming: bool = False
     ) -> Tuple[DependencyGraph, Dict[SupportsRender, RenderableMemo]]:
         # Build dependency graph
         dependency_graph = DependencyGraph()
         dependency_graph_stack: List[SupportsRender] = [self.session]
         renderable_memos: Dict[SupportsRender, RenderableMemo] = {}
-        while dependency_graph_stack:
-            renderable = dependency_graph_stack.pop()
-            if renderable in renderable_memos:
-                continue
-            if not hasattr(renderable, "__render__"):
-                raise TypeError("Non-renderable: {renderable!r}")
-            dependency_graph.add(renderable)
-            if isinstance(renderable, Session):
+        try:
+            while dependency_graph_stack:
+                renderable = dependency_graph_stack.pop()
+                if renderable in renderable_memos:
+                    continue
+                if not hasattr(renderable, "__render__"):
+                    raise TypeError("Non-renderable: {renderable!r}")
+                dependency_graph.add(renderable)
+                if not isinstance(renderable, Session):
+                    renderable_memos[renderable] = RenderableMemo(renderable=renderable)
+                    continue
                 renderable_memos[renderable] = memo = SessionRenderableMemo(
-                    renderable=renderable,
-                    osc_bundles=renderable._to_non_xrefd_osc_bundles(
-                        self.duration if renderable is self.session else None
-                    ),
+                    renderable=renderable
                 )
                 if hasattr(renderable.input_, "__render__"):
                     dependency_graph_stack.append(renderable.input_)
                     dependency_graph.add(renderable.input_, parent=renderable)
-                for osc_bundle in memo.osc_bundles:
-                    for osc_message in osc_bundle.contents:
-                        found = False
-                        for x in osc_message.contents:
-                            if hasattr(x, "__render__"):
-                                found = True
-                                dependency_graph_stack.append(x)
-                                dependency_graph.add(x, parent=renderable)
-                        if found:
-                            memo.xrefable_osc_messages.append(osc_message)
-            else:
-                renderable_memos[renderable] = RenderableMemo(renderable=renderable)
-        if not dependency_graph.is_acyclic():
-            raise RuntimeError("Cycles detected")
+                if streaming:
+                    # Write the score while scanning it for dependencies
+                    memo.score_path, memo.md5, dependencies = self._write_score(memo)
+                else:
+                    memo.osc_bundles = renderable._to_non_xrefd_osc_bundles(
+                        self.duration if renderable is self.session else None
+                    )
+                    dependencies = []
+                    for osc_bundle in memo.osc_bundles:
+                        for osc_message in osc_bundle.contents:
+                            found = False
+                            for x in osc_message.contents:
+                                if hasattr(x, "__render__"):
+                                    found = True
+                                    dependencies.append(x)
+                            if found:
+                                memo.xrefable_osc_messages.append(osc_message)
+                for x in dependencies:
+                    dependency_graph_stack.append(x)
+                    dependency_graph.add(x, parent=renderable)
+            if not dependency_graph.is_acyclic():
+                raise RuntimeError("Cycles detected")
+        except BaseException:
+            self._remove_scores(renderable_memos)
+            raise
         return dependency_graph, renderable_memos
 
     def _build_file_path(
-        self, datagram: bytes, input_file_path: Optional[Path], session: "Session"
+        self, md5, input_file_path: Optional[Path], session: "Session"
     ) -> Path:
-        md5 = hashlib.md5()
-        md5.update(datagram)
+        # The md5 has already been fed the session's datagram
         hash_values = []
         if input_file_path is not None:
             hash_values.append(input_file_path)
@@ -250,95 +282,265 @@ class Renderer:
             md5.update(value)
         return Path("session-{}.osc".format(md5.hexdigest()))
 
+    def _remove_scores(
+        self, renderable_memos: Dict[SupportsRender, RenderableMemo]
+    ) -> None:
+        for memo in renderable_memos.values():
+            if isinstance(memo, SessionRenderableMemo) and memo.score_path:
+                memo.score_path.unlink()
+                memo.score_path = None
+
     async def _render_dependency_graph(
         self,
         dependency_graph: DependencyGraph,
         renderable_memos: Dict[SupportsRender, RenderableMemo],
     ) -> int:
-        for renderable in dependency_graph:
-            memo = renderable_memos[renderable]
-            # We can skip rendering iff
-            # - We're not suppressing output (the output path is not /dev/null) AND
-            #   output already exists
-            # - We're suppressing, but the renderable is not the final session AND
-            #   output already exists
-            if (
-                not (self.suppress_output and memo.renderable is self.session)
-                and (self.render_directory_path / memo.output_filename).exists()
-            ):
-                exit_code = 0
-                continue
-            if isinstance(memo, SessionRenderableMemo):
-                session = cast(Session, memo.renderable)
-                # write the .osc file
-                (self.render_directory_path / memo.output_filename).with_suffix(
-                    ".osc"
-                ).write_bytes(memo.datagram)
-                # render the datagram
-                exit_future = asyncio.get_running_loop().create_future()
-                protocol = AsyncProcessProtocol(exit_future)
-                output_filename = memo.output_filename
-                if session is self.session and self.suppress_output:
-                    output_filename = (
-                        "NUL" if platform.system() == "Windows" else "/dev/null"
+        # Iterating the graph yields dependencies before their dependents, so
+        # launching ready renderables in that order keeps one worker sequential
+        renderables = list(dependency_graph)
+        indices = {renderable: i for i, renderable in enumerate(renderables)}
+        pending_counts = {
+            renderable: len(dependency_graph.children(renderable))
+            for renderable in renderables
+        }
+        ready = [
+            (indices[renderable], renderable)
+            for renderable in renderables
+            if not pending_counts[renderable]
+        ]
+        running: Dict[asyncio.Future, SupportsRender] = {}
+        exit_codes: Dict[SupportsRender, int] = {}
+        error: Optional[BaseException] = None
+        try:
+            while ready or running:
+                # Stop launching on error, but let running renders finish
+                while ready and len(running) < self.max_workers and error is None:
+                    _, renderable = heapq.heappop(ready)
+                    task = asyncio.ensure_future(
+                        self._render_memo(renderable_memos[renderable])
                     )
-                command = new(session.options, **self.kwargs).serialize() + [
-                    "-N",
-                    str(Path(memo.output_filename).with_suffix(".osc")),
-                    str(memo.input_path or "_"),
-                    output_filename,
-                    str(self.sample_rate),
-                    self.header_format.name.lower(),  # Must be lowercase.
-                    self.sample_format.name.lower(),  # Must be lowercase.
-                ]
-                await protocol.run(command, self.render_directory_path)
-                await exit_future
-                exit_code = exit_future.result()
-            else:
-                if not memo.render_function:
-                    raise RuntimeError("How did we get here")
-                exit_code = await memo.render_function()
-            if (
-                exit_code
-                and not self.suppress_output
-                and not (
-                    platform.system() == "Windows"
-                    and (self.render_directory_path / memo.output_filename).exists()
+                    running[task] = renderable
+                if not running:
+                    break
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
                 )
-            ):
-                raise RuntimeError(f"Non-zero exit code: {exit_code}")
+                for task in sorted(done, key=lambda x: indices[running[x]]):
+                    renderable = running.pop(task)
+                    try:
+                        exit_codes[renderable] = task.result()
+                    except Exception as exception:
+                        error = error or exception
+                        continue
+                    for parent in dependency_graph.parents(renderable):
+                        pending_counts[parent] -= 1
+                        if not pending_counts[parent]:
+                            heapq.heappush(ready, (indices[parent], parent))
+        finally:
+            for task in running:
+                task.cancel()
+            if self.cache is not None:
+                # Also writes back the index, once per render
+                self.cache.evict(
+                    retained=[
+                        memo.output_filename for memo in renderable_memos.values()
+                    ]
+                )
+        if error is not None:
+            raise error
+        memo = renderable_memos[self.session]
         if self.output_file_path is not None:
             shutil.copy(
                 self.render_directory_path / memo.output_filename, self.output_file_path
             )
+        return exit_codes[self.session]
+
+    async def _render_memo(self, memo: RenderableMemo) -> int:
+        # We can skip rendering iff
+        # - We're not suppressing output (the output path is not /dev/null) AND
+        #   output already exists (and is intact, if cached)
+        # - We're suppressing, but the renderable is not the final session AND
+        #   output already exists (and is intact, if cached)
+        is_suppressed = self.suppress_output and memo.renderable is self.session
+        output_path = self.render_directory_path / memo.output_filename
+        if not is_suppressed:
+            if self.cache is not None:
+                if self.cache.get(memo.output_filename) is not None:
+                    return 0
+            elif output_path.exists():
+                return 0
+        start_time = time.perf_counter()
+        if isinstance(memo, SessionRenderableMemo):
+            session = cast(Session, memo.renderable)
+            # write the .osc file, unless already streamed to disk
+            if not self.streaming:
+                output_path.with_suffix(".osc").write_bytes(memo.datagram)
+            # render the datagram
+            exit_future = asyncio.get_running_loop().create_future()
+            protocol = AsyncProcessProtocol(exit_future)
+            if is_suppressed:
+                temporary_path = None
+                output_filename = (
+                    "NUL" if platform.system() == "Windows" else "/dev/null"
+                )
+            else:
+                # Render beside the output and rename it into place once done,
+                # so a crashed or concurrent render never leaves a partial file
+                file_descriptor, temporary_filename = tempfile.mkstemp(
+                    dir=self.render_directory_path,
+                    prefix=f"{output_path.stem}-",
+                    suffix=".tmp",
+                )
+                os.close(file_descriptor)
+                temporary_path = Path(temporary_filename)
+                output_filename = temporary_path.name
+            command = new(session.options, **self.kwargs).serialize() + [
+                "-N",
+                str(Path(memo.output_filename).with_suffix(".osc")),
+                str(memo.input_path or "_"),
+                output_filename,
+                str(self.sample_rate),
+                self.header_format.name.lower(),  # Must be lowercase.
+                self.sample_format.name.lower(),  # Must be lowercase.
+            ]
+            try:
+                await protocol.run(command, self.render_directory_path)
+                await exit_future
+                exit_code = exit_future.result()
+                if temporary_path is not None and (
+                    not exit_code
+                    or (
+                        platform.system() == "Windows" and temporary_path.stat().st_size
+                    )
+                ):
+                    os.replace(temporary_path, output_path)
+            finally:
+                if temporary_path is not None and temporary_path.exists():
+                    temporary_path.unlink()
+        else:
+            if not memo.render_function:
+                raise RuntimeError("How did we get here")
+            exit_code = await memo.render_function()
+        elapsed = time.perf_counter() - start_time
+        self.render_timings[memo.renderable] = elapsed
+        logger.debug(f"Rendered {memo.output_filename} in {elapsed:.3f}s")
+        if (
+            exit_code
+            and not self.suppress_output
+            and not (platform.system() == "Windows" and output_path.exists())
+        ):
+            raise RuntimeError(f"Non-zero exit code: {exit_code}")
+        if self.cache is not None and not is_suppressed and output_path.exists():
+            duration, sample_format = None, None
+            if isinstance(memo, SessionRenderableMemo):
+                duration = cast(Session, memo.renderable).duration
+                if memo.renderable is self.session and self.duration:
+                    duration = self.duration
+                sample_format = self.sample_format.name.lower()
+            self.cache.set(
+                memo.output_filename, duration=duration, sample_format=sample_format
+            )
         return exit_code
 
     def _xref_dependency_graph(
         self,
         dependency_graph: DependencyGraph,
         renderable_memos: Dict[SupportsRender, RenderableMemo],
+        *,
+        streaming: bool = False,
+    ) -> None:
+        try:
+            self._xref_renderables(dependency_graph, renderable_memos, streaming)
+        except BaseException:
+            self._remove_scores(renderable_memos)
+            raise
+
+    def _write_score(
+        self,
+        memo: SessionRenderableMemo,
+        renderable_memos: Optional[Dict[SupportsRender, RenderableMemo]] = None,
+    ) -> Tuple[Optional[Path], Any, List[SupportsRender]]:
+        # Generate the score bundle by bundle, writing and hashing each
+        # length-prefixed datagram as it goes, so memory stays flat. Without
+        # renderable memos, renderables are collected instead of
+        # cross-referenced, and the score is only kept if it has none.
+        session = cast(Session, memo.renderable)
+        md5 = hashlib.md5()
+        renderables: List[SupportsRender] = []
+        file_descriptor, temporary_filename = tempfile.mkstemp(
+            dir=self.render_directory_path, prefix="session-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as file_pointer:
+                for request_bundle in session._iterate_non_xrefd_request_bundles(
+                    self.duration if session is self.session else None
+                ):
+                    osc_bundle = request_bundle.to_osc()
+                    for osc_message in osc_bundle.contents:
+                        if renderable_memos is not None:
+                            self._xref_osc_message(osc_message, renderable_memos)
+                            continue
+                        renderables.extend(
+                            x for x in osc_message.contents if hasattr(x, "__render__")
+                        )
+                    if renderables:
+                        continue
+                    datagram = osc_bundle.to_datagram(realtime=False)
+                    for data in (struct.pack(">i", len(datagram)), datagram):
+                        md5.update(data)
+                        file_pointer.write(data)
+        except BaseException:
+            os.unlink(temporary_filename)
+            raise
+        if renderables:
+            os.unlink(temporary_filename)
+            return None, None, renderables
+        return Path(temporary_filename), md5, renderables
+
+    def _xref_osc_message(
+        self,
+        osc_message: OscMessage,
+        renderable_memos: Dict[SupportsRender, RenderableMemo],
+    ) -> None:
+        osc_message.contents = tuple(
+            str(renderable_memos[x].output_filename) if hasattr(x, "__render__") else x
+            for x in osc_message.contents
+        )
+
+    def _xref_renderables(
+        self,
+        dependency_graph: DependencyGraph,
+        renderable_memos: Dict[SupportsRender, RenderableMemo],
+        streaming: bool,
     ) -> None:
         for renderable in dependency_graph:
             memo = renderable_memos[renderable]
             if isinstance(memo, SessionRenderableMemo):
                 session = cast(Session, memo.renderable)
                 for osc_message in memo.xrefable_osc_messages:
-                    contents = list(osc_message.contents)
-                    for i, x in enumerate(contents):
-                        if x in renderable_memos:
-                            contents[i] = str(renderable_memos[x].output_filename)
-                    osc_message.contents = tuple(contents)
+                    self._xref_osc_message(osc_message, renderable_memos)
                 input_ = session.input_
                 if input_ in renderable_memos:
                     memo.input_path = Path(renderable_memos[input_].output_filename)
                 elif input_ is not None:
                     memo.input_path = Path(input_)
-                memo.datagram = self._build_datagram(memo.osc_bundles)
+                if streaming:
+                    if memo.score_path is None:
+                        # Scores with dependencies are rewritten cross-referenced
+                        memo.score_path, memo.md5, _ = self._write_score(
+                            memo, renderable_memos
+                        )
+                    md5 = memo.md5
+                else:
+                    memo.datagram = self._build_datagram(memo.osc_bundles)
+                    md5 = hashlib.md5(memo.datagram)
+                file_path = self._build_file_path(md5, memo.input_path, session)
                 memo.output_filename = str(
-                    self._build_file_path(
-                        memo.datagram, memo.input_path, session
-                    ).with_suffix(f".{self.header_format.name.lower()}")
+                    file_path.with_suffix(f".{self.header_format.name.lower()}")
                 )
+                if streaming:
+                    score_path, memo.score_path = memo.score_path, None
+                    os.replace(score_path, self.render_directory_path / file_path)
             else:
                 result = memo.renderable.__render__(
                     render_directory_path=self.render_directory_path
@@ -357,6 +559,7 @@ class Renderer:
         return [osc_bundle.to_list() for osc_bundle in osc_bundles]
 
     def to_osc_bundles(self) -> List[OscBundle]:
+        # Scores are always built in memory here, even when streaming
         dependency_graph, renderable_memos = self._build_dependency_graph()
         self._xref_dependency_graph(dependency_graph, renderable_memos)
         memo = cast(SessionRenderableMemo, renderable_memos[self.session])
@@ -387,8 +590,12 @@ class Renderer:
         def render_function():
             return self._render_dependency_graph(dependency_graph, renderable_memos)
 
-        dependency_graph, renderable_memos = self._build_dependency_graph()
-        self._xref_dependency_graph(dependency_graph, renderable_memos)
+        dependency_graph, renderable_memos = self._build_dependency_graph(
+            streaming=self.streaming
+        )
+        self._xref_dependency_graph(
+            dependency_graph, renderable_memos, streaming=self.streaming
+        )
         if self.suppress_output:
             return render_function, Path(
                 "NUL" if platform.system() == "Windows" else "/dev/null"
@@ -496,7 +703,7 @@ class Session:
         self._buses_by_session_id: Dict = {}
         self._nodes = IntervalTree(accelerated=True)
         self._nodes_by_session_id: Dict = {}
-        self._offsets: List[float] = []
+        self._offsets = SortedOffsetList()
         self._root_node = RootNode(self)
         self._session_ids: Dict = {}
         self._states: Dict = {}
@@ -609,7 +816,7 @@ class Session:
         old_state = self._find_state_before(offset)
         state = old_state._clone(offset)
         self.states[offset] = state
-        self.offsets.insert(self.offsets.index(old_state.offset) + 1, offset)
+        self.offsets.add(offset)
         return state
 
     def _apply_transitions(self, offsets, chain=True):
@@ -617,15 +824,14 @@ class Session:
 
         if DoNotPropagate._stack:
             return
-        queue = PriorityQueue()
         try:
-            for offset in offsets:
-                queue.put(offset)
+            queue = list(offsets)
         except TypeError:
-            queue.put(offsets)
+            queue = [offsets]
+        heapq.heapify(queue)
         previous_offset = None
-        while not queue.empty():
-            offset = queue.get()
+        while queue:
+            offset = heapq.heappop(queue)
             if offset == previous_offset:
                 continue
             previous_offset = offset
@@ -649,7 +855,7 @@ class Session:
             if changed and chain:
                 next_state = self._find_state_after(offset, with_node_tree=True)
                 if next_state is not None:
-                    queue.put(next_state.offset)
+                    heapq.heappush(queue, next_state.offset)
 
     def _build_id_mapping(self):
         id_mapping = {}
@@ -855,7 +1061,9 @@ class Session:
                 bus_settings.setdefault(offset, {})[bus_id] = value
         return bus_settings
 
-    def _collect_durated_objects(self, offset, is_last_offset):
+    def _collect_durated_objects(
+        self, buffer_index, is_last_offset, node_index, offset
+    ):
         state = self._find_state_at(offset, clone_if_missing=True)
         start_buffers, start_nodes = state.start_buffers, state.start_nodes
         stop_buffers = state.stop_buffers.copy()
@@ -863,8 +1071,8 @@ class Session:
         if is_last_offset:
             stop_buffers.update(state.overlap_buffers)
             stop_nodes.update(state.overlap_nodes)
-        all_buffers = set(self.buffers.find_intersection(offset))
-        all_nodes = set(self.nodes.find_intersection(offset))
+        all_buffers = set(buffer_index.find_intersection(offset))
+        all_nodes = set(node_index.find_intersection(offset))
         all_buffers.update(stop_buffers)
         all_nodes.update(stop_nodes)
         return (
@@ -991,12 +1199,14 @@ class Session:
 
     def _collect_requests_at_offset(
         self,
+        buffer_index,
         buffer_open_states,
         buffer_settings,
         bus_settings,
         duration,
         id_mapping,
         is_last_offset,
+        node_index,
         offset,
         visited_synthdefs,
     ):
@@ -1008,7 +1218,9 @@ class Session:
             start_nodes,
             stop_buffers,
             stop_nodes,
-        ) = self._collect_durated_objects(offset, is_last_offset)
+        ) = self._collect_durated_objects(
+            buffer_index, is_last_offset, node_index, offset
+        )
         state = self._find_state_at(offset, clone_if_missing=True)
         node_actions = state.transitions
         node_settings = self._collect_node_settings(offset, state, id_mapping)
@@ -1062,18 +1274,10 @@ class Session:
         return requests
 
     def _find_state_after(self, offset, with_node_tree=None):
-        index = bisect.bisect(self.offsets, offset)
-        if with_node_tree:
-            while index < len(self.offsets):
-                state = self.states[self.offsets[index]]
-                if state.nodes_to_children is not None:
-                    return state
-                index += 1
-            return None
-        if index < len(self.offsets):
-            old_offset = self.offsets[index]
-            if offset < old_offset:
-                return self.states[old_offset]
+        for old_offset in self.offsets.iterate_after(offset):
+            state = self.states[old_offset]
+            if not with_node_tree or state.nodes_to_children is not None:
+                return state
         return None
 
     def _find_state_at(self, offset, clone_if_missing=False):
@@ -1082,26 +1286,15 @@ class Session:
             old_state = self._find_state_before(offset, with_node_tree=True)
             state = old_state._clone(offset)
             self.states[offset] = state
-            self.offsets.insert(self.offsets.index(old_state.offset) + 1, offset)
+            self.offsets.add(offset)
         return state
 
     def _find_state_before(self, offset, with_node_tree=None):
-        index = bisect.bisect_left(self.offsets, offset)
-        if index == len(self.offsets):
-            index -= 1
-        old_offset = self.offsets[index]
-        if offset <= old_offset:
-            index -= 1
-        if index < 0:
-            return None
-        if with_node_tree:
-            while 0 <= index:
-                state = self.states[self.offsets[index]]
-                if state.nodes_to_children is not None:
-                    return state
-                index -= 1
-            return None
-        return self.states[self.offsets[index]]
+        for old_offset in self.offsets.iterate_before(offset):
+            state = self.states[old_offset]
+            if not with_node_tree or state.nodes_to_children is not None:
+                return state
+        return None
 
     def _get_next_session_id(self, kind="node"):
         default = 0
@@ -1138,11 +1331,11 @@ class Session:
         state._nodes_to_children = {self.root_node: None}
         state._nodes_to_parents = {self.root_node: None}
         self.states[offset] = state
-        self.offsets.append(offset)
+        self.offsets.add(offset)
         offset = 0.0
         state = state._clone(offset)
         self.states[offset] = state
-        self.offsets.append(offset)
+        self.offsets.add(offset)
 
     def _remove_state_at(self, offset):
         state = self._find_state_at(offset, clone_if_missing=False)
@@ -1153,14 +1346,9 @@ class Session:
         del self.states[offset]
         return state
 
-    def _to_non_xrefd_osc_bundles(self, duration: Optional[float] = None):
-        osc_bundles = []
-        request_bundles = self._to_non_xrefd_request_bundles(duration=duration)
-        for request_bundle in request_bundles:
-            osc_bundles.append(request_bundle.to_osc())
-        return osc_bundles
-
-    def _to_non_xrefd_request_bundles(self, duration: Optional[float] = None):
+    def _iterate_non_xrefd_request_bundles(
+        self, duration: Optional[float] = None
+    ) -> Generator[RequestBundle, None, None]:
         id_mapping = self._build_id_mapping()
         if self.duration == float("inf"):
             assert duration is not None and 0 < duration < float("inf")
@@ -1171,8 +1359,11 @@ class Session:
             offsets.sort()
         buffer_settings = self._collect_buffer_settings(id_mapping)
         bus_settings = self._collect_bus_settings(id_mapping)
+        # The session is frozen while rendering, so bulk-load static indices
+        # once rather than walking the mutable trees at every offset.
+        buffer_index = IntervalIndex(self.buffers)
+        node_index = IntervalIndex(self.nodes)
         is_last_offset = False
-        request_bundles = []
         buffer_open_states: Dict = {}
         visited_synthdefs: Set[SynthDef] = set()
         for offset in offsets:
@@ -1180,25 +1371,33 @@ class Session:
             if offset == duration:
                 is_last_offset = True
             requests = self._collect_requests_at_offset(
+                buffer_index,
                 buffer_open_states,
                 buffer_settings,
                 bus_settings,
                 duration,
                 id_mapping,
                 is_last_offset,
+                node_index,
                 offset,
                 visited_synthdefs,
             )
             if is_last_offset:
                 requests.append(NothingRequest())
             if requests:
-                request_bundle = RequestBundle(
-                    contents=requests, timestamp=float(offset)
-                )
-                request_bundles.append(request_bundle)
+                yield RequestBundle(contents=requests, timestamp=float(offset))
             if is_last_offset:
                 break
-        return request_bundles
+
+    def _to_non_xrefd_osc_bundles(self, duration: Optional[float] = None):
+        osc_bundles = []
+        request_bundles = self._to_non_xrefd_request_bundles(duration=duration)
+        for request_bundle in request_bundles:
+            osc_bundles.append(request_bundle.to_osc())
+        return osc_bundles
+
+    def _to_non_xrefd_request_bundles(self, duration: Optional[float] = None):
+        return list(self._iterate_non_xrefd_request_bundles(duration=duration))
 
     ### PUBLIC METHODS ###
 
@@ -1547,7 +1746,7 @@ class Session:
         return MappingProxyType(self._nodes_by_session_id)
 
     @property
-    def offsets(self) -> List[float]:
+    def offsets(self) -> SortedOffsetList:
         return self._offsets
 
     @property
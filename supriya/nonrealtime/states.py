@@ -1,6 +1,8 @@
+import bisect
 import collections
+import itertools
 import threading
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, MutableMapping, Optional, Set, Tuple
 
 import uqbar.graphs
 
@@ -21,6 +23,332 @@ _local = threading.local()
 _local._do_not_propagate_stack = []
 
 
+class CopyOnWriteDict(collections.abc.MutableMapping):
+    """
+    A dict whose copies share structure until written to.
+
+    Entries live in small dicts at the leaves of a two-level, 64-way trie
+    indexed by key hash, as in a shallow hash array mapped trie. Copying costs
+    O(1), and a write only copies the path down to its leaf, leaving every
+    other copy untouched, so a chain of copies costs memory in proportion to
+    their changes rather than their size.
+
+    ::
+
+        >>> from supriya.nonrealtime.states import CopyOnWriteDict
+        >>> dict_one = CopyOnWriteDict({1: "a", 2: "b"})
+        >>> dict_two = dict_one.copy()
+        >>> dict_two[1] = "c"
+        >>> del dict_two[2]
+        >>> dict_one
+        CopyOnWriteDict({1: 'a', 2: 'b'})
+
+    ::
+
+        >>> dict_two
+        CopyOnWriteDict({1: 'c'})
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_length", "_owned", "_root")
+
+    ### INITIALIZER ###
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._length = 0
+        self._root: List[Optional[List[Optional[Dict]]]] = [None] * 64
+        # The ids of the trie's lists and dicts this copy alone may mutate
+        self._owned: Set[int] = {id(self._root)}
+        self.update(*args, **kwargs)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key) -> bool:
+        leaf = self._get_leaf(hash(key))
+        return leaf is not None and key in leaf
+
+    def __copy__(self) -> "CopyOnWriteDict":
+        return self.copy()
+
+    def __delitem__(self, key) -> None:
+        hash_ = hash(key)
+        leaf = self._get_leaf(hash_)
+        if leaf is None or key not in leaf:
+            raise KeyError(key)
+        del self._get_writable_leaf(hash_)[key]
+        self._length -= 1
+
+    def __eq__(self, expr) -> bool:
+        if not isinstance(expr, CopyOnWriteDict):
+            return super().__eq__(expr)
+        if self._length != expr._length:
+            return False
+        # Shared subtries are equal by identity, so only written paths compare
+        for inner_one, inner_two in zip(self._root, expr._root):
+            if inner_one is inner_two:
+                continue
+            for i in range(64):
+                leaf_one = inner_one[i] if inner_one is not None else None
+                leaf_two = inner_two[i] if inner_two is not None else None
+                if leaf_one is not leaf_two and (leaf_one or {}) != (leaf_two or {}):
+                    return False
+        return True
+
+    def __getitem__(self, key):
+        leaf = self._get_leaf(hash(key))
+        if leaf is None:
+            raise KeyError(key)
+        return leaf[key]
+
+    def __getstate__(self):
+        return self._length, self._root
+
+    def __iter__(self):
+        for inner in self._root:
+            if inner is None:
+                continue
+            for leaf in inner:
+                if leaf:
+                    yield from leaf
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def __setitem__(self, key, value) -> None:
+        hash_ = hash(key)
+        leaf = self._get_leaf(hash_)
+        if leaf is None or id(leaf) not in self._owned:
+            leaf = self._get_writable_leaf(hash_)
+        if key not in leaf:
+            self._length += 1
+        leaf[key] = value
+
+    def __setstate__(self, state) -> None:
+        self._length, self._root = state
+        self._owned = set()
+
+    ### PRIVATE METHODS ###
+
+    def _get_leaf(self, hash_: int) -> Optional[Dict]:
+        inner = self._root[hash_ & 63]
+        if inner is None:
+            return None
+        return inner[(hash_ >> 6) & 63]
+
+    def _get_writable_leaf(self, hash_: int) -> Dict:
+        # Owning a leaf implies owning the path down to it
+        owned = self._owned
+        root = self._root
+        if id(root) not in owned:
+            root = self._root = list(root)
+            owned.add(id(root))
+        inner = root[hash_ & 63]
+        if inner is None:
+            inner = root[hash_ & 63] = [None] * 64
+            owned.add(id(inner))
+        elif id(inner) not in owned:
+            inner = root[hash_ & 63] = list(inner)
+            owned.add(id(inner))
+        leaf = inner[(hash_ >> 6) & 63]
+        if leaf is None:
+            leaf = inner[(hash_ >> 6) & 63] = {}
+            owned.add(id(leaf))
+        elif id(leaf) not in owned:
+            leaf = inner[(hash_ >> 6) & 63] = dict(leaf)
+            owned.add(id(leaf))
+        return leaf
+
+    ### PUBLIC METHODS ###
+
+    def copy(self) -> "CopyOnWriteDict":
+        copied = type(self).__new__(type(self))
+        copied._length = self._length
+        copied._root = self._root
+        copied._owned = set()
+        # Neither copy may now write to the shared trie in place
+        self._owned = set()
+        return copied
+
+    def get(self, key, default=None):
+        leaf = self._get_leaf(hash(key))
+        if leaf is None:
+            return default
+        return leaf.get(key, default)
+
+
+class SortedOffsetList(collections.abc.Sequence):
+    """
+    An always-sorted sequence of unique offsets.
+
+    Offsets live in a list of short sorted blocks, bisected first by each
+    block's last offset and then within the block, so adding or removing an
+    offset costs O(log n) comparisons and only shifts a single block, rather
+    than the whole sequence.
+
+    ::
+
+        >>> from supriya.nonrealtime.states import SortedOffsetList
+        >>> offsets = SortedOffsetList([0.0, 2.5, 1.0])
+        >>> offsets.add(1.5)
+        >>> offsets
+        SortedOffsetList([0.0, 1.0, 1.5, 2.5])
+
+    ::
+
+        >>> list(offsets.iterate_after(1.0)), list(offsets.iterate_before(1.0))
+        ([1.5, 2.5], [0.0])
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_blocks", "_length", "_maxima", "_starts")
+
+    _block_length = 512
+
+    ### INITIALIZER ###
+
+    def __init__(self, offsets=()) -> None:
+        self._blocks: List[List[float]] = []
+        self._length = 0
+        self._maxima: List[float] = []
+        # Each block's starting index, rebuilt lazily for positional access
+        self._starts: Optional[List[int]] = None
+        for offset in sorted(set(offsets)):
+            self.add(offset)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, offset) -> bool:
+        i = bisect.bisect_left(self._maxima, offset)
+        if i == len(self._maxima):
+            return False
+        block = self._blocks[i]
+        return block[bisect.bisect_left(block, offset)] == offset
+
+    def __eq__(self, expr) -> bool:
+        if not isinstance(expr, collections.abc.Sequence) or isinstance(expr, str):
+            return NotImplemented
+        return self._length == len(expr) and all(x == y for x, y in zip(self, expr))
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return list(self)[item]
+        if item < 0:
+            item += self._length
+        if not 0 <= item < self._length:
+            raise IndexError(item)
+        if self._starts is None:
+            self._starts = [0, *itertools.accumulate(len(x) for x in self._blocks[:-1])]
+        i = bisect.bisect_right(self._starts, item) - 1
+        return self._blocks[i][item - self._starts[i]]
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __reversed__(self):
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    ### PUBLIC METHODS ###
+
+    def add(self, offset: float) -> None:
+        """
+        Add ``offset``, unless already present.
+        """
+        if not self._blocks:
+            self._blocks.append([offset])
+            self._maxima.append(offset)
+            self._length = 1
+            self._starts = None
+            return
+        i = bisect.bisect_left(self._maxima, offset)
+        if i == len(self._maxima):
+            i -= 1
+        block = self._blocks[i]
+        j = bisect.bisect_left(block, offset)
+        if j < len(block) and block[j] == offset:
+            return
+        block.insert(j, offset)
+        self._maxima[i] = block[-1]
+        self._length += 1
+        self._starts = None
+        if len(block) > 2 * self._block_length:
+            self._blocks.insert(i + 1, block[self._block_length :])
+            del block[self._block_length :]
+            self._maxima.insert(i, block[-1])
+
+    def index(self, offset, start=0, stop=None) -> int:
+        i = bisect.bisect_left(self._maxima, offset)
+        if i < len(self._maxima):
+            block = self._blocks[i]
+            j = bisect.bisect_left(block, offset)
+            if block[j] == offset:
+                # Positions are only needed here, so find the block's start
+                index = sum(len(x) for x in self._blocks[:i]) + j
+                if start <= index and (stop is None or index < stop):
+                    return index
+        raise ValueError(f"{offset!r} is not in {type(self).__name__}")
+
+    def iterate_after(self, offset: float):
+        """
+        Iterate offsets strictly after ``offset``, in ascending order.
+        """
+        blocks = self._blocks
+        i = bisect.bisect_right(self._maxima, offset)
+        if i < len(blocks):
+            block = blocks[i]
+            for j in range(bisect.bisect_right(block, offset), len(block)):
+                yield block[j]
+        for i in range(i + 1, len(blocks)):
+            yield from blocks[i]
+
+    def iterate_before(self, offset: float):
+        """
+        Iterate offsets strictly before ``offset``, in descending order.
+        """
+        blocks = self._blocks
+        i = bisect.bisect_left(self._maxima, offset)
+        if i < len(blocks):
+            block = blocks[i]
+            for j in range(bisect.bisect_left(block, offset) - 1, -1, -1):
+                yield block[j]
+        for i in range(min(i, len(blocks)) - 1, -1, -1):
+            yield from reversed(blocks[i])
+
+    def remove(self, offset: float) -> None:
+        """
+        Remove ``offset``, raising ``ValueError`` if absent.
+        """
+        i = bisect.bisect_left(self._maxima, offset)
+        if i < len(self._maxima):
+            block = self._blocks[i]
+            j = bisect.bisect_left(block, offset)
+            if block[j] == offset:
+                del block[j]
+                if block:
+                    self._maxima[i] = block[-1]
+                else:
+                    del self._blocks[i]
+                    del self._maxima[i]
+                self._length -= 1
+                self._starts = None
+                return
+        raise ValueError(f"{offset!r} is not in {type(self).__name__}")
+
+
 class State(SessionObject):
     """
     A non-realtime state.
@@ -28,6 +356,8 @@ class State(SessionObject):
 
     ### CLASS VARIABLES ###
 
+    _maximum_dict_length = 128
+
     _ordered_buffer_request_types = (BufferZeroRequest,)
 
     ### INITIALIZER ###
@@ -38,8 +368,8 @@ class State(SessionObject):
 
         SessionObject.__init__(self, session)
         self._transitions: Dict[Node, NodeTransition] = collections.OrderedDict()
-        self._nodes_to_children: Dict[Node, Tuple[Node]] = {}
-        self._nodes_to_parents: Dict[Node, Tuple[Node]] = {}
+        self._nodes_to_children: MutableMapping[Node, Tuple[Node]] = {}
+        self._nodes_to_parents: MutableMapping[Node, Node] = {}
         self._start_nodes: Set[Node] = set()
         self._stop_nodes: Set[Node] = set()
         self._start_buffers: Set[Buffer] = set()
@@ -62,11 +392,11 @@ class State(SessionObject):
         stop_nodes=None,
     ):
         if nodes_to_children is not None:
-            nodes_to_children = nodes_to_children.copy()
+            nodes_to_children = cls._copy_node_tree(nodes_to_children)
         else:
             nodes_to_children = {}
         if nodes_to_parents is not None:
-            nodes_to_parents = nodes_to_parents.copy()
+            nodes_to_parents = cls._copy_node_tree(nodes_to_parents)
         else:
             nodes_to_parents = {}
         transitions = transitions or {}
@@ -111,8 +441,8 @@ class State(SessionObject):
         if float("-inf") < self.offset:
             self.session._apply_transitions(self.offset, chain=False)
         state = type(self)(self.session, new_offset)
-        state._nodes_to_children = self.nodes_to_children.copy()
-        state._nodes_to_parents = self.nodes_to_parents.copy()
+        state._nodes_to_children = self._copy_node_tree(self.nodes_to_children)
+        state._nodes_to_parents = self._copy_node_tree(self.nodes_to_parents)
         if new_offset == self.offset:
             state._transitions = self._transitions.copy()
             state._start_buffers.update(self.start_buffers)
@@ -121,14 +451,22 @@ class State(SessionObject):
             state._stop_nodes.update(self.stop_nodes)
         return state
 
+    @classmethod
+    def _copy_node_tree(cls, mapping):
+        # Small trees copy fastest as dicts, but every state holding a full
+        # copy of a large one costs O(nodes * offsets), so those share structure
+        if type(mapping) is dict and len(mapping) > cls._maximum_dict_length:
+            return CopyOnWriteDict(mapping)
+        return mapping.copy()
+
     def _desparsify(self):
         if self._nodes_to_children is not None:
             return
         previous_state = self.session._find_state_before(
             self.offset, with_node_tree=True
         )
-        self._nodes_to_children = previous_state.nodes_to_children.copy()
-        self._nodes_to_parents = previous_state.nodes_to_parents.copy()
+        self._nodes_to_children = self._copy_node_tree(previous_state.nodes_to_children)
+        self._nodes_to_parents = self._copy_node_tree(previous_state.nodes_to_parents)
 
     def _sparsify(self):
         if self.is_sparse:
@@ -187,9 +525,10 @@ class State(SessionObject):
     def _rebuild_transitions(cls, state_one, state_two):
         # print('REBUILDING')
         assert state_one.session.root_node is state_two.session.root_node
-        a_children = state_one.nodes_to_children.copy()
-        a_parents = state_one.nodes_to_parents.copy()
-        b_children, b_parents = a_children.copy(), a_parents.copy()
+        a_children = cls._copy_node_tree(state_one.nodes_to_children)
+        a_parents = cls._copy_node_tree(state_one.nodes_to_parents)
+        b_children = cls._copy_node_tree(a_children)
+        b_parents = cls._copy_node_tree(a_parents)
         stop_nodes = state_two.stop_nodes
         transitions = collections.OrderedDict()
         counter = 0
@@ -252,13 +591,13 @@ class State(SessionObject):
     @property
     def nodes_to_children(
         self,
-    ) -> Dict["supriya.nonrealtime.Node", Tuple["supriya.nonrealtime.Node"]]:
+    ) -> MutableMapping["supriya.nonrealtime.Node", Tuple["supriya.nonrealtime.Node"]]:
         return self._nodes_to_children
 
     @property
     def nodes_to_parents(
         self,
-    ) -> Dict["supriya.nonrealtime.Node", Tuple["supriya.nonrealtime.Node"]]:
+    ) -> MutableMapping["supriya.nonrealtime.Node", "supriya.nonrealtime.Node"]:
         return self._nodes_to_parents
 
     @property
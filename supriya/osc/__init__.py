@@ -2,8 +2,8 @@
 Tools for sending, receiving and handling OSC messages.
 """
 
-from .captures import Capture, CaptureEntry
-from .messages import OscBundle, OscMessage
+from .captures import Capture, CaptureEntry, RingCapture
+from .messages import OscBundle, OscMessage, OscMessageTemplate
 from .protocols import (
     AsyncOscProtocol,
     HealthCheck,
@@ -21,7 +21,9 @@ __all__ = [
     "OscBundle",
     "OscCallback",
     "OscMessage",
+    "OscMessageTemplate",
     "OscProtocol",
+    "RingCapture",
     "ThreadedOscProtocol",
     "find_free_port",
 ]
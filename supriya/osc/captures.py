@@ -1,6 +1,14 @@
-from typing import NamedTuple, Union
+import array
+import itertools
+import pathlib
+import struct
+import time
+from typing import List, NamedTuple, Union
 
-from .messages import OscBundle, OscMessage
+from .messages import BUNDLE_PREFIX, OscBundle, OscMessage
+
+CAPTURE_FILE_MAGIC = b"SPCAPT01"
+CAPTURE_RECORD = struct.Struct(">dcI")
 
 
 class CaptureEntry(NamedTuple):
@@ -33,13 +41,62 @@ class Capture:
     def __len__(self):
         return len(self.messages)
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _decode(datagram):
+        if datagram.startswith(BUNDLE_PREFIX):
+            return OscBundle.from_datagram(datagram)
+        return OscMessage.from_datagram(datagram)
+
+    def _iterate_datagrams(self):
+        for timestamp, label, message in self:
+            yield timestamp, label, message.to_datagram()
+
+    def _record(self, label, message, datagram):
+        self.messages.append(
+            CaptureEntry(timestamp=time.time(), label=label, message=message)
+        )
+
+    ### PUBLIC METHODS ###
+
+    def dump(self, path) -> None:
+        """
+        Write the capture to ``path`` as length-prefixed raw datagrams.
+        """
+        with pathlib.Path(path).open("wb") as file_pointer:
+            file_pointer.write(CAPTURE_FILE_MAGIC)
+            for timestamp, label, datagram in self._iterate_datagrams():
+                file_pointer.write(
+                    CAPTURE_RECORD.pack(timestamp, label.encode(), len(datagram))
+                )
+                file_pointer.write(datagram)
+
+    @classmethod
+    def load(cls, path) -> List[CaptureEntry]:
+        """
+        Read capture entries written by :py:meth:`dump`.
+        """
+        data = pathlib.Path(path).read_bytes()
+        if not data.startswith(CAPTURE_FILE_MAGIC):
+            raise ValueError(f"{path} is not a capture file")
+        entries = []
+        index = len(CAPTURE_FILE_MAGIC)
+        while index < len(data):
+            timestamp, label, length = CAPTURE_RECORD.unpack_from(data, index)
+            index += CAPTURE_RECORD.size
+            message = cls._decode(data[index : index + length])
+            entries.append(CaptureEntry(timestamp, label.decode(), message))
+            index += length
+        return entries
+
     ### PUBLIC PROPERTIES ###
 
     @property
     def received_messages(self):
         return [
             (timestamp, osc_message)
-            for timestamp, label, osc_message in self.messages
+            for timestamp, label, osc_message in self
             if label == "R"
         ]
 
@@ -47,6 +104,85 @@ class Capture:
     def sent_messages(self):
         return [
             (timestamp, osc_message)
-            for timestamp, label, osc_message in self.messages
+            for timestamp, label, osc_message in self
             if label == "S"
         ]
+
+
+class RingCapture(Capture):
+    """
+    A fixed-capacity capture.
+
+    Raw datagrams, labels and monotonic timestamps are stored in preallocated
+    slots, overwriting the oldest entries once ``capacity`` is reached.
+    Datagrams are only decoded when the capture is iterated. Slots are claimed
+    with an atomic counter, so recording takes no lock.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, osc_protocol, capacity: int):
+        if capacity < 1:
+            raise ValueError(capacity)
+        self.osc_protocol = osc_protocol
+        self.capacity = capacity
+        self._datagrams: List[bytes] = [b""] * capacity
+        self._labels = bytearray(capacity)
+        self._sequence_numbers = array.array("q", [-1]) * capacity
+        self._timestamps = array.array("d", [0.0]) * capacity
+        self._reset()
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self):
+        self._reset()
+        self.osc_protocol.captures.add(self)
+        return self
+
+    def __iter__(self):
+        for timestamp, label, datagram in self._iterate_datagrams():
+            yield CaptureEntry(timestamp, label, self._decode(datagram))
+
+    def __len__(self):
+        return sum(1 for x in self._sequence_numbers if x >= 0)
+
+    ### PRIVATE METHODS ###
+
+    def _iterate_datagrams(self):
+        # Monotonic timestamps are converted to wall-clock time relative to
+        # when the capture was (re)started.
+        offset = self._wall_clock_start - self._monotonic_start
+        slots = sorted(
+            (sequence_number, slot)
+            for slot, sequence_number in enumerate(self._sequence_numbers)
+            if sequence_number >= 0
+        )
+        for _, slot in slots:
+            yield (
+                self._timestamps[slot] + offset,
+                chr(self._labels[slot]),
+                self._datagrams[slot],
+            )
+
+    def _record(self, label, message, datagram):
+        sequence_number = next(self._counter)
+        slot = sequence_number % self.capacity
+        self._sequence_numbers[slot] = -1
+        self._timestamps[slot] = time.monotonic()
+        self._labels[slot] = ord(label)
+        self._datagrams[slot] = datagram
+        self._sequence_numbers[slot] = sequence_number
+
+    def _reset(self):
+        self._counter = itertools.count()
+        self._monotonic_start = time.monotonic()
+        self._wall_clock_start = time.time()
+        for slot in range(self.capacity):
+            self._sequence_numbers[slot] = -1
+            self._datagrams[slot] = b""
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def messages(self):
+        return list(self)
@@ -1,6 +1,7 @@
 import collections
 import datetime
 import enum
+import functools
 import struct
 import time
 from collections.abc import Sequence
@@ -18,6 +19,70 @@ NTP_EPOCH = datetime.date(1900, 1, 1)
 NTP_DELTA = (SYSTEM_EPOCH - NTP_EPOCH).days * 24 * 3600
 
 
+def _scalar_signature(contents):
+    """
+    Build a struct signature and packable values for scalar message contents.
+
+    Strings appear in the signature as their padded byte width. Returns ``None``
+    if any value requires the generic encoder (blobs, arrays, nested messages,
+    enums or other subclasses).
+    """
+    signature = []
+    values = []
+    for value in contents:
+        type_ = type(value)
+        if type_ is float:
+            signature.append("f")
+            values.append(value)
+        elif type_ is int:
+            signature.append("i")
+            values.append(value)
+        elif type_ is str:
+            encoded = value.encode("ascii")
+            signature.append((len(encoded) // 4 + 1) * 4)
+            values.append(encoded)
+        elif type_ is bool:
+            signature.append("T" if value else "F")
+        elif value is None:
+            signature.append("N")
+        else:
+            return None, None
+    return tuple(signature), values
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_scalar_struct(address, signature):
+    """
+    Compile the struct and constant prefix values for an address and signature.
+    """
+    if isinstance(address, str):
+        encoded_address = OscMessage._encode_string(address)
+        formats = [">{}s".format(len(encoded_address))]
+    else:
+        encoded_address = address
+        formats = [">i"]
+    type_tags = ","
+    for item in signature:
+        if isinstance(item, int):
+            type_tags += "s"
+            formats.append("{}s".format(item))
+        else:
+            type_tags += item
+            if item in "fi":
+                formats.append(item)
+    encoded_type_tags = OscMessage._encode_string(type_tags)
+    formats.insert(1, "{}s".format(len(encoded_type_tags)))
+    return struct.Struct("".join(formats)), (encoded_address, encoded_type_tags)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_run_struct(type_tag, count):
+    """
+    Compile the struct for a run of ``count`` ints or floats.
+    """
+    return struct.Struct(">{}{}".format(count, type_tag))
+
+
 class OscMessage(SupriyaValueObject):
     """
     An OSC message.
@@ -115,19 +180,80 @@ class OscMessage(SupriyaValueObject):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _decode(cls, datagram, index, stop):
+        address, index = cls._decode_string(datagram, index)
+        type_tags, index = cls._decode_string(datagram, index)
+        contents = []
+        array_stack = [contents]
+        tag_index, tag_count = 1, len(type_tags)
+        while tag_index < tag_count:
+            type_tag = type_tags[tag_index]
+            tag_index += 1
+            if type_tag == "i" or type_tag == "f":
+                # Runs of ints or floats, e.g. /b_setn or /c_setn payloads, are
+                # unpacked with a single call.
+                run_stop = tag_index
+                while run_stop < tag_count and type_tags[run_stop] == type_tag:
+                    run_stop += 1
+                run_struct = _compile_run_struct(type_tag, run_stop - tag_index + 1)
+                array_stack[-1].extend(run_struct.unpack_from(datagram, index))
+                index += run_struct.size
+                tag_index = run_stop
+            elif type_tag == "d":
+                array_stack[-1].append(struct.unpack_from(">d", datagram, index)[0])
+                index += 8
+            elif type_tag == "s":
+                value, index = cls._decode_string(datagram, index)
+                array_stack[-1].append(value)
+            elif type_tag == "b":
+                value, index = cls._decode_blob(datagram, index)
+                array_stack[-1].append(cls._decode_blob_contents(value))
+            elif type_tag == "T":
+                array_stack[-1].append(True)
+            elif type_tag == "F":
+                array_stack[-1].append(False)
+            elif type_tag == "N":
+                array_stack[-1].append(None)
+            elif type_tag == "[":
+                array = []
+                array_stack[-1].append(array)
+                array_stack.append(array)
+            elif type_tag == "]":
+                array_stack.pop()
+            else:
+                raise RuntimeError(f"Unable to parse type {type_tag!r}")
+        if index > stop:
+            raise ValueError("datagram is truncated")
+        return cls(address, *contents)
+
     @staticmethod
-    def _decode_blob(data):
-        actual_length, remainder = struct.unpack(">I", data[:4])[0], data[4:]
-        padded_length = actual_length
-        if actual_length % 4 != 0:
-            padded_length = (actual_length // 4 + 1) * 4
-        return remainder[:padded_length][:actual_length], remainder[padded_length:]
+    def _decode_blob(datagram, index):
+        length = struct.unpack_from(">I", datagram, index)[0]
+        index += 4
+        value = bytes(datagram[index : index + length])
+        if length % 4 != 0:
+            length = (length // 4 + 1) * 4
+        return value, index + length
 
     @staticmethod
-    def _decode_string(data):
-        actual_length = data.index(b"\x00")
-        padded_length = (actual_length // 4 + 1) * 4
-        return str(data[:actual_length], "ascii"), data[padded_length:]
+    def _decode_blob_contents(value):
+        # Only blobs that look like bundles or messages are decoded, instead
+        # of speculatively decoding every blob (e.g. compiled synthdefs).
+        try:
+            if value.startswith(BUNDLE_PREFIX):
+                return OscBundle.from_datagram(value)
+            if value.startswith(b"/"):
+                return OscMessage.from_datagram(value)
+        except (IndexError, RuntimeError, ValueError, struct.error):
+            pass
+        return value
+
+    @staticmethod
+    def _decode_string(datagram, index):
+        stop = datagram.index(b"\x00", index)
+        value = str(datagram[index:stop], "ascii")
+        return value, index + ((stop - index) // 4 + 1) * 4
 
     @staticmethod
     def _encode_string(value):
@@ -180,9 +306,7 @@ class OscMessage(SupriyaValueObject):
             raise TypeError(message)
         return type_tags, encoded_value
 
-    ### PUBLIC METHODS ###
-
-    def to_datagram(self) -> bytes:
+    def _to_datagram_generic(self) -> bytes:
         # address can be a string or (in SuperCollider) an int
         if isinstance(self.address, str):
             encoded_address = self._encode_string(self.address)
@@ -198,50 +322,22 @@ class OscMessage(SupriyaValueObject):
             encoded_address + self._encode_string(encoded_type_tags) + encoded_contents
         )
 
+    ### PUBLIC METHODS ###
+
+    def to_datagram(self) -> bytes:
+        # Messages of plain ints, floats, strings, bools and Nones are packed in
+        # one call with a struct cached per address and argument signature.
+        signature, values = _scalar_signature(self.contents)
+        if signature is None:
+            return self._to_datagram_generic()
+        compiled_struct, prefix = _compile_scalar_struct(self.address, signature)
+        return compiled_struct.pack(*prefix, *values)
+
     @classmethod
     def from_datagram(cls, datagram):
-        remainder = datagram
-        address, remainder = cls._decode_string(remainder)
-        type_tags, remainder = cls._decode_string(remainder)
-        contents = []
-        array_stack = [contents]
-        for type_tag in type_tags[1:]:
-            if type_tag == "i":
-                value, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "f":
-                value, remainder = struct.unpack(">f", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "d":
-                value, remainder = struct.unpack(">d", remainder[:8])[0], remainder[8:]
-                array_stack[-1].append(value)
-            elif type_tag == "s":
-                value, remainder = cls._decode_string(remainder)
-                array_stack[-1].append(value)
-            elif type_tag == "b":
-                value, remainder = cls._decode_blob(remainder)
-                for class_ in (OscBundle, OscMessage):
-                    try:
-                        value = class_.from_datagram(value)
-                        break
-                    except Exception:
-                        pass
-                array_stack[-1].append(value)
-            elif type_tag == "T":
-                array_stack[-1].append(True)
-            elif type_tag == "F":
-                array_stack[-1].append(False)
-            elif type_tag == "N":
-                array_stack[-1].append(None)
-            elif type_tag == "[":
-                array = []
-                array_stack[-1].append(array)
-                array_stack.append(array)
-            elif type_tag == "]":
-                array_stack.pop()
-            else:
-                raise RuntimeError(f"Unable to parse type {type_tag!r}")
-        return cls(address, *contents)
+        if isinstance(datagram, memoryview):
+            datagram = datagram.tobytes()
+        return cls._decode(datagram, 0, len(datagram))
 
     def to_list(self):
         result = [self.address]
@@ -253,6 +349,154 @@ class OscMessage(SupriyaValueObject):
         return result
 
 
+class OscMessageTemplate:
+    """
+    A precompiled OSC message shape.
+
+    Contents may mix constant values with ``int`` or ``float`` slots. The
+    address, type tags, padding and constant arguments are encoded once, and
+    only the slot values are packed when rendering.
+
+    ..  container:: example
+
+        ::
+
+            >>> from supriya.osc import OscMessage, OscMessageTemplate
+            >>> template = OscMessageTemplate(
+            ...     "/n_set", int, "frequency", float, "amplitude", float
+            ... )
+            >>> template
+            OscMessageTemplate('/n_set', int, 'frequency', float, 'amplitude', float)
+
+        ::
+
+            >>> template.to_osc_message(1000, 443.0, 0.5)
+            OscMessage('/n_set', 1000, 'frequency', 443.0, 'amplitude', 0.5)
+
+        ::
+
+            >>> datagram = template.to_datagram(1000, 443.0, 0.5)
+            >>> datagram == template.to_osc_message(1000, 443.0, 0.5).to_datagram()
+            True
+
+    ..  container:: example
+
+        Templates can write directly into a preallocated buffer:
+
+        ::
+
+            >>> buffer = bytearray(template.size * 2)
+            >>> offset = template.pack_into(buffer, 0, 1000, 443.0, 0.5)
+            >>> offset = template.pack_into(buffer, offset, 1001, 220.0, 0.25)
+            >>> offset == len(buffer)
+            True
+            >>> OscMessage.from_datagram(bytes(buffer[template.size :]))
+            OscMessage('/n_set', 1001, 'frequency', 220.0, 'amplitude', 0.25)
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_arguments", "_slot_types", "_struct", "address", "contents")
+
+    ### INITIALIZER ###
+
+    def __init__(self, address, *contents):
+        if isinstance(address, enum.Enum):
+            address = address.value
+        if isinstance(address, str):
+            chunk = OscMessage._encode_string(address)
+        elif isinstance(address, int):
+            chunk = struct.pack(">i", address)
+        else:
+            raise ValueError(f"address must be int or str, got {address}")
+        self.address = address
+        self.contents = tuple(contents)
+        type_tags = ","
+        encoded_contents = []
+        slot_types = []
+        for value in self.contents:
+            if value is int or value is float:
+                type_tag = "i" if value is int else "f"
+                encoded_contents.append(type_tag)
+                slot_types.append(value)
+                type_tags += type_tag
+                continue
+            type_tag, encoded_value = OscMessage._encode_value(value)
+            type_tags += type_tag
+            encoded_contents.append(encoded_value)
+        # Constant bytes between slots are coalesced into single "s" fields, so
+        # rendering is one pack call over alternating chunks and slot values.
+        chunk += OscMessage._encode_string(type_tags)
+        formats = [">"]
+        arguments = []
+        for encoded_value in encoded_contents:
+            if isinstance(encoded_value, bytes):
+                chunk += encoded_value
+                continue
+            formats.append("{}s{}".format(len(chunk), encoded_value))
+            arguments.extend((chunk, None))
+            chunk = b""
+        formats.append("{}s".format(len(chunk)))
+        arguments.append(chunk)
+        self._arguments = arguments
+        self._slot_types = tuple(slot_types)
+        self._struct = struct.Struct("".join(formats))
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                x.__name__ if x is int or x is float else repr(x)
+                for x in (self.address,) + self.contents
+            ),
+        )
+
+    ### PRIVATE METHODS ###
+
+    def _get_arguments(self, values):
+        if len(values) != len(self._slot_types):
+            raise ValueError(
+                "Expected {} values, got {}".format(len(self._slot_types), len(values))
+            )
+        arguments = self._arguments[:]
+        arguments[1::2] = values
+        return arguments
+
+    ### PUBLIC METHODS ###
+
+    def pack_into(self, buffer, offset, *values) -> int:
+        """
+        Write a rendered datagram into ``buffer`` at ``offset``.
+
+        Returns the offset immediately after the written datagram.
+        """
+        self._struct.pack_into(buffer, offset, *self._get_arguments(values))
+        return offset + self._struct.size
+
+    def to_datagram(self, *values) -> bytes:
+        return self._struct.pack(*self._get_arguments(values))
+
+    def to_osc_message(self, *values) -> OscMessage:
+        values_iterator = iter(self._get_arguments(values)[1::2])
+        contents = []
+        for value in self.contents:
+            if value is int:
+                value = next(values_iterator)
+            elif value is float:
+                value = float(next(values_iterator))
+            contents.append(value)
+        return OscMessage(self.address, *contents)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def size(self) -> int:
+        return self._struct.size
+
+
 class OscBundle(SupriyaValueObject):
     """
     An OSC bundle.
@@ -348,13 +592,30 @@ class OscBundle(SupriyaValueObject):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _decode(cls, datagram, index, stop):
+        if not datagram.startswith(BUNDLE_PREFIX, index):
+            raise ValueError("datagram is not a bundle")
+        timestamp, index = cls._decode_date(datagram, index + 8)
+        contents = []
+        while index < stop:
+            length = struct.unpack_from(">i", datagram, index)[0]
+            index += 4
+            if datagram.startswith(BUNDLE_PREFIX, index):
+                item = cls._decode(datagram, index, index + length)
+            else:
+                item = OscMessage._decode(datagram, index, index + length)
+            contents.append(item)
+            index += length
+        return cls(timestamp=timestamp, contents=tuple(contents))
+
     @staticmethod
-    def _decode_date(data):
-        data, remainder = data[:8], data[8:]
+    def _decode_date(datagram, index):
+        data = datagram[index : index + 8]
         if data == IMMEDIATELY:
-            return None, remainder
+            return None, index + 8
         date = (struct.unpack(">Q", data)[0] / SECONDS_TO_NTP_TIMESTAMP) - NTP_DELTA
-        return date, remainder
+        return date, index + 8
 
     @staticmethod
     def _encode_date(seconds, realtime=True):
@@ -370,21 +631,9 @@ class OscBundle(SupriyaValueObject):
 
     @classmethod
     def from_datagram(cls, datagram):
-        if not datagram.startswith(BUNDLE_PREFIX):
-            raise ValueError("datagram is not a bundle")
-        remainder = datagram[8:]
-        timestamp, remainder = cls._decode_date(remainder)
-        contents = []
-        while len(remainder):
-            length, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-            if remainder.startswith(BUNDLE_PREFIX):
-                item = cls.from_datagram(remainder[:length])
-            else:
-                item = OscMessage.from_datagram(remainder[:length])
-            contents.append(item)
-            remainder = remainder[length:]
-        osc_bundle = cls(timestamp=timestamp, contents=tuple(contents))
-        return osc_bundle
+        if isinstance(datagram, memoryview):
+            datagram = datagram.tobytes()
+        return cls._decode(datagram, 0, len(datagram))
 
     @classmethod
     def partition(cls, messages, timestamp=None):
@@ -4,14 +4,17 @@ import dataclasses
 import inspect
 import logging
 import queue
+import socket
 import socketserver
+import struct
+import sys
 import threading
 import time
 from collections.abc import Sequence
-from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Union
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
-from .captures import Capture, CaptureEntry
-from .messages import OscBundle, OscMessage
+from .captures import Capture, RingCapture
+from .messages import BUNDLE_PREFIX, IMMEDIATELY, OscBundle, OscMessage
 
 osc_protocol_logger = logging.getLogger("supriya.osc.protocol")
 osc_in_logger = logging.getLogger("supriya.osc.in")
@@ -19,6 +22,12 @@ osc_out_logger = logging.getLogger("supriya.osc.out")
 udp_in_logger = logging.getLogger("supriya.udp.in")
 udp_out_logger = logging.getLogger("supriya.udp.out")
 
+_RECV_FLAGS = getattr(socket, "MSG_DONTWAIT", 0)
+
+# Python doesn't expose Linux's SO_RXQ_OVFL, which attaches the socket's count
+# of dropped datagrams to each datagram received.
+_SO_RXQ_OVFL = getattr(socket, "SO_RXQ_OVFL", 40 if sys.platform == "linux" else None)
+
 
 class OscProtocolOffline(Exception):
     pass
@@ -35,6 +44,40 @@ class OscCallback(NamedTuple):
     once: bool = False
 
 
+def _pack_datagrams(datagrams, maximum=8192):
+    """
+    Pack message datagrams into as few immediate bundles as fit under
+    ``maximum`` bytes.
+
+    Bundles and oversized messages pass through unchanged, and a lone message is
+    never wrapped in a bundle.
+    """
+    header = BUNDLE_PREFIX + IMMEDIATELY
+    contents = []
+    size = len(header)
+    for datagram in datagrams:
+        is_unpackable = (
+            datagram.startswith(BUNDLE_PREFIX)
+            or len(header) + 4 + len(datagram) > maximum
+        )
+        if contents and (is_unpackable or size + 4 + len(datagram) > maximum):
+            yield _join_datagrams(header, contents)
+            contents, size = [], len(header)
+        if is_unpackable:
+            yield datagram
+            continue
+        contents.append(datagram)
+        size += 4 + len(datagram)
+    if contents:
+        yield _join_datagrams(header, contents)
+
+
+def _join_datagrams(header, contents):
+    if len(contents) == 1:
+        return contents[0]
+    return header + b"".join(struct.pack(">i", len(x)) + x for x in contents)
+
+
 @dataclasses.dataclass
 class HealthCheck:
     request_pattern: List[str]
@@ -50,14 +93,19 @@ class OscProtocol:
     ### INITIALIZER ###
 
     def __init__(self) -> None:
-        self.callbacks: Dict[Any, Any] = {}
+        self.callbacks: Dict[Tuple, Dict[int, OscCallback]] = {}
         self.captures: Set[Capture] = set()
         self.healthcheck = None
         self.healthcheck_osc_callback = None
         self.attempts = 0
+        self.datagrams_received = 0
+        self.datagrams_sent = 0
         self.ip_address = None
         self.is_running: bool = False
+        self.messages_sent = 0
         self.port = None
+        self._max_pattern_length = 0
+        self._pattern_lengths: Dict[int, int] = {}
 
     ### PRIVATE METHODS ###
 
@@ -66,43 +114,49 @@ class OscProtocol:
         if callback.failure_pattern:
             patterns.append(callback.failure_pattern)
         for pattern in patterns:
-            callback_map = self.callbacks
-            for item in pattern:
-                callbacks, callback_map = callback_map.setdefault(item, ([], {}))
-            callbacks.append(callback)
+            pattern = tuple(pattern)
+            if pattern not in self.callbacks:
+                self.callbacks[pattern] = {}
+                length = len(pattern)
+                self._pattern_lengths[length] = self._pattern_lengths.get(length, 0) + 1
+                self._max_pattern_length = max(self._max_pattern_length, length)
+            self.callbacks[pattern][id(callback)] = callback
 
     def _match_callbacks(self, message):
+        # Callbacks are indexed by their full pattern, so matching is one dict
+        # lookup per message prefix, up to the longest registered pattern.
         items = (message.address,) + message.contents
         matching_callbacks = []
-        callback_map = self.callbacks
-        for item in items:
-            if item not in callback_map:
+        for length in range(1, min(len(items), self._max_pattern_length) + 1):
+            try:
+                callbacks = self.callbacks.get(items[:length])
+            except TypeError:  # unhashable contents, e.g. arrays
                 break
-            callbacks, callback_map = callback_map[item]
-            matching_callbacks.extend(callbacks)
+            if callbacks:
+                matching_callbacks.extend(callbacks.values())
         for callback in matching_callbacks:
             if callback.once:
-                self.unregister(callback)
+                self._remove_callback(callback)
         return matching_callbacks
 
     def _remove_callback(self, callback: OscCallback):
-        def delete(pattern, original_callback_map):
-            key = pattern.pop(0)
-            if key not in original_callback_map:
-                return
-            callbacks, callback_map = original_callback_map[key]
-            if pattern:
-                delete(pattern, callback_map)
-            if callback in callbacks:
-                callbacks.remove(callback)
-            if not callbacks and not callback_map:
-                original_callback_map.pop(key)
-
         patterns = [callback.pattern]
         if callback.failure_pattern:
             patterns.append(callback.failure_pattern)
         for pattern in patterns:
-            delete(list(pattern), self.callbacks)
+            pattern = tuple(pattern)
+            callbacks = self.callbacks.get(pattern)
+            if callbacks is None:
+                continue
+            callbacks.pop(id(callback), None)
+            if callbacks:
+                continue
+            del self.callbacks[pattern]
+            length = len(pattern)
+            self._pattern_lengths[length] -= 1
+            if not self._pattern_lengths[length]:
+                del self._pattern_lengths[length]
+                self._max_pattern_length = max(self._pattern_lengths, default=0)
 
     def _pass_healthcheck(self, message):
         osc_protocol_logger.info(f"{self.ip_address}:{self.port} ...healthcheck passed")
@@ -141,19 +195,18 @@ class OscProtocol:
 
     def _validate_receive(self, datagram):
         udp_in_logger.debug(f"{self.ip_address}:{self.port} {datagram}")
+        self.datagrams_received += 1
         try:
             message = OscMessage.from_datagram(datagram)
         except Exception:
             raise
         osc_in_logger.debug(f"{self.ip_address}:{self.port} {message!r}")
         for capture in self.captures:
-            capture.messages.append(
-                CaptureEntry(timestamp=time.time(), label="R", message=message)
-            )
+            capture._record("R", message, datagram)
         for callback in self._match_callbacks(message):
             yield callback.procedure, message
 
-    def _validate_send(self, message):
+    def _validate_send(self, message, datagram=None):
         if not self.is_running:
             raise OscProtocolOffline
         if not isinstance(message, (str, Sequence, OscBundle, OscMessage)):
@@ -163,17 +216,25 @@ class OscProtocol:
         elif isinstance(message, Sequence):
             message = OscMessage(*message)
         osc_out_logger.debug(f"{self.ip_address}:{self.port} {message!r}")
+        if datagram is None:
+            datagram = message.to_datagram()
         for capture in self.captures:
-            capture.messages.append(
-                CaptureEntry(timestamp=time.time(), label="S", message=message)
-            )
-        datagram = message.to_datagram()
+            capture._record("S", message, datagram)
         udp_out_logger.debug(f"{self.ip_address}:{self.port} {datagram}")
+        self.messages_sent += 1
         return datagram
 
     ### PUBLIC METHODS ###
 
-    def capture(self):
+    def capture(self, capacity: Optional[int] = None) -> Capture:
+        """
+        Capture sent and received messages.
+
+        If ``capacity`` is set, only the most recent ``capacity`` datagrams are
+        kept, in a preallocated ring buffer.
+        """
+        if capacity is not None:
+            return RingCapture(self, capacity)
         return Capture(self)
 
     def register(
@@ -186,17 +247,37 @@ class OscProtocol:
 
 
 class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
+    """
+    An asyncio-based OSC protocol.
+
+    If ``batch_window`` is not ``None``, sent messages are queued and flushed
+    together after ``batch_window`` seconds (or at the end of the current event
+    loop tick for ``0.0``), packed into as few immediate bundles as fit in a
+    single datagram.
+    """
 
     ### INITIALIZER ###
 
-    def __init__(self):
+    def __init__(self, *, batch_window: Optional[float] = None):
         asyncio.DatagramProtocol.__init__(self)
         OscProtocol.__init__(self)
         self.loop = None
         self.background_tasks = set()
+        self.batch_window = batch_window
+        self._flush_handle = None
+        self._pending_datagrams: List[bytes] = []
 
     ### PRIVATE METHODS ###
 
+    def _flush(self):
+        self._flush_handle = None
+        datagrams, self._pending_datagrams = self._pending_datagrams, []
+        if not self.is_running or self.transport.is_closing():
+            return
+        for datagram in _pack_datagrams(datagrams):
+            self.transport.sendto(datagram)
+            self.datagrams_sent += 1
+
     async def _run_healthcheck(self):
         while self.is_running:
             sleep_time = self.healthcheck.timeout * pow(
@@ -250,6 +331,9 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
     async def disconnect(self):
         if not self.is_running:
             return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush()
         self.exit_future.set_result(True)
         self._teardown()
         if self.loop.is_closed():
@@ -271,9 +355,19 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         self._add_callback(callback)
         return callback
 
-    def send(self, message):
-        datagram = self._validate_send(message)
-        return self.transport.sendto(datagram)
+    def send(self, message, datagram=None):
+        datagram = self._validate_send(message, datagram)
+        if self.batch_window is None:
+            self.datagrams_sent += 1
+            return self.transport.sendto(datagram)
+        self._pending_datagrams.append(datagram)
+        if self._flush_handle is None:
+            if self.batch_window:
+                self._flush_handle = self.loop.call_later(
+                    self.batch_window, self._flush
+                )
+            else:
+                self._flush_handle = self.loop.call_soon(self._flush)
 
     def unregister(self, callback: OscCallback):
         self._remove_callback(callback)
@@ -290,6 +384,16 @@ class ThreadedOscServer(socketserver.UDPServer):
         self.osc_protocol._run_healthcheck()
 
 
+class ThreadedOscBulkServer(ThreadedOscServer):
+    """
+    A UDP server which drains every ready datagram per wakeup.
+    """
+
+    def _handle_request_noblock(self):
+        self.osc_protocol._process_command_queue()
+        self.osc_protocol._receive_bulk(self.socket, self.max_packet_size)
+
+
 class ThreadedOscHandler(socketserver.BaseRequestHandler):
     def handle(self):
         data = self.request[0]
@@ -298,15 +402,43 @@ class ThreadedOscHandler(socketserver.BaseRequestHandler):
 
 
 class ThreadedOscProtocol(OscProtocol):
+    """
+    A thread-based OSC protocol.
+
+    If ``bulk_receive`` is true, every datagram ready on the socket is drained
+    with non-blocking reads per select wakeup (up to ``max_batch_size``),
+    decoded as a batch and then dispatched, instead of handling one datagram
+    per wakeup. ``receive_buffer_size`` optionally enlarges the kernel receive
+    buffer to absorb notification storms.
+
+    ``decode_errors`` counts bulk-received datagrams which failed to decode.
+    Where the platform reports them (Linux's ``SO_RXQ_OVFL``),
+    ``kernel_drops`` counts datagrams the kernel dropped before they could be
+    received, e.g. when the receive buffer overflowed. Elsewhere, or without
+    ``bulk_receive``, it is none.
+    """
 
     ### INITIALIZER ###
 
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        bulk_receive: bool = False,
+        max_batch_size: int = 256,
+        receive_buffer_size: Optional[int] = None,
+    ):
         OscProtocol.__init__(self)
+        self.bulk_receive = bulk_receive
         self.command_queue = queue.Queue()
+        self.decode_errors = 0
+        self.kernel_drops: Optional[int] = None
         self.lock = threading.RLock()
+        self.max_batch_size = max_batch_size
+        self.max_receive_queue_depth = 0
         self.osc_server = None
         self.osc_server_thread = None
+        self.receive_buffer_size = receive_buffer_size
+        self.receive_queue_depth = 0
         atexit.register(self.disconnect)
 
     ### PRIVATE METHODS ###
@@ -322,6 +454,55 @@ class ThreadedOscProtocol(OscProtocol):
             elif action == "remove":
                 self._remove_callback(callback)
 
+    def _receive_bulk(self, sock, max_packet_size):
+        datagrams = []
+        while len(datagrams) < self.max_batch_size:
+            try:
+                if self.kernel_drops is None:
+                    datagram, _ = sock.recvfrom(max_packet_size, _RECV_FLAGS)
+                else:
+                    datagram, ancillary_data, _, _ = sock.recvmsg(
+                        max_packet_size, socket.CMSG_SPACE(4), _RECV_FLAGS
+                    )
+                    for level, type_, data in ancillary_data:
+                        if level == socket.SOL_SOCKET and type_ == _SO_RXQ_OVFL:
+                            # The kernel's running total for this socket
+                            self.kernel_drops = struct.unpack("=I", data[:4])[0]
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                # E.g. ConnectionResetError on Windows, which must not take
+                # down the server thread, so end the batch instead
+                osc_protocol_logger.exception(
+                    f"{self.ip_address}:{self.port} failed to receive"
+                )
+                break
+            datagrams.append(datagram)
+        # Depth is the number of datagrams waiting at wakeup, i.e. the backlog
+        # accumulated while the previous batch was being dispatched.
+        self.receive_queue_depth = len(datagrams)
+        self.max_receive_queue_depth = max(
+            self.max_receive_queue_depth, self.receive_queue_depth
+        )
+        dispatches = []
+        for datagram in datagrams:
+            try:
+                dispatches.extend(self._validate_receive(datagram))
+            except Exception:
+                osc_protocol_logger.exception(
+                    f"{self.ip_address}:{self.port} dropped {datagram!r}"
+                )
+                self.decode_errors += 1
+        for procedure, message in dispatches:
+            # Bypasses socketserver's own error handling, so one failing
+            # callback mustn't skip the rest of the batch or kill the thread
+            try:
+                procedure(message)
+            except Exception:
+                osc_protocol_logger.exception(
+                    f"{self.ip_address}:{self.port} callback failed on {message!r}"
+                )
+
     def _run_healthcheck(self):
         if self.healthcheck is None:
             return
@@ -350,10 +531,28 @@ class ThreadedOscProtocol(OscProtocol):
         self.healthcheck.callback()
 
     def _server_factory(self, ip_address, port):
-        server = ThreadedOscServer(
+        server_class = ThreadedOscServer
+        if self.bulk_receive:
+            server_class = ThreadedOscBulkServer
+        server = server_class(
             (self.ip_address, self.port), ThreadedOscHandler, bind_and_activate=False
         )
         server.osc_protocol = self
+        if self.receive_buffer_size:
+            server.socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size
+            )
+        self.kernel_drops = None
+        if self.bulk_receive and _SO_RXQ_OVFL is not None:
+            try:
+                server.socket.setsockopt(socket.SOL_SOCKET, _SO_RXQ_OVFL, 1)
+                self.kernel_drops = 0
+            except OSError:
+                pass
+        if self.bulk_receive and not _RECV_FLAGS:
+            # Without MSG_DONTWAIT (e.g. Windows) the whole socket must be
+            # non-blocking to drain it.
+            server.socket.setblocking(False)
         return server
 
     ### PUBLIC METHODS ###
@@ -404,13 +603,14 @@ class ThreadedOscProtocol(OscProtocol):
         self.command_queue.put(("add", callback))
         return callback
 
-    def send(self, message) -> None:
-        datagram = self._validate_send(message)
+    def send(self, message, datagram=None) -> None:
+        datagram = self._validate_send(message, datagram)
         try:
             self.osc_server.socket.sendto(datagram, (self.ip_address, self.port))
         except OSError:
             # print(message)
             raise
+        self.datagrams_sent += 1
 
     def unregister(self, callback: OscCallback) -> None:
         """
@@ -373,7 +373,7 @@ class ProviderMoment:
                 # If waiting, the original ProviderMoment timestamp can be ignored
                 await request_bundle.communicate_async(server=server, sync=True)
             else:
-                server.send(request_bundle.to_osc())
+                server.send(request_bundle)
         else:
             # If over the UDP packet limit, partition the message
             requests = request_bundle.contents
@@ -391,7 +391,7 @@ class ProviderMoment:
                 for bundle in commands.RequestBundle.partition(
                     requests, timestamp=timestamp
                 ):
-                    server.send(bundle.to_osc())
+                    server.send(bundle)
 
     def __enter__(self):
         if self.provider.session is not None:
@@ -406,7 +406,7 @@ class ProviderMoment:
             return
         timestamp, request_bundle, synthdefs = results
         try:
-            self.provider.server.send(request_bundle.to_osc())
+            self.provider.server.send(request_bundle)
         except OSError:
             requests = request_bundle.contents
             if synthdefs:
@@ -417,7 +417,7 @@ class ProviderMoment:
             for bundle in commands.RequestBundle.partition(
                 requests, timestamp=timestamp
             ):
-                self.provider.server.send(bundle.to_osc())
+                self.provider.server.send(bundle)
 
     def _enter(self):
         self.provider._moments.append(self)
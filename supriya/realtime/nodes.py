@@ -243,6 +243,9 @@ class Node(UniqueTreeNode):
         node_id_is_permanent: bool = False,
     ):
         id_allocator = server.node_id_allocator
+        if node_id is None:
+            # Possibly reserved in bulk by Group._collect_requests_and_synthdefs()
+            node_id = self._node_id
         if node_id is None:
             if node_id_is_permanent:
                 node_id = id_allocator.allocate_permanent_node_id()
@@ -638,6 +641,7 @@ class Group(Node, UniqueTreeList):
         paused_nodes = set()
         synthdefs = set()
         requests = []
+        unallocated_nodes = []
         iterator = Group._iterate_setitem_expr(self, expr, start)
         for node, target_node, add_action in iterator:
             nodes.add(node)
@@ -648,6 +652,8 @@ class Group(Node, UniqueTreeList):
                     request = NodeAfterRequest(node_id_pairs=[(node, target_node)])
                 requests.append(request)
             else:
+                if not node.node_id_is_permanent and node.node_id is None:
+                    unallocated_nodes.append(node)
                 if isinstance(node, Group):
                     request_method = GroupNewRequest
                     if node.parallel:
@@ -677,6 +683,10 @@ class Group(Node, UniqueTreeList):
                     requests.extend(map_requests)
                 if node.is_paused:
                     paused_nodes.add(node)
+        # Reserve IDs for all new nodes at once, in the order they'll be added
+        node_ids = server.node_id_allocator.allocate_many(len(unallocated_nodes))
+        for node, node_id in zip(unallocated_nodes, node_ids):
+            node._node_id = node_id
         return nodes, paused_nodes, requests, synthdefs
 
     def _set_allocated(self, expr, start, stop):
@@ -741,6 +751,9 @@ class Group(Node, UniqueTreeList):
         self._node_id_is_permanent = bool(node_id_is_permanent)
         target_node = Node._expr_as_target(target_node)
         server = target_node.server
+        if not self._node_id_is_permanent and self._node_id is None:
+            # Take this group's ID ahead of its children's
+            self._node_id = server.node_id_allocator.allocate_node_id()
         request_method = GroupNewRequest
         if self._parallel:
             request_method = ParallelGroupNewRequest
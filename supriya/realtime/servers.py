@@ -16,6 +16,7 @@ from ..commands import (
     GroupQueryTreeRequest,
     NotifyRequest,
     QuitRequest,
+    Requestable,
     Response,
     StatusResponse,
     SyncRequest,
@@ -174,7 +175,12 @@ class BaseServer:
             raise ValueError
         if not self.is_running:
             raise ServerOffline
-        self._osc_protocol.send(message)
+        if isinstance(message, Requestable):
+            # Requests may render their datagram without encoding a message,
+            # e.g. through a precompiled template.
+            self._osc_protocol.send(message.to_osc(), message.to_datagram())
+        else:
+            self._osc_protocol.send(message)
         return self
 
     ### PUBLIC PROPERTIES ###
@@ -314,7 +320,7 @@ class AsyncServer(BaseServer):
                 GroupNewRequest.Item(1, i, 0) for i in range(1, self.maximum_logins + 1)
             ]
         )
-        self.send(request.to_osc())
+        self.send(request)
 
     async def _setup_notifications(self):
         request = NotifyRequest(True)
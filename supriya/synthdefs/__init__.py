@@ -1,7 +1,9 @@
 """
 Tools for constructing and compiling synthesizer definitions (SynthDefs).
 """
+
 from .builders import SynthDefBuilder, synthdef
+from .caches import SynthDefCache
 from .compilers import SynthDefCompiler, SynthDefDecompiler
 from .controls import AudioControl, Control, LagControl, Parameter, Range, TrigControl
 from .envelopes import Envelope
@@ -23,6 +25,7 @@ __all__ = [
     "SuperColliderSynthDef",
     "SynthDef",
     "SynthDefBuilder",
+    "SynthDefCache",
     "SynthDefCompiler",
     "SynthDefDecompiler",
     "SynthDefFactory",
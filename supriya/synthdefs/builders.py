@@ -1,5 +1,4 @@
 import collections
-import copy
 import inspect
 import threading
 import uuid
@@ -12,6 +11,7 @@ from supriya.system import SupriyaObject
 from supriya.ugens import Impulse, Poll
 
 from ..ugens import OutputProxy, UGen
+from .caches import SynthDefCache
 from .controls import Control, Parameter
 from .synthdefs import SynthDef
 
@@ -144,7 +144,8 @@ class SynthDefBuilder(SupriyaObject):
             ugens: List[Union[Parameter, UGen]] = []
             ugens.extend(self._parameters.values())
             ugens.extend(self._ugens)
-            ugens = copy.deepcopy(ugens)
+            # The copy is private to this build, so the SynthDef can own it
+            ugens = SynthDef._copy_ugens(ugens)
             ugens, parameters = SynthDef._extract_parameters(ugens)
             (
                 control_ugens,
@@ -153,7 +154,7 @@ class SynthDefBuilder(SupriyaObject):
             ) = SynthDef._build_control_mapping(parameters)
             SynthDef._remap_controls(ugens, control_mapping)
             ugens = control_ugens + ugens
-            synthdef = SynthDef(ugens, name=name, optimize=optimize)
+            synthdef = SynthDef._from_ugens(ugens, name=name, optimize=optimize)
         return synthdef
 
     def poll_ugen(
@@ -178,10 +179,15 @@ class SynthDefBuilder(SupriyaObject):
         return self._name
 
 
-def synthdef(*args: Union[str, Tuple[str, float]]):
+def synthdef(
+    *args: Union[str, Tuple[str, float]], cache: Optional[SynthDefCache] = None
+):
     """
     Decorate for quickly constructing SynthDefs from functions.
 
+    Pass a ``SynthDefCache`` as ``cache`` to reuse the SynthDef built from an
+    identical function on a previous run.
+
     ::
 
         >>> from supriya.ugens import EnvGen, Out, SinOsc
@@ -296,7 +302,7 @@ def synthdef(*args: Union[str, Tuple[str, float]]):
 
     """
 
-    def inner(func):
+    def build(func):
         signature = inspect.signature(func)
         builder = SynthDefBuilder()
         kwargs = {}
@@ -320,4 +326,10 @@ def synthdef(*args: Union[str, Tuple[str, float]]):
             func(**kwargs)
         return builder.build(name=func.__name__)
 
+    def inner(func):
+        if cache is None:
+            return build(func)
+        key = cache.get_key(func, args)
+        return cache.get_or_build(key, lambda: build(func))
+
     return inner
@@ -0,0 +1,278 @@
+import enum
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+import types
+from typing import Callable, Optional, Union
+
+from .._version import __version__
+from ..system import SupriyaObject
+from .synthdefs import SynthDef
+
+
+class SynthDefCache(SupriyaObject):
+    """
+    A content-addressed, size-bounded disk cache of built SynthDefs.
+
+    Entries are keyed by a structural hash of whatever a SynthDef is built
+    from, and hold both the compiled ``.scsyndef`` bytes and the pickled
+    SynthDef, so a hit skips building, optimizing and compiling entirely.
+    The least recently used entries are evicted once the cache outgrows
+    ``maximum_size`` bytes.
+
+    ::
+
+        >>> import tempfile
+        >>> from supriya.synthdefs import SynthDefCache, synthdef
+        >>> from supriya.ugens import Out, SinOsc
+        >>> cache = SynthDefCache(tempfile.mkdtemp())
+
+    ::
+
+        >>> @synthdef(cache=cache)
+        ... def sine(frequency=440):
+        ...     Out.ar(bus=0, source=SinOsc.ar(frequency=frequency))
+        ...
+        >>> len(cache)
+        1
+
+    ::
+
+        >>> @synthdef(cache=cache)
+        ... def sine(frequency=440):
+        ...     Out.ar(bus=0, source=SinOsc.ar(frequency=frequency))
+        ...
+        >>> sine
+        <SynthDef: sine>
+
+    ::
+
+        >>> cache.hits, cache.misses
+        (1, 1)
+
+    Keys capture the code of the functions involved but not the globals they
+    read, so clear the cache when those change. Only point caches at
+    directories you trust, as loading an entry unpickles it.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_directory_path", "_hits", "_maximum_size", "_misses", "_size")
+
+    _version = 2
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        directory_path: Optional[Union[os.PathLike, str]] = None,
+        maximum_size: int = 64 * 1024 * 1024,
+    ):
+        if directory_path is None:
+            import supriya
+
+            directory_path = supriya.output_path / "synthdefs"
+        self._directory_path = pathlib.Path(directory_path)
+        self._directory_path.mkdir(parents=True, exist_ok=True)
+        self._maximum_size = int(maximum_size)
+        self._hits = 0
+        self._misses = 0
+        # Estimated, as other processes may share the directory
+        self._size: Optional[int] = None
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key: str) -> bool:
+        return self._get_pickle_path(key).exists()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._directory_path.glob("*.pickle"))
+
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _encode(cls, value) -> bytes:
+        if value is None or isinstance(value, (bool, int, float, str, bytes)):
+            return repr((type(value).__name__, value)).encode()
+        if isinstance(value, enum.Enum):
+            return repr((type(value).__qualname__, value.name)).encode()
+        if isinstance(value, (list, tuple)):
+            return b"(" + b",".join(cls._encode(x) for x in value) + b")"
+        if isinstance(value, (set, frozenset)):
+            return b"{" + b",".join(sorted(cls._encode(x) for x in value)) + b"}"
+        if isinstance(value, dict):
+            items = sorted(
+                cls._encode(key) + b":" + cls._encode(item)
+                for key, item in value.items()
+            )
+            return b"{" + b",".join(items) + b"}"
+        if isinstance(value, types.CodeType):
+            return cls._encode(
+                (value.co_code, value.co_consts, value.co_names, value.co_varnames)
+            )
+        if isinstance(value, types.FunctionType):
+            cells = []
+            for cell in value.__closure__ or ():
+                try:
+                    cells.append(cell.cell_contents)
+                except ValueError:  # Not yet bound
+                    cells.append(None)
+            return cls._encode(
+                (
+                    value.__module__,
+                    value.__qualname__,
+                    value.__code__,
+                    value.__defaults__,
+                    value.__kwdefaults__,
+                    cells,
+                )
+            )
+        if hasattr(value, "__slots__"):
+            slots = [
+                (name, getattr(value, name))
+                for cls_ in type(value).__mro__
+                for name in getattr(cls_, "__slots__", ())
+                if hasattr(value, name)
+            ]
+            return cls._encode((type(value).__qualname__, slots))
+        return repr(value).encode()
+
+    def _evict(self) -> None:
+        # Rescans the directory, so only called when the estimated size is over
+        entries = []
+        total_size = 0
+        for pickle_path in self._directory_path.glob("*.pickle"):
+            paths = (pickle_path, pickle_path.with_suffix(".scsyndef"))
+            try:
+                stats = [path.stat() for path in paths]
+            except FileNotFoundError:
+                continue
+            size = sum(stat.st_size for stat in stats)
+            entries.append((stats[0].st_mtime, size, paths))
+            total_size += size
+        entries.sort(key=lambda x: x[0])
+        for _, size, paths in entries:
+            if total_size <= self._maximum_size:
+                break
+            for path in paths:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            total_size -= size
+        self._size = total_size
+
+    def _get_pickle_path(self, key: str) -> pathlib.Path:
+        return self._directory_path / f"{key}.pickle"
+
+    def _write_atomically(self, path: pathlib.Path, data: bytes) -> None:
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self._directory_path, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as file_pointer:
+                file_pointer.write(data)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    ### PUBLIC METHODS ###
+
+    def clear(self) -> None:
+        for path in self._directory_path.iterdir():
+            if path.suffix in (".pickle", ".scsyndef", ".tmp"):
+                path.unlink()
+        self._size = 0
+
+    def get(self, key: str) -> Optional[SynthDef]:
+        """
+        Get the SynthDef cached under ``key``, otherwise None.
+        """
+        pickle_path = self._get_pickle_path(key)
+        try:
+            synthdef = pickle.loads(pickle_path.read_bytes())
+            # Modification times order entries for eviction
+            os.utime(pickle_path)
+        except FileNotFoundError:
+            self._misses += 1
+            return None
+        except (AttributeError, EOFError, ImportError, pickle.UnpicklingError):
+            # Stale or corrupt, e.g. after a UGen class moved
+            self._misses += 1
+            return None
+        self._hits += 1
+        return synthdef
+
+    def get_key(self, *values) -> str:
+        """
+        Get a key structurally hashing ``values``.
+
+        Functions hash by their code, defaults and closures, and objects with
+        slots by their slots' values. The cache format and supriya versions
+        are always hashed in too.
+
+        ::
+
+            >>> import tempfile
+            >>> from supriya.synthdefs import SynthDefCache, SynthDefFactory
+            >>> cache = SynthDefCache(tempfile.mkdtemp())
+            >>> factory = SynthDefFactory(frequency=440).with_output()
+            >>> cache.get_key(factory) == cache.get_key(factory.with_output())
+            True
+
+        ::
+
+            >>> cache.get_key(factory) == cache.get_key(factory.with_gate())
+            False
+
+        """
+        data = self._encode((self._version, __version__, values))
+        return hashlib.sha256(data).hexdigest()
+
+    def get_or_build(self, key: str, build: Callable[[], SynthDef]) -> SynthDef:
+        """
+        Get the SynthDef cached under ``key``, otherwise build and cache it.
+        """
+        synthdef = self.get(key)
+        if synthdef is None:
+            synthdef = build()
+            self.set(key, synthdef)
+        return synthdef
+
+    def set(self, key: str, synthdef: SynthDef) -> None:
+        """
+        Cache ``synthdef`` under ``key``, evicting least recently used entries
+        if the cache has outgrown its maximum size.
+        """
+        if self._size is None:
+            self._evict()
+        pickle_path = self._get_pickle_path(key)
+        compiled_synthdef = synthdef.compile()
+        pickled_synthdef = pickle.dumps(synthdef)
+        # The .scsyndef lands first, so a present pickle means a whole entry
+        self._write_atomically(pickle_path.with_suffix(".scsyndef"), compiled_synthdef)
+        self._write_atomically(pickle_path, pickled_synthdef)
+        self._size += len(compiled_synthdef) + len(pickled_synthdef)
+        if self._size > self._maximum_size:
+            self._evict()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self) -> pathlib.Path:
+        return self._directory_path
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def maximum_size(self) -> int:
+        return self._maximum_size
+
+    @property
+    def misses(self) -> int:
+        return self._misses
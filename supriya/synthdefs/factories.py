@@ -354,10 +354,16 @@ class SynthDefFactory(SupriyaObject):
 
     ### PUBLIC METHODS ###
 
-    def build(self, name=None, **kwargs):
+    def build(self, name=None, cache=None, **kwargs):
         """
         Build the SynthDef.
+
+        Pass a ``SynthDefCache`` as ``cache`` to reuse SynthDefs previously
+        built from an identically configured factory with the same arguments.
         """
+        if cache is not None:
+            key = cache.get_key(self, name, kwargs)
+            return cache.get_or_build(key, lambda: self.build(name=name, **kwargs))
         builder = SynthDefBuilder()
         state = self._initial_state.copy()
         with builder:
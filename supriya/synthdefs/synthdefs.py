@@ -1,6 +1,7 @@
 import collections
 import copy
 import hashlib
+import logging
 import os
 import pathlib
 import shutil
@@ -29,6 +30,8 @@ from .compilers import SynthDefCompiler
 from .controls import AudioControl, Control, LagControl, Parameter, TrigControl
 from .grapher import SynthDefGrapher
 
+logger = logging.getLogger(__name__)
+
 
 class SynthDef:
     """
@@ -83,29 +86,20 @@ class SynthDef:
 
     __slots__ = (
         "_compiled_ugen_graph",
+        "_constant_indices",
         "_constants",
         "_control_ugens",
         "_indexed_parameters",
         "_name",
+        "_optimization_counts",
+        "_ugen_indices",
         "_ugens",
     )
 
     ### INITIALIZER ###
 
     def __init__(self, ugens, name=None, optimize=True, **kwargs):
-        self._name = name
-        ugens = list(copy.deepcopy(ugens))
-        assert all(isinstance(_, UGen) for _ in ugens)
-        ugens = self._cleanup_pv_chains(ugens)
-        ugens = self._cleanup_local_bufs(ugens)
-        if optimize:
-            ugens = self._optimize_ugen_graph(ugens)
-        ugens = self._sort_ugens_topologically(ugens)
-        self._ugens = tuple(ugens)
-        self._constants = self._collect_constants(self._ugens)
-        self._control_ugens = self._collect_control_ugens(self._ugens)
-        self._indexed_parameters = self._collect_indexed_parameters(self._control_ugens)
-        self._compiled_ugen_graph = SynthDefCompiler.compile_ugen_graph(self)
+        self._initialize(self._copy_ugens(ugens), name=name, optimize=optimize)
 
     ### SPECIAL METHODS ###
 
@@ -481,13 +475,11 @@ class SynthDef:
 
     @staticmethod
     def _collect_constants(ugens) -> Tuple[float, ...]:
-        constants = []
+        constants: Dict[float, None] = {}
         for ugen in ugens:
             for input_ in ugen._inputs:
-                if not isinstance(input_, float):
-                    continue
-                if input_ not in constants:
-                    constants.append(input_)
+                if isinstance(input_, float):
+                    constants.setdefault(input_)
         return tuple(constants)
 
     @staticmethod
@@ -509,6 +501,43 @@ class SynthDef:
         indexed_parameters = tuple(indexed_parameters)
         return indexed_parameters
 
+    @staticmethod
+    def _copy_ugens(ugens):
+        """
+        Copy the graph of ``ugens`` in a single pass.
+
+        Optimization only rewrites UGens by reassigning their inputs, so each
+        UGen is copied shallowly with its inputs remapped onto the copies.
+        Parameters and everything else are shared, unlike with a deep copy.
+        """
+
+        def copy_ugen(ugen):
+            copied_ugen = copy.copy(ugen)
+            inputs = []
+            for input_ in ugen._inputs:
+                if isinstance(input_, OutputProxy) and isinstance(input_.source, UGen):
+                    if input_.source in copied_ugens:
+                        source = copied_ugens[input_.source]
+                    else:
+                        source = copy_ugen(input_.source)
+                    input_ = source[input_.output_index]
+                inputs.append(input_)
+            # Some UGens still hold a list, which they mutate in place
+            copied_ugen._inputs = type(ugen._inputs)(inputs)
+            copied_ugens[ugen] = copied_ugen
+            return copied_ugen
+
+        copied_ugens: Dict[UGen, UGen] = {}
+        copied = []
+        for ugen in ugens:
+            if isinstance(ugen, UGen):
+                if ugen in copied_ugens:
+                    ugen = copied_ugens[ugen]
+                else:
+                    ugen = copy_ugen(ugen)
+            copied.append(ugen)
+        return copied
+
     @staticmethod
     def _extract_parameters(ugens):
         parameters = set()
@@ -519,6 +548,196 @@ class SynthDef:
         parameters = tuple(sorted(parameters, key=lambda x: x.name))
         return ugens, parameters
 
+    @classmethod
+    def _from_ugens(cls, ugens, name=None, optimize=True):
+        """
+        Build a SynthDef which takes ownership of ``ugens``, without copying.
+
+        The UGens are rewritten in place, so callers must not reuse them.
+        """
+        synthdef = cls.__new__(cls)
+        synthdef._initialize(list(ugens), name=name, optimize=optimize)
+        return synthdef
+
+    @staticmethod
+    def _fuse_ugens(ugens, sort_bundles):
+        """
+        Fuse additions into ``MulAdd``, ``Sum3`` and ``Sum4`` UGens, as
+        sclang's ``BinaryOpUGen.optimizeAdd`` does.
+
+        An addition absorbs an addition, ``Sum3`` or multiplication input only
+        when that input has no other descendant. The fused UGen takes the
+        addition's place, and descendant counts are not updated during the
+        pass, matching sclang's byte output.
+
+        Returns the remaining UGens and the count of fused UGens.
+        """
+        from ..ugens import MulAdd, Sum3, Sum4
+        from .builders import SynthDefBuilder
+
+        def get_fusable_source(input_, classes, operator=None):
+            if not isinstance(input_, OutputProxy):
+                return None
+            source = input_.source
+            if not isinstance(source, classes) or source in fused_sources:
+                return None
+            if operator is not None and source.operator != operator:
+                return None
+            if descendant_counts[source] != 1:
+                return None
+            return source
+
+        def is_constant(input_, values):
+            return not isinstance(input_, OutputProxy) and input_ in values
+
+        def new_fused_ugen(ugen_class, **kwargs):
+            fused_ugen = ugen_class(**kwargs)
+            # SynthDefs are built under their builder, which must not collect
+            # fused UGens into its graph, or later builds would copy them too.
+            if SynthDefBuilder._active_builders:
+                builder_ugens = SynthDefBuilder._active_builders[-1]._ugens
+                if builder_ugens and builder_ugens[-1] is fused_ugen:
+                    builder_ugens.pop()
+            return fused_ugen
+
+        def new_sum(*inputs):
+            if any(is_constant(x, (0,)) for x in inputs):
+                return None
+            # Sum3 and Sum4 don't sort their own inputs by rate, as sclang's do
+            inputs = sorted(
+                inputs, key=lambda x: rate_order[CalculationRate.from_expr(x)]
+            )
+            if len(inputs) == 3:
+                return new_fused_ugen(
+                    Sum3,
+                    input_one=inputs[0],
+                    input_two=inputs[1],
+                    input_three=inputs[2],
+                )
+            return new_fused_ugen(
+                Sum4,
+                input_one=inputs[0],
+                input_two=inputs[1],
+                input_three=inputs[2],
+                input_four=inputs[3],
+            )
+
+        def new_mul_add(source, multiplier, addend):
+            if is_constant(multiplier, (0, 1, -1)) or is_constant(addend, (0,)):
+                return None
+            if not MulAdd._inputs_are_valid(source, multiplier, addend):
+                return None
+            return new_fused_ugen(
+                MulAdd,
+                addend=addend,
+                multiplier=multiplier,
+                calculation_rate=CalculationRate.from_expr(
+                    (source, multiplier, addend)
+                ),
+                source=source,
+            )
+
+        def fuse(left, right):
+            if (
+                isinstance(left, OutputProxy)
+                and isinstance(right, OutputProxy)
+                and left.source is right.source
+            ):
+                return None, None
+            if CalculationRate.DEMAND not in (
+                CalculationRate.from_expr(left),
+                CalculationRate.from_expr(right),
+            ):
+                for input_, other in ((left, right), (right, left)):
+                    source = get_fusable_source(
+                        input_, BinaryOpUGen, BinaryOperator.ADDITION
+                    )
+                    if source is not None:
+                        fused_ugen = new_sum(*source._inputs, other)
+                        if fused_ugen is not None:
+                            return fused_ugen, source
+                for input_, other in ((left, right), (right, left)):
+                    source = get_fusable_source(input_, Sum3)
+                    if source is not None:
+                        fused_ugen = new_sum(*source._inputs, other)
+                        if fused_ugen is not None:
+                            return fused_ugen, source
+            for input_, other in ((right, left), (left, right)):
+                source = get_fusable_source(
+                    input_, BinaryOpUGen, BinaryOperator.MULTIPLICATION
+                )
+                if source is None:
+                    continue
+                a, b = source._inputs
+                for multiplicand, multiplier in ((a, b), (b, a)):
+                    fused_ugen = new_mul_add(multiplicand, multiplier, other)
+                    if fused_ugen is not None:
+                        return fused_ugen, source
+            return None, None
+
+        rate_order = {
+            CalculationRate.AUDIO: 0,
+            CalculationRate.CONTROL: 1,
+            CalculationRate.DEMAND: 2,
+            CalculationRate.SCALAR: 3,
+        }
+        descendant_counts = {
+            ugen: len(sort_bundle.descendants)
+            for ugen, sort_bundle in sort_bundles.items()
+        }
+        fused_sources = set()
+        replacements: Dict[UGen, UGen] = {}
+        fused_ugens = []
+        for ugen in ugens:
+            if any(
+                isinstance(input_, OutputProxy) and input_.source in replacements
+                for input_ in ugen._inputs
+            ):
+                ugen._inputs = tuple(
+                    (
+                        replacements[input_.source][input_.output_index]
+                        if isinstance(input_, OutputProxy)
+                        and input_.source in replacements
+                        else input_
+                    )
+                    for input_ in ugen._inputs
+                )
+            if (
+                not isinstance(ugen, BinaryOpUGen)
+                or ugen.operator != BinaryOperator.ADDITION
+            ):
+                fused_ugens.append(ugen)
+                continue
+            fused_ugen, fused_source = fuse(*ugen._inputs)
+            if fused_ugen is None:
+                fused_ugens.append(ugen)
+                continue
+            replacements[ugen] = fused_ugen
+            descendant_counts[fused_ugen] = descendant_counts[ugen]
+            fused_sources.add(fused_source)
+            fused_ugens.append(fused_ugen)
+        fused_ugens = [ugen for ugen in fused_ugens if ugen not in fused_sources]
+        return fused_ugens, len(fused_sources)
+
+    def _initialize(self, ugens, name=None, optimize=True):
+        assert all(isinstance(_, UGen) for _ in ugens)
+        self._name = name
+        ugens = self._cleanup_pv_chains(ugens)
+        ugens = self._cleanup_local_bufs(ugens)
+        self._optimization_counts = None
+        if optimize:
+            ugens, self._optimization_counts = self._optimize_ugen_graph(ugens)
+        ugens = self._sort_ugens_topologically(ugens)
+        self._ugens = tuple(ugens)
+        self._ugen_indices = {ugen: i for i, ugen in enumerate(self._ugens)}
+        self._constants = self._collect_constants(self._ugens)
+        self._constant_indices = {
+            constant: i for i, constant in enumerate(self._constants)
+        }
+        self._control_ugens = self._collect_control_ugens(self._ugens)
+        self._indexed_parameters = self._collect_indexed_parameters(self._control_ugens)
+        self._compiled_ugen_graph = SynthDefCompiler.compile_ugen_graph(self)
+
     @staticmethod
     def _initialize_topological_sort(ugens):
         ugens = list(ugens)
@@ -529,19 +748,74 @@ class SynthDef:
             if ugen._is_width_first:
                 width_first_antecedents.append(ugen)
         for ugen in ugens:
-            sort_bundle = sort_bundles[ugen]
-            sort_bundle._initialize_topological_sort(sort_bundles)
-            sort_bundle.descendants[:] = sorted(
-                sort_bundles[ugen].descendants, key=lambda x: ugens.index(ugen)
-            )
+            sort_bundles[ugen]._initialize_topological_sort(sort_bundles)
         return sort_bundles
 
+    @staticmethod
+    def _merge_and_fold_ugens(ugens):
+        """
+        Merge pure UGens computing the same thing and fold operators over
+        constants, in a single pass over ``ugens`` in topological order.
+
+        Returns the remaining UGens, and the counts of merged and folded UGens.
+        """
+        replacements: Dict[UGen, Union[UGen, float]] = {}
+        ugens_by_key: Dict[Tuple, UGen] = {}
+        merged_count = folded_count = 0
+        remaining_ugens = []
+        for ugen in ugens:
+            inputs = []
+            for input_ in ugen._inputs:
+                if isinstance(input_, OutputProxy) and input_.source in replacements:
+                    replacement = replacements[input_.source]
+                    if isinstance(replacement, UGen):
+                        input_ = replacement[input_.output_index]
+                    else:
+                        input_ = replacement
+                inputs.append(input_)
+            ugen._inputs = tuple(inputs)
+            constant_value = ugen._get_constant_value()
+            if constant_value is not None:
+                replacements[ugen] = constant_value
+                folded_count += 1
+                continue
+            key = ugen._get_common_subexpression_key()
+            if key is not None:
+                if key in ugens_by_key:
+                    replacements[ugen] = ugens_by_key[key]
+                    merged_count += 1
+                    continue
+                ugens_by_key[key] = ugen
+            remaining_ugens.append(ugen)
+        return remaining_ugens, merged_count, folded_count
+
     @staticmethod
     def _optimize_ugen_graph(ugens):
+        ugen_count = len(ugens)
+        ugens, merged_count, folded_count = SynthDef._merge_and_fold_ugens(ugens)
         sort_bundles = SynthDef._initialize_topological_sort(ugens)
         for ugen in ugens:
             ugen._optimize_graph(sort_bundles)
-        return tuple(sort_bundles)
+        live_ugens = tuple(sort_bundles)
+        optimized_ugens, fused_count = SynthDef._fuse_ugens(live_ugens, sort_bundles)
+        optimization_counts = dict(
+            eliminated=len(ugens) - len(live_ugens),
+            folded=folded_count,
+            fused=fused_count,
+            merged=merged_count,
+        )
+        if len(optimized_ugens) < ugen_count:
+            logger.debug(
+                "Optimized %d UGens to %d: %d merged, %d folded, %d eliminated, "
+                "%d fused",
+                ugen_count,
+                len(optimized_ugens),
+                merged_count,
+                folded_count,
+                optimization_counts["eliminated"],
+                fused_count,
+            )
+        return tuple(optimized_ugens), optimization_counts
 
     def _register_with_local_server(self, server):
         synthdef_name = self.actual_name
@@ -911,6 +1185,32 @@ class SynthDef:
     def name(self) -> Optional[str]:
         return self._name
 
+    @property
+    def optimization_counts(self) -> Optional[Dict[str, int]]:
+        """
+        Gets the counts of UGens optimization removed, by cause.
+
+        ::
+
+            >>> with supriya.synthdefs.SynthDefBuilder() as builder:
+            ...     sines = [supriya.ugens.SinOsc.ar() for _ in range(2)]
+            ...     unused = supriya.ugens.SinOsc.ar(frequency=220)
+            ...     out = supriya.ugens.Out.ar(bus=0, source=sines)
+            ...
+            >>> synthdef = builder.build()
+            >>> synthdef.optimization_counts
+            {'eliminated': 1, 'folded': 0, 'fused': 0, 'merged': 1}
+
+        ::
+
+            >>> builder.build(optimize=False).optimization_counts is None
+            True
+
+        """
+        if self._optimization_counts is None:
+            return None
+        return dict(self._optimization_counts)
+
     @property
     def output_ugens(self) -> Tuple[UGen, ...]:
         return tuple(_ for _ in self.ugens if _.is_output_ugen)
@@ -938,37 +1238,35 @@ class UGenSortBundle(SupriyaObject):
         self.antecedents = []
         self.descendants = []
         self.ugen = ugen
+        self.unscheduled_antecedent_count = 0
         self.width_first_antecedents = tuple(width_first_antecedents)
 
     ### PRIVATE METHODS ###
 
     def _initialize_topological_sort(self, sort_bundles):
+        antecedents = []
         for input_ in self.ugen.inputs:
             if isinstance(input_, OutputProxy):
-                input_ = input_.source
-            elif not isinstance(input_, UGen):
-                continue
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
-        for input_ in self.width_first_antecedents:
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
+                antecedents.append(input_.source)
+            elif isinstance(input_, UGen):
+                antecedents.append(input_)
+        antecedents.extend(self.width_first_antecedents)
+        # UGens hash by identity, so this dedupes in first-seen order
+        for antecedent in dict.fromkeys(antecedents):
+            self.antecedents.append(antecedent)
+            sort_bundles[antecedent].descendants.append(self.ugen)
+        self.unscheduled_antecedent_count = len(self.antecedents)
 
     def _make_available(self, available_ugens):
-        if not self.antecedents:
-            if self.ugen not in available_ugens:
-                available_ugens.append(self.ugen)
+        # Reached exactly once per UGen: when its last antecedent is scheduled,
+        # or up front if it has none.
+        if not self.unscheduled_antecedent_count:
+            available_ugens.append(self.ugen)
 
     def _schedule(self, available_ugens, out_stack, sort_bundles):
         for ugen in reversed(self.descendants):
             sort_bundle = sort_bundles[ugen]
-            sort_bundle.antecedents.remove(self.ugen)
+            sort_bundle.unscheduled_antecedent_count -= 1
             sort_bundle._make_available(available_ugens)
         out_stack.append(self.ugen)
 
@@ -977,6 +1275,7 @@ class UGenSortBundle(SupriyaObject):
     def clear(self) -> None:
         self.antecedents[:] = []
         self.descendants[:] = []
+        self.unscheduled_antecedent_count = 0
         self.width_first_antecedents[:] = []
 
 
@@ -1,6 +1,8 @@
 import abc
 import copy
 import inspect
+import math
+import operator
 from collections.abc import Iterable, Sequence
 from enum import Enum
 from typing import Callable, NamedTuple, Optional, SupportsFloat, Tuple, Type, Union
@@ -146,6 +148,7 @@ def _process_class(
     new,
     has_done_flag,
     is_input,
+    is_mergeable,
     is_multichannel,
     is_output,
     is_pure,
@@ -181,6 +184,11 @@ def _process_class(
             valid_calculation_rates.append(rate)
     cls._has_done_flag = bool(has_done_flag)
     cls._is_input = bool(is_input)
+    if is_mergeable is None:
+        # Buffer UGens read or write state outside the graph, so two with the
+        # same inputs aren't interchangeable unless declared so
+        is_mergeable = is_pure and "buffer_id" not in params
+    cls._is_mergeable = bool(is_mergeable)
     cls._is_output = bool(is_output)
     cls._is_pure = bool(is_pure)
     cls._is_width_first = bool(is_width_first)
@@ -216,6 +224,7 @@ def ugen(
     new: bool = False,
     has_done_flag: bool = False,
     is_input: bool = False,
+    is_mergeable: Optional[bool] = None,
     is_multichannel: bool = False,
     is_output: bool = False,
     is_pure: bool = False,
@@ -243,6 +252,7 @@ def ugen(
             new=new,
             has_done_flag=has_done_flag,
             is_input=is_input,
+            is_mergeable=is_mergeable,
             is_multichannel=is_multichannel,
             is_output=is_output,
             is_pure=is_pure,
@@ -3629,6 +3639,8 @@ class UGen(UGenMethodMixin):
 
     _is_input = False
 
+    _is_mergeable = False
+
     _is_output = False
 
     _is_pure = False
@@ -3872,6 +3884,23 @@ class UGen(UGenMethodMixin):
             expanded_inputs.update(cached_unexpanded_inputs)
         return result
 
+    def _get_common_subexpression_key(self):
+        # Mergeable UGens fed identical inputs compute identical outputs, so
+        # any two sharing a key can be merged. Purity alone isn't enough, as
+        # it only means a UGen may be dropped when nothing reads it.
+        if not self._is_mergeable:
+            return None
+        return (
+            type(self),
+            self.calculation_rate,
+            self.special_index,
+            len(self),
+            tuple(self._inputs),
+        )
+
+    def _get_constant_value(self):
+        return None
+
     def _get_done_action(self):
         if "done_action" not in self._ordered_input_names:
             return None
@@ -4107,6 +4136,45 @@ class UnaryOpUGen(UGen):
 
     source = param(None)
 
+    _constant_operators = {
+        UnaryOperator.ABSOLUTE_VALUE: abs,
+        UnaryOperator.AMPLITUDE_TO_DB: lambda x: math.log10(x) * 20,
+        UnaryOperator.CEILING: math.ceil,
+        UnaryOperator.COS: math.cos,
+        UnaryOperator.COSH: math.cosh,
+        UnaryOperator.CUBED: lambda x: x * x * x,
+        UnaryOperator.DB_TO_AMPLITUDE: lambda x: 10 ** (x * 0.05),
+        UnaryOperator.EXPONENTIAL: math.exp,
+        UnaryOperator.FLOOR: math.floor,
+        UnaryOperator.HZ_TO_MIDI: lambda x: math.log2(x / 440) * 12 + 69,
+        UnaryOperator.HZ_TO_OCTAVE: lambda x: math.log2(x / 440) + 4.75,
+        UnaryOperator.LOG: math.log,
+        UnaryOperator.LOG10: math.log10,
+        UnaryOperator.LOG2: math.log2,
+        UnaryOperator.MIDI_TO_HZ: lambda x: 440 * 2 ** ((x - 69) / 12),
+        UnaryOperator.NEGATIVE: operator.neg,
+        UnaryOperator.OCTAVE_TO_HZ: lambda x: 440 * 2 ** (x - 4.75),
+        UnaryOperator.RATIO_TO_SEMITONES: lambda x: math.log2(x) * 12,
+        UnaryOperator.RECIPROCAL: lambda x: 1 / x,
+        UnaryOperator.SEMITONES_TO_RATIO: lambda x: 2 ** (x / 12),
+        UnaryOperator.SIN: math.sin,
+        UnaryOperator.SINH: math.sinh,
+        UnaryOperator.SQUARED: lambda x: x * x,
+        UnaryOperator.TAN: math.tan,
+        UnaryOperator.TANH: math.tanh,
+    }
+
+    _random_operators = frozenset(
+        [
+            UnaryOperator.BILINRAND,
+            UnaryOperator.COIN,
+            UnaryOperator.LINRAND,
+            UnaryOperator.RAND,
+            UnaryOperator.RAND2,
+            UnaryOperator.SUM3RAND,
+        ]
+    )
+
     ### INITIALIZER ###
 
     def __init__(self, calculation_rate=None, source=None, special_index=None):
@@ -4117,6 +4185,23 @@ class UnaryOpUGen(UGen):
             special_index=special_index,
         )
 
+    ### PRIVATE METHODS ###
+
+    def _get_common_subexpression_key(self):
+        if self.special_index in self._random_operators:
+            return None
+        return UGen._get_common_subexpression_key(self)
+
+    def _get_constant_value(self):
+        (source,) = self._inputs
+        function = self._constant_operators.get(self.special_index)
+        if function is None or not isinstance(source, float):
+            return None
+        try:
+            return float(function(source))
+        except (ArithmeticError, ValueError):
+            return None
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -4162,6 +4247,38 @@ class BinaryOpUGen(UGen):
     left = param(None)
     right = param(None)
 
+    _constant_operators = {
+        BinaryOperator.ABSOLUTE_DIFFERENCE: lambda a, b: abs(a - b),
+        BinaryOperator.ADDITION: operator.add,
+        BinaryOperator.ATAN2: math.atan2,
+        BinaryOperator.DIFFERENCE_OF_SQUARES: lambda a, b: a * a - b * b,
+        BinaryOperator.EQUAL: operator.eq,
+        BinaryOperator.FLOAT_DIVISION: operator.truediv,
+        BinaryOperator.GREATER_THAN: operator.gt,
+        BinaryOperator.GREATER_THAN_OR_EQUAL: operator.ge,
+        BinaryOperator.HYPOT: math.hypot,
+        BinaryOperator.LESS_THAN: operator.lt,
+        BinaryOperator.LESS_THAN_OR_EQUAL: operator.le,
+        BinaryOperator.MAXIMUM: max,
+        BinaryOperator.MINIMUM: min,
+        BinaryOperator.MULTIPLICATION: operator.mul,
+        BinaryOperator.NOT_EQUAL: operator.ne,
+        # scsynth mirrors negative bases rather than returning NaN
+        BinaryOperator.POWER: lambda a, b: -((-a) ** b) if a < 0 else a**b,
+        BinaryOperator.RING1: lambda a, b: a * b + a,
+        BinaryOperator.RING2: lambda a, b: a * b + a + b,
+        BinaryOperator.RING3: lambda a, b: a * a * b,
+        BinaryOperator.RING4: lambda a, b: a * a * b - a * b * b,
+        BinaryOperator.SQUARE_OF_DIFFERENCE: lambda a, b: (a - b) ** 2,
+        BinaryOperator.SQUARE_OF_SUM: lambda a, b: (a + b) ** 2,
+        BinaryOperator.SUBTRACTION: operator.sub,
+        BinaryOperator.SUM_OF_SQUARES: lambda a, b: a * a + b * b,
+    }
+
+    _random_operators = frozenset(
+        [BinaryOperator.EXPRANDRANGE, BinaryOperator.RANDRANGE]
+    )
+
     ### INITIALIZER ###
 
     def __init__(
@@ -4177,6 +4294,23 @@ class BinaryOpUGen(UGen):
 
     ### PRIVATE METHODS ###
 
+    def _get_common_subexpression_key(self):
+        if self.special_index in self._random_operators:
+            return None
+        return UGen._get_common_subexpression_key(self)
+
+    def _get_constant_value(self):
+        left, right = self._inputs
+        function = self._constant_operators.get(self.special_index)
+        if function is None or not isinstance(left, float):
+            return None
+        if not isinstance(right, float):
+            return None
+        try:
+            return float(function(left, right))
+        except (ArithmeticError, ValueError):
+            return None
+
     @classmethod
     def _new_single(
         cls, calculation_rate=None, special_index=None, left=None, right=None
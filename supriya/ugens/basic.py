@@ -60,55 +60,27 @@ class Mix(PseudoUGen):
             synthdef:
                 name: mix2
                 ugens:
-                -   DC.ar/0:
-                        source: 1.0
-                -   DC.ar/1:
-                        source: 1.0
-                -   DC.ar/2:
-                        source: 1.0
-                -   DC.ar/3:
+                -   DC.ar:
                         source: 1.0
                 -   Sum4.ar/0:
-                        input_one: DC.ar/0[0]
-                        input_two: DC.ar/1[0]
-                        input_three: DC.ar/2[0]
-                        input_four: DC.ar/3[0]
-                -   DC.ar/4:
-                        source: 1.0
-                -   DC.ar/5:
-                        source: 1.0
-                -   DC.ar/6:
-                        source: 1.0
-                -   DC.ar/7:
-                        source: 1.0
+                        input_one: DC.ar[0]
+                        input_two: DC.ar[0]
+                        input_three: DC.ar[0]
+                        input_four: DC.ar[0]
                 -   Sum4.ar/1:
-                        input_one: DC.ar/4[0]
-                        input_two: DC.ar/5[0]
-                        input_three: DC.ar/6[0]
-                        input_four: DC.ar/7[0]
-                -   DC.ar/8:
-                        source: 1.0
-                -   DC.ar/9:
-                        source: 1.0
-                -   DC.ar/10:
-                        source: 1.0
-                -   DC.ar/11:
-                        source: 1.0
+                        input_one: DC.ar[0]
+                        input_two: DC.ar[0]
+                        input_three: DC.ar[0]
+                        input_four: DC.ar[0]
                 -   Sum4.ar/2:
-                        input_one: DC.ar/8[0]
-                        input_two: DC.ar/9[0]
-                        input_three: DC.ar/10[0]
-                        input_four: DC.ar/11[0]
-                -   DC.ar/12:
-                        source: 1.0
-                -   DC.ar/13:
-                        source: 1.0
-                -   DC.ar/14:
-                        source: 1.0
+                        input_one: DC.ar[0]
+                        input_two: DC.ar[0]
+                        input_three: DC.ar[0]
+                        input_four: DC.ar[0]
                 -   Sum3.ar:
-                        input_one: DC.ar/12[0]
-                        input_two: DC.ar/13[0]
-                        input_three: DC.ar/14[0]
+                        input_one: DC.ar[0]
+                        input_two: DC.ar[0]
+                        input_three: DC.ar[0]
                 -   Sum4.ar/3:
                         input_one: Sum4.ar/0[0]
                         input_two: Sum4.ar/1[0]
@@ -361,7 +361,8 @@ class VarSaw(UGen):
     width = param(0.5)
 
 
-@ugen(ar=True, kr=True, is_pure=True)
+# Vibrato's rate and depth variations are random
+@ugen(ar=True, kr=True, is_mergeable=False, is_pure=True)
 class Vibrato(UGen):
     """
     Vibrato is a slow frequency modulation.
@@ -6,6 +6,7 @@ import time
 
 import pytest
 
+import supriya.clocks.threaded
 from supriya.clocks import Clock, TimeUnit
 
 repeat_count = 5
@@ -90,9 +91,11 @@ def calculate_skew(store):
         (
             False,
             True,
-            [0.25, 0.5, 0.75, 1.0, 1.25]
-            if platform.system() != "Windows"
-            else [0.0, 0.25, 0.5, 0.75, 1.0],
+            (
+                [0.25, 0.5, 0.75, 1.0, 1.25]
+                if platform.system() != "Windows"
+                else [0.0, 0.25, 0.5, 0.75, 1.0]
+            ),
         ),
         (False, False, [0.0, 0.25, 0.5, 0.75, 1.0]),
     ],
@@ -798,3 +801,58 @@ def test_clock_skew():
             multiplier = 85.0  # GHA's Windows runner is extremely slow!
     threshold = clock.slop * multiplier
     assert all(stats["median"] < threshold for stats in all_stats), threshold
+
+
+@pytest.mark.flaky(reruns=5)
+def test_wake_for_earlier_event():
+    clock = Clock()
+    store = []
+    clock.start()
+    try:
+        later_id = clock.schedule(
+            callback, schedule_at=3600, args=[store], kwargs={"limit": 0}
+        )
+        time.sleep(0.01)
+        clock.schedule(callback, schedule_at=0.05, args=[store], kwargs={"limit": 0})
+        time.sleep(0.2)
+        assert len(store) == 1
+        assert clock.peek().event_id == later_id
+    finally:
+        clock.stop()
+
+
+@pytest.mark.parametrize(
+    "pace, is_set, expected",
+    [
+        # Steady time sources sleep until the deadline after one short wait
+        (1.0, False, [0.001, 10.0, 10.0]),
+        # Stalled or jumping time sources are re-read every slop seconds
+        (0.0, False, [0.001, 0.001, 0.001]),
+        (3.0, False, [0.001, 0.001, 0.001]),
+        # Waking early says nothing about the time source
+        (1.0, True, [0.001, 0.001, 0.001]),
+    ],
+)
+def test_wait_for_event(mocker, pace, is_set, expected):
+    def wait(timeout=None):
+        timeouts.append(timeout)
+        if timeout is None:
+            return True
+        if not is_set:
+            times["monotonic"] += timeout
+            times["current"] += timeout * pace
+        return is_set
+
+    times = {"current": 0.0, "monotonic": 0.0}
+    timeouts = []
+    clock = Clock()
+    clock.slop = 0.001
+    mocker.patch.object(clock, "get_current_time", lambda: times["current"])
+    mocker.patch.object(clock, "_event").wait.side_effect = wait
+    mocker.patch.object(supriya.clocks.threaded, "time").monotonic.side_effect = (
+        lambda: times["monotonic"]
+    )
+    for _ in range(3):
+        clock._wait_for_event(10.0)
+    clock._wait_for_event(None)
+    assert timeouts == expected + [None]
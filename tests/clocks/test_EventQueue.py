@@ -0,0 +1,76 @@
+import queue
+import random
+
+import pytest
+
+from supriya.clocks.eventqueue import EventQueue
+
+
+def assert_heap(event_queue):
+    heap = event_queue.queue
+    assert len(event_queue.positions) == len(heap)
+    for position, item in enumerate(heap):
+        assert event_queue.positions[item] == position
+        if position:
+            assert not item < heap[(position - 1) // 2]
+
+
+def test_peek():
+    event_queue = EventQueue()
+    with pytest.raises(queue.Empty):
+        event_queue.peek()
+    for item in [(3.0, 0), (1.0, 1), (2.0, 2)]:
+        event_queue.put(item)
+    assert event_queue.peek() == (1.0, 1)
+    assert event_queue.qsize() == 3
+    event_queue.remove((1.0, 1))
+    assert event_queue.peek() == (2.0, 2)
+    assert event_queue.qsize() == 2
+
+
+def test_reschedule():
+    event_queue = EventQueue()
+    for item in [(3.0, 0), (1.0, 1), (2.0, 2)]:
+        event_queue.put(item)
+    event_queue.reschedule((3.0, 0), (0.5, 0))
+    assert event_queue.peek() == (0.5, 0)
+    event_queue.reschedule((0.5, 0), (4.0, 0))
+    assert [event_queue.get() for _ in range(3)] == [(1.0, 1), (2.0, 2), (4.0, 0)]
+    with pytest.raises(KeyError):
+        event_queue.reschedule((4.0, 0), (5.0, 0))
+
+
+def test_rekey():
+    event_queue = EventQueue()
+    for i in range(10):
+        event_queue.put((float(i), i))
+    event_queue.rekey(lambda item: (-item[0], item[1]) if item[1] % 2 else item)
+    assert_heap(event_queue)
+    assert [event_queue.get()[1] for _ in range(10)] == [9, 7, 5, 3, 1, 0, 2, 4, 6, 8]
+
+
+@pytest.mark.parametrize("count", [10**5])
+def test_scaling(count):
+    random.seed(0)
+    event_queue = EventQueue()
+    items = [(random.random(), i) for i in range(count)]
+    for item in items:
+        event_queue.put(item)
+    assert event_queue.qsize() == count
+    # Cancel half, reschedule the other half: no inactive entries remain.
+    for item in items[::2]:
+        event_queue.remove(item)
+    rescheduled = []
+    for item in items[1::2]:
+        new_item = (random.random(), item[1])
+        event_queue.reschedule(item, new_item)
+        rescheduled.append(new_item)
+    assert event_queue.qsize() == len(rescheduled)
+    assert_heap(event_queue)
+    event_queue.rekey(lambda item: (item[0] * 2, item[1]))
+    assert_heap(event_queue)
+    assert [event_queue.get() for _ in range(len(rescheduled))] == sorted(
+        (seconds * 2, i) for seconds, i in rescheduled
+    )
+    assert event_queue.qsize() == 0
+    assert not event_queue.positions
@@ -0,0 +1,95 @@
+import socket
+
+import pytest
+
+import supriya
+from supriya.osc import OscBundle, OscMessage, OscMessageTemplate, ThreadedOscProtocol
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        supriya.commands.NodeSetRequest(1000, frequency=443.0, amplitude=0.5),
+        supriya.commands.NodeSetRequest(1000, frequency=443, gate=0),
+        supriya.commands.NodeSetRequest(1000, out="c0", frequency=443.0),
+        supriya.commands.NodeSetRequest(1000),
+        supriya.commands.SynthNewRequest(
+            node_id=1001, synthdef="default", target_node_id=1, frequency=443.0
+        ),
+        supriya.commands.SynthNewRequest(
+            add_action=supriya.AddAction.ADD_TO_TAIL,
+            node_id=1001,
+            synthdef=supriya.assets.synthdefs.default,
+            target_node_id=1000,
+            amplitude=0.25,
+            out=0,
+        ),
+        supriya.commands.SynthNewRequest(
+            node_id=1001, synthdef="default", target_node_id=1, out="a0"
+        ),
+    ],
+)
+def test_to_datagram(request_):
+    assert request_.to_datagram() == request_.to_osc().to_datagram()
+    assert request_.to_datagram(with_placeholders=True) == (
+        request_.to_osc(with_placeholders=True).to_datagram()
+    )
+
+
+def test_RequestBundle_to_datagram():
+    request_bundle = supriya.commands.RequestBundle(
+        timestamp=1.5,
+        contents=[
+            supriya.commands.NodeSetRequest(1000, frequency=443.0),
+            supriya.commands.RequestBundle(
+                contents=[supriya.commands.NodeFreeRequest(node_ids=[1000])]
+            ),
+        ],
+    )
+    assert request_bundle.to_datagram() == request_bundle.to_osc().to_datagram()
+
+
+def test_send(monkeypatch):
+    node_set_request = supriya.commands.NodeSetRequest(1000, frequency=443.0)
+    synth_new_request = supriya.commands.SynthNewRequest(
+        node_id=1001, synthdef="default", target_node_id=1, amplitude=0.25
+    )
+    request_bundle = supriya.commands.RequestBundle(
+        contents=[node_set_request, synth_new_request]
+    )
+    expected = [
+        x.to_osc().to_datagram()
+        for x in (node_set_request, synth_new_request, request_bundle)
+    ]
+    rendered = []
+    to_datagram = OscMessageTemplate.to_datagram
+
+    def render(self, *values):
+        rendered.append(to_datagram(self, *values))
+        return rendered[-1]
+
+    def fail(self, *args, **kwargs):
+        raise AssertionError(self)
+
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    osc_protocol = ThreadedOscProtocol()
+    osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+    server = supriya.Server()
+    monkeypatch.setattr(server, "_is_running", True)
+    monkeypatch.setattr(server, "_osc_protocol", osc_protocol)
+    # Sent bytes must come from the templates, not from encoding messages
+    monkeypatch.setattr(OscMessageTemplate, "to_datagram", render)
+    monkeypatch.setattr(OscMessage, "to_datagram", fail)
+    monkeypatch.setattr(OscBundle, "to_datagram", fail)
+    try:
+        with osc_protocol.capture(capacity=4) as capture:
+            for x in (node_set_request, synth_new_request, request_bundle):
+                server.send(x)
+        received = [peer.recvfrom(8192)[0] for _ in range(3)]
+    finally:
+        osc_protocol.disconnect()
+        peer.close()
+    assert received == expected
+    assert [datagram for _, _, datagram in capture._iterate_datagrams()] == expected
+    assert rendered == expected[:2] * 2
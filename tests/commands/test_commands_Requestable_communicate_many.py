@@ -0,0 +1,26 @@
+import concurrent.futures
+
+import supriya
+from supriya.commands.bases import _ResponseDemultiplexer
+from supriya.osc import OscMessage
+
+
+def test_ResponseDemultiplexer():
+    demultiplexer = _ResponseDemultiplexer()
+    futures = [concurrent.futures.Future() for _ in range(4)]
+    demultiplexer.add(futures[0], ["/done", "/b_alloc", 0])
+    demultiplexer.add(futures[1], ["/b_info", 0])
+    demultiplexer.add(futures[2], ["/b_info", 0])
+    demultiplexer.add(futures[3], ["/n_go", 1000], ["/fail", "/s_new"])
+    assert demultiplexer.addresses == ["/b_info", "/done", "/fail", "/n_go"]
+    demultiplexer(OscMessage("/done", "/b_alloc", 1))
+    demultiplexer(OscMessage("/b_info", 0, 512, 1, 48000.0))
+    demultiplexer(OscMessage("/fail", "/s_new", "SynthDef not found"))
+    demultiplexer(OscMessage("/n_go", 1000, 1, -1, -1, 0))
+    demultiplexer(OscMessage("/done", "/b_alloc", 0))
+    assert [future.done() for future in futures] == [True, True, False, True]
+    assert futures[0].result() == supriya.commands.DoneResponse(action=("/b_alloc", 0))
+    assert futures[1].result().items[0].frame_count == 512
+    assert isinstance(futures[3].result(), supriya.commands.FailResponse)
+    demultiplexer(OscMessage("/b_info", 0, 1024, 1, 48000.0))
+    assert futures[2].result().items[0].frame_count == 1024
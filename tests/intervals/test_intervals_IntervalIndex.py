@@ -0,0 +1,160 @@
+import pickle
+import random
+
+import pytest
+
+from supriya.intervals import Interval, IntervalIndex, IntervalTree
+
+
+def make_intervals():
+    return [
+        Interval(0, 3),
+        Interval(1, 3),
+        Interval(1, 2),
+        Interval(2, 5),
+        Interval(6, 9),
+    ]
+
+
+def make_random_intervals(count=10, range_=10):
+    # Includes zero-length and duplicate intervals.
+    intervals = []
+    for _ in range(count):
+        start_offset = random.randrange(range_)
+        stop_offset = random.randint(start_offset, range_)
+        intervals.append(Interval(start_offset=start_offset, stop_offset=stop_offset))
+    return intervals
+
+
+def test___contains__():
+    interval_index = IntervalIndex(make_intervals())
+    assert Interval(1, 2) in interval_index
+    assert Interval(-1, 100) not in interval_index
+    with pytest.raises(ValueError):
+        1 in interval_index
+
+
+def test___getitem__():
+    interval_index = IntervalIndex(make_intervals())
+    assert interval_index[-1] == Interval(6, 9)
+    assert interval_index[:3] == [Interval(0, 3), Interval(1, 2), Interval(1, 3)]
+
+
+def test___init__():
+    interval_index = IntervalIndex()
+    assert len(interval_index) == 0
+    assert interval_index.find_intersection(0) == []
+    assert interval_index.get_offset_after(0) is None
+    assert interval_index.get_start_offset_after(0) is None
+    assert interval_index.get_start_offset_before(0) is None
+
+
+def test___iter__():
+    interval_index = IntervalIndex(make_intervals())
+    assert list(interval_index) == list(IntervalTree(make_intervals()))
+
+
+def test_pickle():
+    interval_index = IntervalIndex(make_intervals())
+    unpickled = pickle.loads(pickle.dumps(interval_index))
+    assert list(unpickled) == list(interval_index)
+    assert unpickled.find_intersection(1.5) == interval_index.find_intersection(1.5)
+
+
+@pytest.mark.parametrize("count", [0, 1, 7, 16, 33, 500])
+def test_find_intersection(count):
+    range_ = 50
+    for _ in range(10):
+        intervals = make_random_intervals(count=count, range_=range_)
+        interval_index = IntervalIndex(intervals)
+        interval_tree = IntervalTree(intervals)
+        offsets = [x / 2 for x in range(-2, range_ * 2 + 2)]
+        for offset in offsets:
+            assert interval_index.find_intersection(offset) == sorted(
+                interval_tree.find_intersection(offset)
+            )
+        batched = interval_index.find_intersections(offsets)
+        assert batched == [interval_index.find_intersection(x) for x in offsets]
+        for start_offset in range(-1, range_ + 1):
+            for stop_offset in range(start_offset, start_offset + 10):
+                target = Interval(start_offset, stop_offset)
+                expected = [
+                    x
+                    for x in intervals
+                    if x.start_offset <= start_offset < x.stop_offset
+                    or start_offset <= x.start_offset < stop_offset
+                ]
+                assert sorted(interval_index.find_intersection(target)) == sorted(
+                    expected
+                )
+
+
+@pytest.mark.parametrize("accelerated", [True, False])
+@pytest.mark.parametrize("count", [1, 16, 100])
+def test_find_intersection_matches_interval_tree(accelerated, count):
+    range_ = 20
+    for _ in range(10):
+        # Zero-length intervals at every start and stop offset
+        intervals = make_random_intervals(count=count, range_=range_)
+        intervals.extend(
+            [Interval(y, y) for x in intervals for y in (x.start_offset, x.stop_offset)]
+        )
+        interval_index = IntervalIndex(intervals)
+        interval_tree = IntervalTree(intervals, accelerated=accelerated)
+        for start_offset in range(-1, range_ + 1):
+            assert interval_index.find_intersection(start_offset) == sorted(
+                interval_tree.find_intersection(start_offset)
+            )
+            for stop_offset in range(start_offset, start_offset + 4):
+                target = Interval(start_offset, stop_offset)
+                assert sorted(interval_index.find_intersection(target)) == sorted(
+                    interval_tree.find_intersection(target)
+                )
+
+
+def test_find_intersection_zero_length():
+    intervals = [Interval(0, 1), Interval(1, 1), Interval(1, 3), Interval(3, 3)]
+    interval_index = IntervalIndex(intervals)
+    assert interval_index.find_intersection(1) == [Interval(1, 3)]
+    assert interval_index.find_intersection(Interval(1, 1)) == [Interval(1, 3)]
+    assert interval_index.find_intersection(Interval(1, 2)) == [
+        Interval(1, 1),
+        Interval(1, 3),
+    ]
+    assert interval_index.find_intersection(Interval(0, 3)) == intervals[:3]
+    assert interval_index.find_intersection(Interval(3, 4)) == [Interval(3, 3)]
+
+
+@pytest.mark.parametrize("count", [0, 1, 16, 100])
+def test_queries_match_interval_tree(count):
+    range_ = 20
+    for _ in range(10):
+        intervals = make_random_intervals(count=count, range_=range_)
+        interval_index = IntervalIndex(intervals)
+        interval_tree = IntervalTree(intervals)
+        for offset in range(-1, range_ + 2):
+            assert interval_index.find_intervals_starting_at(
+                offset
+            ) == interval_tree.find_intervals_starting_at(offset)
+            assert interval_index.find_intervals_stopping_at(
+                offset
+            ) == interval_tree.find_intervals_stopping_at(offset)
+            assert interval_index.get_offset_after(
+                offset
+            ) == interval_tree.get_offset_after(offset)
+            assert interval_index.get_start_offset_after(
+                offset
+            ) == interval_tree.get_start_offset_after(offset)
+            assert interval_index.get_start_offset_before(
+                offset
+            ) == interval_tree.get_start_offset_before(offset)
+            expected = interval_tree.get_moment_at(offset)
+            actual = interval_index.get_moment_at(offset)
+            assert actual.interval_tree is interval_index
+            assert actual.start_offset == expected.start_offset
+            assert actual.start_intervals == expected.start_intervals
+            assert actual.stop_intervals == expected.stop_intervals
+            assert actual.overlap_intervals == expected.overlap_intervals
+        for interval in intervals:
+            assert interval in interval_index
+            assert interval_index[interval_index.index(interval)] == interval
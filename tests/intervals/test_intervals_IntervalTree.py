@@ -242,6 +242,19 @@ def test_find_intersection_with_interval(accelerated):
         print(f"D: {factor} O: {optimized} B: {brute_force}")
 
 
+@pytest.mark.parametrize("accelerated", [True, False])
+def test_find_intersection_with_zero_length_intervals(accelerated):
+    # Zero-length intervals at a query's start offset intersect it, even when
+    # the tree's earlier intervals all stop by then
+    interval_tree = make_interval_tree(
+        accelerated=accelerated, intervals=[Interval(0, 1), Interval(1, 1)]
+    )
+    assert interval_tree.find_intersection(Interval(1, 2)) == [Interval(1, 1)]
+    assert interval_tree.find_intersection(Interval(0, 1)) == [Interval(0, 1)]
+    assert interval_tree.find_intersection(Interval(1, 1)) == []
+    assert interval_tree.find_intersection(1) == []
+
+
 @pytest.mark.parametrize("accelerated", [True, False])
 def test_find_intervals_starting_at(accelerated):
     iterations = 100
@@ -360,6 +373,46 @@ def test_iterate_moments(accelerated):
     assert [x.start_offset for x in moments] == [6, 2, 1, 0]
 
 
+@pytest.mark.parametrize("accelerated", [True, False])
+@pytest.mark.parametrize("reverse", [True, False])
+def test_iterate_moments_matches_get_moment_at(accelerated, reverse):
+    iterations = 100
+    count, range_ = 20, 15
+    for i in range(iterations):
+        print("Iteration:", i)
+        intervals = make_random_intervals(count=count, range_=range_)
+        # Zero-length intervals only ever appear as stop intervals
+        intervals.extend(
+            Interval(x.start_offset, x.start_offset) for x in intervals[:3]
+        )
+        interval_tree = make_interval_tree(accelerated=accelerated, intervals=intervals)
+        start_offsets = sorted(set(x.start_offset for x in interval_tree))
+        if reverse:
+            start_offsets.reverse()
+        moments = list(interval_tree.iterate_moments(reverse=reverse))
+        assert [x.start_offset for x in moments] == start_offsets
+        for actual in moments:
+            expected = interval_tree.get_moment_at(actual.start_offset)
+            assert actual.interval_tree is interval_tree
+            assert actual.start_intervals == expected.start_intervals
+            assert actual.stop_intervals == expected.stop_intervals
+            assert actual.overlap_intervals == expected.overlap_intervals
+
+
+@pytest.mark.parametrize("accelerated", [True, False])
+def test_iterate_moments_nwise(accelerated):
+    interval_tree = make_interval_tree(accelerated=accelerated, populated=True)
+    assert [
+        [x.start_offset for x in moments]
+        for moments in interval_tree.iterate_moments_nwise(n=3)
+    ] == [[0, 1, 2], [1, 2, 6]]
+    assert [
+        [x.start_offset for x in moments]
+        for moments in interval_tree.iterate_moments_nwise(n=3, reverse=True)
+    ] == [[1, 2, 6], [0, 1, 2]]
+    assert list(interval_tree.iterate_moments_nwise(n=5)) == []
+
+
 @pytest.mark.parametrize("accelerated", [True, False])
 def test_remove(accelerated):
     intervals = make_intervals()
@@ -0,0 +1,88 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+import supriya.nonrealtime
+from supriya.nonrealtime.states import CopyOnWriteDict
+
+
+def test_copies_are_independent():
+    random_ = random.Random(0)
+    expected = [{}]
+    dicts = [CopyOnWriteDict()]
+    for i in range(5000):
+        index = random_.randrange(len(dicts))
+        if random_.random() < 0.1:
+            expected.append(dict(expected[index]))
+            dicts.append(dicts[index].copy())
+            continue
+        key = random_.randrange(500)
+        if random_.random() < 0.3 and key in expected[index]:
+            del expected[index][key]
+            del dicts[index][key]
+        else:
+            expected[index][key] = i
+            dicts[index][key] = i
+    for dict_, expected_dict in zip(dicts, expected):
+        assert dict(dict_.items()) == expected_dict
+        assert len(dict_) == len(expected_dict)
+        assert dict_ == CopyOnWriteDict(expected_dict)
+        assert all(dict_.get(key) == value for key, value in expected_dict.items())
+        assert -1 not in dict_
+    for dict_one, dict_two, expected_one, expected_two in zip(
+        dicts, dicts[1:], expected, expected[1:]
+    ):
+        assert (dict_one == dict_two) == (expected_one == expected_two)
+
+
+def test_errors():
+    dict_ = CopyOnWriteDict({1: None})
+    with pytest.raises(KeyError):
+        dict_[2]
+    with pytest.raises(KeyError):
+        del dict_[2]
+    assert dict_.pop(1) is None
+    assert not dict_
+
+
+@pytest.mark.parametrize("copy_function", [copy.copy, pickle.dumps])
+def test_copying(copy_function):
+    dict_one = CopyOnWriteDict((i, i) for i in range(100))
+    dict_two = copy_function(dict_one)
+    if isinstance(dict_two, bytes):
+        dict_two = pickle.loads(dict_two)
+    dict_two[0] = "changed"
+    dict_two[100] = "added"
+    assert dict_one == {i: i for i in range(100)}
+    dict_one[1] = "changed"
+    assert dict_two[1] == 1
+
+
+def test_session_node_trees(monkeypatch):
+    def make_session():
+        session = supriya.nonrealtime.Session()
+        with session.at(0):
+            groups = [session.add_group(duration=10) for _ in range(20)]
+        for i, group in enumerate(groups):
+            with session.at(i * 0.5):
+                group.add_group(duration=0.25)
+        with session.at(5):
+            groups[0].move_node(groups[-1], "ADD_TO_TAIL")
+        return session
+
+    expected = make_session().to_lists(duration=10)
+    monkeypatch.setattr(supriya.nonrealtime.State, "_maximum_dict_length", 8)
+    session = make_session()
+    assert session.to_lists(duration=10) == expected
+    trees = [
+        session.states[offset].nodes_to_children
+        for offset in session.offsets
+        if len(session.states[offset].nodes_to_children) > 8
+    ]
+    assert all(isinstance(tree, CopyOnWriteDict) for tree in trees[1:])
+    # Successive states share all but the subtries their transitions touched
+    for tree_one, tree_two in zip(trees[1:], trees[2:]):
+        shared_count = sum(x is y for x, y in zip(tree_one._root, tree_two._root))
+        assert shared_count >= 60
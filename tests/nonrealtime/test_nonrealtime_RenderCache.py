@@ -0,0 +1,132 @@
+import json
+import os
+import time
+import wave
+
+import pytest
+
+from supriya.nonrealtime import RenderCache
+
+
+def write_soundfile(path, frame_count=100):
+    with wave.open(str(path), "wb") as file_pointer:
+        file_pointer.setnchannels(1)
+        file_pointer.setsampwidth(2)
+        file_pointer.setframerate(44100)
+        file_pointer.writeframes(b"\x00\x00" * frame_count)
+    return os.path.getsize(path)
+
+
+def test_index(tmp_path):
+    cache = RenderCache(tmp_path)
+    assert cache.get("session-a.wav") is None
+    write_soundfile(tmp_path / "session-a.wav")
+    # Unindexed files are not hits, even if intact
+    assert cache.get("session-a.wav") is None
+    cache.set("session-a.wav", duration=1.5, sample_format="int16")
+    assert cache.get("session-a.wav") == tmp_path / "session-a.wav"
+    assert (cache.hits, cache.misses) == (1, 2)
+    index = json.loads(cache.index_path.read_text())
+    entry = index["entries"]["session-a.wav"]
+    assert entry["duration"] == 1.5
+    assert entry["sample_format"] == "int16"
+    assert entry["size"] == (tmp_path / "session-a.wav").stat().st_size
+    assert "session-a.wav" in RenderCache(tmp_path)
+    assert len(RenderCache(tmp_path)) == 1
+
+
+def test_index_writes(tmp_path):
+    cache = RenderCache(tmp_path)
+    write_soundfile(tmp_path / "session-a.wav")
+    cache.set("session-a.wav")
+    data = cache.index_path.read_bytes()
+    for _ in range(3):
+        assert cache.get("session-a.wav") is not None
+    # Hits only update the index in memory, until written back at once
+    assert cache.index_path.read_bytes() == data
+    cache.evict()
+    entries = json.loads(cache.index_path.read_text())["entries"]
+    assert entries == cache._entries
+
+
+def test_verification(tmp_path):
+    cache = RenderCache(tmp_path)
+    (tmp_path / "session-a.aiff").write_bytes(b"FORM\x00\x00")
+    with pytest.raises(ValueError):
+        cache.set("session-a.aiff")
+    write_soundfile(tmp_path / "session-b.wav")
+    cache.set("session-b.wav")
+    (tmp_path / "session-b.osc").write_bytes(b"")
+    # Same size, but a clobbered header
+    data = bytearray((tmp_path / "session-b.wav").read_bytes())
+    data[:4] = b"JUNK"
+    (tmp_path / "session-b.wav").write_bytes(data)
+    assert cache.get("session-b.wav") is None
+    assert "session-b.wav" not in cache
+    assert not (tmp_path / "session-b.wav").exists()
+    assert not (tmp_path / "session-b.osc").exists()
+
+
+def test_eviction(monkeypatch, tmp_path):
+    sizes = [
+        write_soundfile(tmp_path / f"session-{i}.wav", 100 * (i + 1)) for i in range(4)
+    ]
+    cache = RenderCache(tmp_path, maximum_size=sizes[0] + sizes[2] + sizes[3])
+    for i, last_access in enumerate([1, 0, 2, 3]):
+        monkeypatch.setattr(time, "time", lambda: last_access)
+        cache.set(f"session-{i}.wav")
+    monkeypatch.undo()
+    cache.evict()
+    assert sorted(cache._entries) == ["session-0.wav", "session-2.wav", "session-3.wav"]
+    assert not (tmp_path / "session-1.wav").exists()
+    # Retained keys survive even when least recently used
+    cache._maximum_size = sizes[0] + sizes[3]
+    cache.evict(retained=["session-0.wav"])
+    assert sorted(cache._entries) == ["session-0.wav", "session-3.wav"]
+    assert sorted(RenderCache(tmp_path)._entries) == sorted(cache._entries)
+    # Scores beside outputs count against the budget too
+    (tmp_path / "session-4.osc").write_bytes(b"\x00" * sizes[3])
+    write_soundfile(tmp_path / "session-4.wav", 100)
+    cache.set("session-4.wav")
+    assert cache._entries["session-4.wav"]["score_size"] == sizes[3]
+    # Only over budget when counting the score
+    cache._maximum_size = 2 * (sizes[0] + sizes[3]) - 1
+    cache.evict()
+    assert sorted(cache._entries) == ["session-3.wav", "session-4.wav"]
+    # Clearing leaves other renders' temporary files alone
+    (tmp_path / "index-abc.tmp").write_bytes(b"")
+    (tmp_path / "session-5-abc.tmp").write_bytes(b"")
+    cache.clear()
+    assert len(cache) == 0
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "index.json",
+        "index.lock",
+        "session-5-abc.tmp",
+    ]
+
+
+def test_shared_directory(tmp_path):
+    for name in ("a", "b", "c"):
+        write_soundfile(tmp_path / f"session-{name}.wav")
+    cache_a = RenderCache(tmp_path)
+    cache_a.set("session-a.wav")
+    cache_b = RenderCache(tmp_path)
+    cache_a.set("session-c.wav")
+    # Writes merge with, rather than overwrite, the other cache's entries
+    cache_b.set("session-b.wav")
+    assert sorted(RenderCache(tmp_path)._entries) == [
+        "session-a.wav",
+        "session-b.wav",
+        "session-c.wav",
+    ]
+    # Hits and removals are merged too
+    assert cache_a.get("session-a.wav") is not None
+    last_access = cache_a._entries["session-a.wav"]["last_access"]
+    (tmp_path / "session-c.wav").unlink()
+    assert cache_b.get("session-c.wav") is None
+    cache_b.evict()
+    cache_a.evict()
+    entries = RenderCache(tmp_path)._entries
+    assert sorted(entries) == ["session-a.wav", "session-b.wav"]
+    assert entries["session-a.wav"]["last_access"] == last_access
+    assert cache_a._entries == entries
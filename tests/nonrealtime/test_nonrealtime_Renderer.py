@@ -0,0 +1,239 @@
+import asyncio
+import wave
+from pathlib import Path
+
+import pytest
+
+import supriya.nonrealtime
+
+
+class SlowRenderable:
+    """
+    Renders after a delay, tracking how many renders overlap.
+    """
+
+    active_count = 0
+    maximum_active_count = 0
+
+    def __init__(self, name, delay=0.1, exit_code=0):
+        self.delay = delay
+        self.exit_code = exit_code
+        self.name = name
+
+    def __render__(self, render_directory_path=None, **kwargs):
+        async def render_function():
+            type(self).active_count += 1
+            type(self).maximum_active_count = max(
+                type(self).maximum_active_count, type(self).active_count
+            )
+            await asyncio.sleep(self.delay)
+            type(self).active_count -= 1
+            if not self.exit_code:
+                write_soundfile(path)
+            return self.exit_code
+
+        path = Path(render_directory_path) / f"{self.name}.wav"
+        return render_function, path
+
+
+def write_soundfile(path, frame_count=100):
+    with wave.open(str(path), "wb") as file_pointer:
+        file_pointer.setnchannels(1)
+        file_pointer.setsampwidth(2)
+        file_pointer.setframerate(44100)
+        file_pointer.writeframes(b"\x00\x00" * frame_count)
+
+
+@pytest.fixture(autouse=True)
+def reset_counts():
+    SlowRenderable.active_count = 0
+    SlowRenderable.maximum_active_count = 0
+
+
+def make_renderer(renderables, render_directory_path, **kwargs):
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        for renderable in renderables:
+            session.add_buffer(channel_count=1, file_path=renderable)
+    renderer = supriya.nonrealtime.Renderer(
+        session,
+        duration=1,
+        header_format="wav",
+        render_directory_path=render_directory_path,
+        **kwargs,
+    )
+    render_function, path = renderer.render()
+    # The final session "exists" already, so only its dependencies render
+    write_soundfile(path)
+    if renderer.cache is not None:
+        renderer.cache.set(path.name)
+    return renderer, render_function
+
+
+@pytest.mark.parametrize("max_workers, expected", [(1, 1), (2, 2), (8, 4)])
+def test_max_workers(nonrealtime_paths, max_workers, expected):
+    renderables = [SlowRenderable(f"slow-{i}") for i in range(4)]
+    renderer, render_function = make_renderer(
+        renderables, nonrealtime_paths.render_directory_path, max_workers=max_workers
+    )
+    assert asyncio.run(render_function()) == 0
+    assert SlowRenderable.maximum_active_count == expected
+    assert set(renderer.render_timings) == set(renderables)
+    assert all(timing >= 0.1 for timing in renderer.render_timings.values())
+    for renderable in renderables:
+        assert (
+            nonrealtime_paths.render_directory_path / f"{renderable.name}.wav"
+        ).exists()
+
+
+def test_cached_renderables_are_skipped(nonrealtime_paths):
+    renderables = [SlowRenderable(f"slow-{i}") for i in range(4)]
+    for renderable in renderables[:3]:
+        (
+            nonrealtime_paths.render_directory_path / f"{renderable.name}.wav"
+        ).write_bytes(b"")
+    renderer, render_function = make_renderer(
+        renderables, nonrealtime_paths.render_directory_path, max_workers=4
+    )
+    assert asyncio.run(render_function()) == 0
+    assert list(renderer.render_timings) == [renderables[3]]
+
+
+def test_failure_stops_launching(nonrealtime_paths):
+    renderables = [
+        SlowRenderable("fails", delay=0.01, exit_code=1),
+        SlowRenderable("slow", delay=0.1),
+        *(SlowRenderable(f"never-{i}") for i in range(2)),
+    ]
+    renderer, render_function = make_renderer(
+        renderables, nonrealtime_paths.render_directory_path, max_workers=2
+    )
+    with pytest.raises(RuntimeError, match="Non-zero exit code: 1"):
+        asyncio.run(render_function())
+    # The running render finishes, but nothing new is launched after the error
+    assert set(renderer.render_timings) == set(renderables[:2])
+    assert SlowRenderable.active_count == 0
+
+
+def test_invalid_max_workers():
+    with pytest.raises(ValueError):
+        supriya.nonrealtime.Renderer(supriya.nonrealtime.Session(), max_workers=0)
+
+
+def test_cache(tmp_path):
+    cache = supriya.nonrealtime.RenderCache(tmp_path)
+    renderables = [SlowRenderable(f"slow-{i}", delay=0.01) for i in range(3)]
+    # A partial file left by a crashed render is not a hit
+    (tmp_path / "slow-0.wav").write_bytes(b"RIFF")
+    renderer, render_function = make_renderer(renderables, None, cache=cache)
+    assert renderer.render_directory_path == tmp_path.resolve()
+    assert asyncio.run(render_function()) == 0
+    assert set(renderer.render_timings) == set(renderables)
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert len(cache) == 4
+    # A fresh cache reads the index back, and everything is a hit
+    cache = supriya.nonrealtime.RenderCache(tmp_path)
+    renderer, render_function = make_renderer(renderables, None, cache=cache)
+    assert asyncio.run(render_function()) == 0
+    assert renderer.render_timings == {}
+    assert (cache.hits, cache.misses) == (4, 0)
+    # Truncated outputs fail verification and render again
+    path = tmp_path / "slow-1.wav"
+    path.write_bytes(path.read_bytes()[:-10])
+    renderer, render_function = make_renderer(renderables, None, cache=cache)
+    assert asyncio.run(render_function()) == 0
+    assert list(renderer.render_timings) == [renderables[1]]
+    assert (cache.hits, cache.misses) == (7, 1)
+
+
+def test_cache_directory_mismatch(tmp_path):
+    cache = supriya.nonrealtime.RenderCache(tmp_path / "cache")
+    with pytest.raises(ValueError):
+        supriya.nonrealtime.Renderer(
+            supriya.nonrealtime.Session(),
+            cache=cache,
+            render_directory_path=tmp_path / "elsewhere",
+        )
+
+
+def test_streaming(monkeypatch, tmp_path):
+    synthdef = pytest.helpers.build_dc_synthdef()
+    dependency = supriya.nonrealtime.Session(0, 1)
+    with dependency.at(0):
+        dependency.add_synth(synthdef=synthdef, duration=1)
+    session = supriya.nonrealtime.Session(1, 1, input_=dependency)
+    with session.at(0):
+        session.add_buffer(channel_count=1, file_path=SlowRenderable("slow"))
+    for i in range(100):
+        with session.at(i * 0.25):
+            session.add_synth(synthdef=synthdef, duration=0.5, source=i)
+    renderer = supriya.nonrealtime.Renderer(
+        session, duration=30, render_directory_path=tmp_path
+    )
+    dependency_graph, renderable_memos = renderer._build_dependency_graph()
+    renderer._xref_dependency_graph(dependency_graph, renderable_memos)
+    expected = {
+        Path(memo.output_filename).with_suffix(".osc").name: memo.datagram
+        for memo in renderable_memos.values()
+        if isinstance(memo, supriya.nonrealtime.sessions.SessionRenderableMemo)
+    }
+    assert not list(tmp_path.iterdir())
+    # Streaming writes the same scores, under the same names, while preparing
+    passes = []
+    iterate = supriya.nonrealtime.Session._iterate_non_xrefd_request_bundles
+
+    def iterate_and_count(self, duration=None):
+        passes.append(self)
+        return iterate(self, duration)
+
+    monkeypatch.setattr(
+        supriya.nonrealtime.Session,
+        "_iterate_non_xrefd_request_bundles",
+        iterate_and_count,
+    )
+    renderer = supriya.nonrealtime.Renderer(
+        session, duration=30, render_directory_path=tmp_path, streaming=True
+    )
+    _, path = renderer.render()
+    assert {path.name: path.read_bytes() for path in tmp_path.iterdir()} == expected
+    assert b"slow.wav" in expected[path.with_suffix(".osc").name]
+    # Only scores with dependencies are generated a second time
+    assert passes.count(session) == 2
+    assert passes.count(dependency) == 1
+
+
+def test_streaming_failure(tmp_path):
+    class BrokenRenderable:
+        def __render__(self, **kwargs):
+            raise RuntimeError
+
+    synthdef = pytest.helpers.build_dc_synthdef()
+    dependency = supriya.nonrealtime.Session(0, 1)
+    with dependency.at(0):
+        dependency.add_synth(synthdef=synthdef, duration=1)
+    session = supriya.nonrealtime.Session(1, 1, input_=dependency)
+    with session.at(0):
+        session.add_buffer(channel_count=1, file_path=BrokenRenderable())
+    renderer = supriya.nonrealtime.Renderer(
+        session, render_directory_path=tmp_path, streaming=True
+    )
+    with pytest.raises(RuntimeError):
+        renderer.render()
+    # Finished scores may stay, but no partially prepared ones
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_streaming_to_osc_bundles(tmp_path):
+    synthdef = pytest.helpers.build_dc_synthdef()
+    session = supriya.nonrealtime.Session(0, 1)
+    with session.at(0):
+        session.add_synth(synthdef=synthdef, duration=1)
+    expected = supriya.nonrealtime.Renderer(
+        session, render_directory_path=tmp_path
+    ).to_osc_bundles()
+    renderer = supriya.nonrealtime.Renderer(
+        session, render_directory_path=tmp_path, streaming=True
+    )
+    assert expected
+    assert renderer.to_osc_bundles() == expected
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from supriya.nonrealtime.states import SortedOffsetList
+
+
+@pytest.fixture(autouse=True)
+def short_blocks(monkeypatch):
+    # Short blocks exercise splitting and emptying blocks with few offsets
+    monkeypatch.setattr(SortedOffsetList, "_block_length", 4)
+
+
+def test_random_operations():
+    random_ = random.Random(0)
+    offsets = SortedOffsetList()
+    expected = []
+    for _ in range(2000):
+        offset = float(random_.randrange(200))
+        if offset in expected and random_.random() < 0.4:
+            offsets.remove(offset)
+            expected.remove(offset)
+        else:
+            offsets.add(offset)
+            if offset not in expected:
+                expected.append(offset)
+                expected.sort()
+        assert offsets == expected
+        assert len(offsets) == len(expected)
+    assert list(reversed(offsets)) == expected[::-1]
+    assert offsets[1:-1] == expected[1:-1]
+    for i, offset in enumerate(expected):
+        assert offsets[i] == offsets[i - len(expected)] == offset
+        assert offsets.index(offset) == i
+        assert offset in offsets
+        assert offset + 0.5 not in offsets
+    for offset in range(-1, 201):
+        offset -= 0.5 * (offset % 2)
+        assert list(offsets.iterate_after(offset)) == [
+            x for x in expected if offset < x
+        ]
+        assert list(offsets.iterate_before(offset)) == [
+            x for x in reversed(expected) if x < offset
+        ]
+
+
+def test_errors():
+    offsets = SortedOffsetList([0.0, 1.0])
+    with pytest.raises(IndexError):
+        offsets[2]
+    with pytest.raises(ValueError):
+        offsets.index(0.5)
+    with pytest.raises(ValueError):
+        offsets.remove(2.0)
+    assert offsets == [0.0, 1.0]
+    assert offsets != [0.0]
+    assert offsets != "ab"
@@ -1,3 +1,4 @@
+import pytest
 from uqbar.strings import normalize
 
 import supriya
@@ -60,3 +61,64 @@ def test_new_ntp_era():
     seconds = 2**32 - supriya.osc.messages.NTP_DELTA + 1
     datagram = supriya.osc.OscBundle._encode_date(seconds=seconds)
     assert datagram.hex() == "0000000100000000"
+
+
+@pytest.mark.parametrize(
+    "osc_message",
+    [
+        supriya.osc.OscMessage("/status"),
+        supriya.osc.OscMessage("/n_set", 1000, "frequency", 443.0, "amplitude", 0.5),
+        supriya.osc.OscMessage("/s_new", "default", 1001, 0, 1, "pan", -0.25),
+        supriya.osc.OscMessage("/sync", 2),
+        supriya.osc.OscMessage("/notify", True, False, None, ""),
+        supriya.osc.OscMessage("/foo", 1, 2.5, "abc", "abcd"),
+        supriya.osc.OscMessage("/g_new", 1, supriya.AddAction.ADD_TO_HEAD, 0),
+        supriya.osc.OscMessage("/b_setn", 0, 0, 3, [0.0, 0.5, 1.0]),
+    ],
+)
+def test_to_datagram_fast_path(osc_message):
+    datagram = osc_message.to_datagram()
+    assert isinstance(datagram, bytes)
+    assert datagram == osc_message._to_datagram_generic()
+    assert supriya.osc.OscMessage.from_datagram(datagram) == osc_message
+
+
+def test_from_datagram_runs():
+    osc_message = supriya.osc.OscMessage(
+        "/b_setn.reply", 1, 0, 1024, *(x / 1024 for x in range(1024)), "done", 7
+    )
+    datagram = osc_message.to_datagram()
+    assert supriya.osc.OscMessage.from_datagram(datagram) == osc_message
+    assert supriya.osc.OscMessage.from_datagram(memoryview(datagram)) == osc_message
+    assert supriya.osc.OscMessage.from_datagram(bytearray(datagram)) == osc_message
+
+
+def test_from_datagram_blobs():
+    osc_message = supriya.osc.OscMessage(
+        "/d_recv",
+        b"SCgf\x00\x00\x00\x02",
+        b"/not-a-message",
+        supriya.osc.OscMessage("/s_new", "default", 1000, 0, 1),
+        supriya.osc.OscBundle(contents=[supriya.osc.OscMessage("/n_free", 1000)]),
+        # Blobs that only look like bundles stay bytes
+        b"#bundle\x00abc",
+        b"#bundle\x00abcdefgh\x00\x00\x00\x20xx",
+    )
+    datagram = osc_message.to_datagram()
+    assert supriya.osc.OscMessage.from_datagram(datagram) == osc_message
+
+
+def test_template():
+    template = supriya.osc.OscMessageTemplate(
+        "/s_new", "default", int, int, int, "frequency", float, "gate", int
+    )
+    osc_message = supriya.osc.OscMessage(
+        "/s_new", "default", 1000, 0, 1, "frequency", 443.0, "gate", 1
+    )
+    assert template.to_datagram(1000, 0, 1, 443, 1) == osc_message.to_datagram()
+    assert template.to_osc_message(1000, 0, 1, 443, 1) == osc_message
+    buffer = bytearray(template.size + 4)
+    assert template.pack_into(buffer, 4, 1000, 0, 1, 443.0, 1) == len(buffer)
+    assert bytes(buffer[4:]) == osc_message.to_datagram()
+    with pytest.raises(ValueError):
+        template.to_datagram(1000, 0, 1, 443.0)
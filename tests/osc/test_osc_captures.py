@@ -0,0 +1,74 @@
+import pytest
+
+from supriya.osc import (
+    AsyncOscProtocol,
+    Capture,
+    CaptureEntry,
+    OscBundle,
+    OscMessage,
+    RingCapture,
+)
+
+
+def record(capture, count):
+    for i in range(count):
+        message = OscMessage("/n_set", 1000 + i, "frequency", 440.0)
+        capture._record("S", message, message.to_datagram())
+        reply = OscMessage("/n_go", 1000 + i, 1, -1, -1, 0)
+        capture._record("R", reply, reply.to_datagram())
+
+
+def test_Capture():
+    osc_protocol = AsyncOscProtocol()
+    with osc_protocol.capture() as capture:
+        assert capture in osc_protocol.captures
+        record(capture, 3)
+    assert capture not in osc_protocol.captures
+    assert type(capture) is Capture
+    assert len(capture) == 6
+    assert [message for _, message in capture.sent_messages] == [
+        OscMessage("/n_set", 1000 + i, "frequency", 440.0) for i in range(3)
+    ]
+
+
+def test_RingCapture():
+    osc_protocol = AsyncOscProtocol()
+    with osc_protocol.capture(capacity=4) as capture:
+        assert len(capture) == 0
+        record(capture, 5)
+    assert isinstance(capture, RingCapture)
+    assert len(capture) == 4
+    assert [(entry.label, entry.message) for entry in capture] == [
+        ("S", OscMessage("/n_set", 1003, "frequency", 440.0)),
+        ("R", OscMessage("/n_go", 1003, 1, -1, -1, 0)),
+        ("S", OscMessage("/n_set", 1004, "frequency", 440.0)),
+        ("R", OscMessage("/n_go", 1004, 1, -1, -1, 0)),
+    ]
+    timestamps = [entry.timestamp for entry in capture]
+    assert timestamps == sorted(timestamps)
+    assert [message for _, message in capture.received_messages] == [
+        OscMessage("/n_go", 1003, 1, -1, -1, 0),
+        OscMessage("/n_go", 1004, 1, -1, -1, 0),
+    ]
+    with capture:
+        assert len(capture) == 0
+    with pytest.raises(ValueError):
+        osc_protocol.capture(capacity=0)
+
+
+@pytest.mark.parametrize("capacity", [None, 16])
+def test_dump_and_load(capacity, tmp_path):
+    osc_protocol = AsyncOscProtocol()
+    bundle = OscBundle(timestamp=1.5, contents=[OscMessage("/n_free", 1000)])
+    with osc_protocol.capture(capacity=capacity) as capture:
+        record(capture, 2)
+        capture._record("S", bundle, bundle.to_datagram())
+    path = tmp_path / "capture.bin"
+    capture.dump(path)
+    entries = Capture.load(path)
+    assert all(isinstance(entry, CaptureEntry) for entry in entries)
+    assert entries == list(capture)
+    assert entries[-1].message == bundle
+    path.write_bytes(b"garbage")
+    with pytest.raises(ValueError):
+        Capture.load(path)
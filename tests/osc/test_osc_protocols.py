@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import socket
+import threading
 import time
 
 import pytest
@@ -7,6 +9,8 @@ import pytest
 from supriya.osc import (
     AsyncOscProtocol,
     HealthCheck,
+    OscBundle,
+    OscMessage,
     ThreadedOscProtocol,
     find_free_port,
 )
@@ -75,3 +79,193 @@ def test_ThreadedOscProtocol():
             break
     assert healthcheck_failed
     assert not osc_protocol.is_running
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_window", [0.0, 0.01])
+async def test_AsyncOscProtocol_batching(batch_window):
+    class Receiver(asyncio.DatagramProtocol):
+        def datagram_received(self, data, addr):
+            datagrams.append(data)
+
+    datagrams = []
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        Receiver, local_addr=("127.0.0.1", 0)
+    )
+    try:
+        port = transport.get_extra_info("sockname")[1]
+        osc_protocol = AsyncOscProtocol(batch_window=batch_window)
+        await osc_protocol.connect("127.0.0.1", port)
+        messages = [
+            OscMessage("/n_set", 1000 + i, "frequency", 440.0 + i) for i in range(1000)
+        ]
+        for message in messages:
+            osc_protocol.send(message)
+        assert not datagrams
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if len(datagrams) == osc_protocol.datagrams_sent:
+                break
+        await osc_protocol.disconnect()
+    finally:
+        transport.close()
+    assert osc_protocol.messages_sent == 1000
+    assert osc_protocol.datagrams_sent == len(datagrams) < 10
+    assert all(len(datagram) <= 8192 for datagram in datagrams)
+    received = []
+    for datagram in datagrams:
+        received.extend(OscBundle.from_datagram(datagram).contents)
+    assert received == messages
+
+
+def test_pack_datagrams():
+    from supriya.osc.protocols import _pack_datagrams
+
+    small = OscMessage("/n_free", 1000).to_datagram()
+    bundle = OscBundle(timestamp=1.5, contents=[OscMessage("/n_free", 1001)])
+    large = OscMessage("/b_setn", 0, 0, 2048, *[0.0] * 2048).to_datagram()
+    assert list(_pack_datagrams([small])) == [small]
+    packed = list(
+        _pack_datagrams([small, small, bundle.to_datagram(), small, large, small])
+    )
+    assert [len(x) for x in packed] == [
+        56,
+        len(bundle.to_datagram()),
+        16,
+        len(large),
+        16,
+    ]
+    assert OscBundle.from_datagram(packed[0]).contents == (
+        OscMessage("/n_free", 1000),
+        OscMessage("/n_free", 1000),
+    )
+
+
+def test_ThreadedOscProtocol_bulk_receive():
+    received = []
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    osc_protocol = ThreadedOscProtocol(bulk_receive=True, max_batch_size=64)
+    osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+    try:
+        osc_protocol.register(pattern="/tr", procedure=received.append)
+        osc_protocol.send(OscMessage("/notify", 1))
+        _, address = peer.recvfrom(8192)
+        for i in range(500):
+            peer.sendto(OscMessage("/tr", 1000, 0, float(i)).to_datagram(), address)
+            if i % 50 == 49:
+                time.sleep(0.01)
+        peer.sendto(b"garbage", address)
+        for _ in range(100):
+            time.sleep(0.01)
+            if osc_protocol.datagrams_received == 501:
+                break
+    finally:
+        osc_protocol.disconnect()
+        peer.close()
+    assert received == [OscMessage("/tr", 1000, 0, float(i)) for i in range(500)]
+    assert osc_protocol.decode_errors == 1
+    assert osc_protocol.kernel_drops in (0, None)
+    assert 1 <= osc_protocol.max_receive_queue_depth <= 64
+
+
+def test_ThreadedOscProtocol_bulk_receive_kernel_drops():
+    def procedure(message):
+        received.append(message)
+        # Stall the server thread so the kernel's receive buffer overflows
+        event.wait(1)
+
+    event = threading.Event()
+    received = []
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    osc_protocol = ThreadedOscProtocol(bulk_receive=True, receive_buffer_size=4096)
+    osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+    try:
+        if osc_protocol.kernel_drops is None:
+            pytest.skip("kernel drops not reported on this platform")
+        osc_protocol.register(pattern="/tr", procedure=procedure)
+        osc_protocol.send(OscMessage("/notify", 1))
+        _, address = peer.recvfrom(8192)
+        peer.sendto(OscMessage("/tr", 1000, 0, 0.0).to_datagram(), address)
+        for _ in range(100):
+            time.sleep(0.01)
+            if received:
+                break
+        for i in range(1, 500):
+            peer.sendto(OscMessage("/tr", 1000, 0, float(i)).to_datagram(), address)
+        event.set()
+        # Received datagrams report the drops before them, so send one more
+        time.sleep(0.1)
+        peer.sendto(OscMessage("/tr", 1000, 0, 500.0).to_datagram(), address)
+        for _ in range(100):
+            time.sleep(0.01)
+            if received[-1].contents[-1] == 500.0:
+                break
+    finally:
+        osc_protocol.disconnect()
+        peer.close()
+    assert 0 < osc_protocol.kernel_drops
+    assert len(received) + osc_protocol.kernel_drops == 501
+
+
+def test_ThreadedOscProtocol_bulk_receive_errors(caplog):
+    def procedure(message):
+        received.append(message)
+        if message.contents[-1] == 1.0:
+            raise RuntimeError("callback failed")
+
+    class FailingSocket:
+        def recvfrom(self, *args):
+            raise ConnectionResetError
+
+        recvmsg = recvfrom
+
+    received = []
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    osc_protocol = ThreadedOscProtocol(bulk_receive=True, max_batch_size=64)
+    osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+    try:
+        osc_protocol.register(pattern="/tr", procedure=procedure)
+        osc_protocol.send(OscMessage("/notify", 1))
+        _, address = peer.recvfrom(8192)
+        for i in range(3):
+            peer.sendto(OscMessage("/tr", 1000, 0, float(i)).to_datagram(), address)
+        for _ in range(100):
+            time.sleep(0.01)
+            if len(received) == 3:
+                break
+        # A failing callback neither skips the rest of its batch nor kills
+        # the server thread
+        assert received == [OscMessage("/tr", 1000, 0, float(i)) for i in range(3)]
+        assert osc_protocol.osc_server_thread.is_alive()
+        assert "callback failed" in caplog.text
+        # Nor does a socket error, which ends the batch
+        osc_protocol._receive_bulk(FailingSocket(), 8192)
+        assert osc_protocol.receive_queue_depth == 0
+        assert "failed to receive" in caplog.text
+    finally:
+        osc_protocol.disconnect()
+        peer.close()
+
+
+def test_OscProtocol_match_callbacks():
+    osc_protocol = AsyncOscProtocol()
+    done = osc_protocol.register(pattern="/done", procedure=print)
+    synced = osc_protocol.register(pattern=["/synced", 1], procedure=print, once=True)
+    n_go = osc_protocol.register(
+        pattern=["/n_go", 1000], procedure=print, failure_pattern=["/fail", "/s_new"]
+    )
+    assert osc_protocol._match_callbacks(OscMessage("/done", "/b_alloc", 0)) == [done]
+    assert osc_protocol._match_callbacks(OscMessage("/synced", 2)) == []
+    assert osc_protocol._match_callbacks(OscMessage("/synced", 1)) == [synced]
+    assert osc_protocol._match_callbacks(OscMessage("/synced", 1)) == []
+    assert osc_protocol._match_callbacks(OscMessage("/n_go", 1000, 1, -1)) == [n_go]
+    assert osc_protocol._match_callbacks(OscMessage("/fail", "/s_new", "x")) == [n_go]
+    assert osc_protocol._match_callbacks(OscMessage("/b_setn", [1, 2])) == []
+    osc_protocol.unregister(n_go)
+    osc_protocol.unregister(done)
+    assert osc_protocol.callbacks == {}
+    assert osc_protocol._max_pattern_length == 0
@@ -251,3 +251,33 @@ async def test_boot_reboot_sticky_options(executable, maximum_node_count):
     assert server._options.memory_size == options.memory_size
     assert server._options.maximum_node_count == options.maximum_node_count
     assert server.port == options.port
+
+
+@pytest.mark.asyncio
+async def test_communicate_many_async():
+    server = AsyncServer()
+    await server.boot()
+    try:
+        requests = [
+            supriya.commands.BufferAllocateRequest(
+                buffer_id=i, frame_count=512 * (i + 1), channel_count=1
+            )
+            for i in range(8)
+        ]
+        responses = await supriya.commands.Requestable.communicate_many_async(
+            requests, server
+        )
+        assert responses == [
+            supriya.commands.DoneResponse(action=("/b_alloc", i)) for i in range(8)
+        ]
+        requests = [
+            supriya.commands.BufferQueryRequest(buffer_ids=[i]) for i in range(8)
+        ]
+        responses = await supriya.commands.Requestable.communicate_many_async(
+            requests, server
+        )
+        assert [response.items[0].frame_count for response in responses] == [
+            512 * (i + 1) for i in range(8)
+        ]
+    finally:
+        await server.quit()
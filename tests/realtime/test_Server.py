@@ -519,3 +519,22 @@ def test_connect_and_reconnect_sticky_options(executable, maximum_node_count):
 
     finally:
         protocol.quit()
+
+
+def test_communicate_many(server):
+    requests = [
+        supriya.commands.BufferAllocateRequest(
+            buffer_id=i, frame_count=512 * (i + 1), channel_count=1
+        )
+        for i in range(8)
+    ]
+    responses = supriya.commands.Requestable.communicate_many(requests, server)
+    assert responses == [
+        supriya.commands.DoneResponse(action=("/b_alloc", i)) for i in range(8)
+    ]
+    requests = [supriya.commands.BufferQueryRequest(buffer_ids=[i]) for i in range(8)]
+    responses = supriya.commands.Requestable.communicate_many(requests, server)
+    assert [response.items[0].frame_count for response in responses] == [
+        512 * (i + 1) for i in range(8)
+    ]
+    assert [request.response for request in requests] == responses
@@ -0,0 +1,95 @@
+import os
+
+import supriya.ugens
+from supriya.synthdefs import SynthDefCache, SynthDefFactory, synthdef
+
+
+def make_factory(iterations=2):
+    def signal_block(builder, source, state):
+        for _ in range(iterations):
+            source = supriya.ugens.AllpassC.ar(source=source, maximum_delay_time=0.1)
+        return source
+
+    return SynthDefFactory().with_input().with_output().with_signal_block(signal_block)
+
+
+def test_factory(tmp_path):
+    cache = SynthDefCache(tmp_path)
+    factory = make_factory()
+    synthdef_one = factory.build(name="allpass", cache=cache, channel_count=2)
+    assert (cache.hits, cache.misses) == (0, 1)
+    synthdef_two = make_factory().build(name="allpass", cache=cache, channel_count=2)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert synthdef_two is not synthdef_one
+    assert synthdef_two == synthdef_one
+    assert str(synthdef_two) == str(synthdef_one)
+    (key,) = [path.stem for path in tmp_path.glob("*.pickle")]
+    assert (tmp_path / f"{key}.scsyndef").read_bytes() == synthdef_one.compile()
+    # Any difference in arguments, configuration or code is a new entry
+    factory.build(name="allpass", cache=cache, channel_count=1)
+    factory.build(name="reverb", cache=cache, channel_count=2)
+    factory.with_gate().build(name="allpass", cache=cache, channel_count=2)
+    make_factory(3).build(name="allpass", cache=cache, channel_count=2)
+    assert (cache.hits, cache.misses) == (1, 5)
+    assert len(cache) == 5
+
+
+def test_synthdef_decorator(tmp_path):
+    cache = SynthDefCache(tmp_path)
+
+    def sine(frequency=440, amplitude=0.1):
+        supriya.ugens.Out.ar(
+            bus=0, source=supriya.ugens.SinOsc.ar(frequency=frequency) * amplitude
+        )
+
+    synthdef_one = synthdef(cache=cache)(sine)
+    synthdef_two = synthdef(cache=cache)(sine)
+    synthdef_three = synthdef("ar", cache=cache)(sine)
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert synthdef_one == synthdef_two == synthdef()(sine)
+    assert synthdef_three == synthdef("ar")(sine)
+
+
+def test_corrupt_entry(tmp_path):
+    cache = SynthDefCache(tmp_path)
+    factory = make_factory()
+    expected = factory.build(cache=cache)
+    for path in tmp_path.glob("*.pickle"):
+        path.write_bytes(b"\x80\x04truncated")
+    assert factory.build(cache=cache) == expected
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert factory.build(cache=cache) == expected
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_eviction(tmp_path):
+    def get_entry_size(key):
+        return sum(
+            (tmp_path / f"{key}{suffix}").stat().st_size
+            for suffix in (".pickle", ".scsyndef")
+        )
+
+    cache = SynthDefCache(tmp_path)
+    keys = [cache.get_key(i) for i in range(4)]
+    synthdefs = [make_factory(i + 1).build() for i in range(4)]
+    for i, (key, synthdef_) in enumerate(zip(keys, synthdefs)):
+        cache.set(key, synthdef_)
+        os.utime(tmp_path / f"{key}.pickle", (i, i))
+    sizes = [get_entry_size(key) for key in keys]
+    cache.clear()
+    for i, (key, synthdef_) in enumerate(zip(keys[:3], synthdefs)):
+        cache.set(key, synthdef_)
+        os.utime(tmp_path / f"{key}.pickle", (i, i))
+    # Reading the oldest entry makes the second oldest least recently used
+    assert cache.get(keys[0]) == synthdefs[0]
+    cache._maximum_size = sizes[0] + sizes[2] + sizes[3]
+    cache.set(keys[3], synthdefs[3])
+    assert keys[0] in cache
+    assert keys[1] not in cache
+    assert not (tmp_path / f"{keys[1]}.scsyndef").exists()
+    assert keys[2] in cache
+    assert keys[3] in cache
+    assert len(cache) == 3
+    cache.clear()
+    assert len(cache) == 0
+    assert not list(tmp_path.iterdir())
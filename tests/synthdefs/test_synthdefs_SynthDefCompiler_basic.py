@@ -310,3 +310,44 @@ def test_SynthDefCompiler_basic_05_supriya_vs_sclang():
     )
     sc_compiled_synthdef = bytes(sc_synthdef.compile())
     assert py_compiled_synthdef == sc_compiled_synthdef
+
+
+def test_SynthDefCompiler_basic_wide_graph():
+    voices = 256
+    with supriya.synthdefs.SynthDefBuilder(frequency=110, amplitude=0.1) as builder:
+        partials = [
+            supriya.ugens.SinOsc.ar(frequency=builder["frequency"] * (i % 16 + 1))
+            * (builder["amplitude"] / (i % 16 + 1))
+            for i in range(voices)
+        ]
+        supriya.ugens.Out.ar(bus=0, source=supriya.ugens.Mix.new(partials))
+    py_synthdef = builder.build()
+    ugen_indices = {ugen: i for i, ugen in enumerate(py_synthdef.ugens)}
+    for i, ugen in enumerate(py_synthdef.ugens):
+        for input_ in ugen.inputs:
+            if isinstance(input_, supriya.ugens.OutputProxy):
+                assert ugen_indices[input_.source] < i
+    assert len(py_synthdef.constants) == len(set(py_synthdef.constants))
+    decompiled = supriya.synthdefs.SynthDefDecompiler.decompile_synthdef(
+        py_synthdef.compile()
+    )
+    assert str(decompiled) == str(py_synthdef)
+
+
+def test_SynthDefCompiler_basic_rebuild():
+    with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        sin_osc = supriya.ugens.SinOsc.ar(frequency=builder["frequency"])
+        local_buf = supriya.ugens.LocalBuf.ir(frame_count=2048)
+        chain = supriya.ugens.FFT.kr(buffer_id=local_buf, source=sin_osc)
+        supriya.ugens.Out.ar(bus=0, source=supriya.ugens.IFFT.ar(pv_chain=chain))
+    builder_ugens = list(builder._ugens)
+    builder_inputs = [ugen.inputs for ugen in builder_ugens]
+    py_synthdef = builder.build("rebuilt")
+    # Building neither rewires nor shares the builder's UGens
+    assert builder._ugens[: len(builder_ugens)] == builder_ugens
+    assert [ugen.inputs for ugen in builder_ugens] == builder_inputs
+    assert not set(builder_ugens) & set(py_synthdef.ugens)
+    assert builder.build("rebuilt").compile() == py_synthdef.compile()
+    copied_synthdef = supriya.synthdefs.SynthDef(py_synthdef.ugens, name="rebuilt")
+    assert copied_synthdef.compile() == py_synthdef.compile()
+    assert not set(copied_synthdef.ugens) & set(py_synthdef.ugens)
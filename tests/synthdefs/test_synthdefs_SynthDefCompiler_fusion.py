@@ -0,0 +1,508 @@
+# flake8: noqa
+import platform
+
+import pytest
+from uqbar.strings import normalize
+
+import supriya.synthdefs
+import supriya.ugens
+
+
+@pytest.fixture
+def py_synthdef_01():
+    with supriya.synthdefs.SynthDefBuilder(amplitude=0.1, frequency=1) as builder:
+        modulator = supriya.ugens.SinOsc.kr(frequency=builder["frequency"]) * 100 + 440
+        source = supriya.ugens.SinOsc.ar(frequency=modulator) * builder["amplitude"]
+        supriya.ugens.Out.ar(bus=0, source=source)
+    py_synthdef = builder.build("muladd")
+    return py_synthdef
+
+
+@pytest.fixture
+def py_synthdef_02():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        source = (
+            supriya.ugens.SinOsc.ar()
+            + supriya.ugens.LFNoise1.kr()
+            + supriya.ugens.Saw.ar()
+            + supriya.ugens.WhiteNoise.ar()
+        )
+        supriya.ugens.Out.ar(bus=0, source=source)
+    py_synthdef = builder.build("sum4")
+    return py_synthdef
+
+
+@pytest.fixture
+def py_synthdef_03():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        source = supriya.ugens.SinOsc.ar() * 0.5
+        supriya.ugens.Out.ar(bus=0, source=[source + 0.25, source])
+    py_synthdef = builder.build("shared")
+    return py_synthdef
+
+
+@pytest.fixture
+def py_synthdef_05():
+    # The Splay graph from the Splay compiler tests
+    with supriya.synthdefs.SynthDefBuilder(spread=1, level=0.2, center=0.0) as builder:
+        source = supriya.ugens.Splay.ar(
+            source=supriya.ugens.In.ar(bus=0, channel_count=5),
+            spread=builder["spread"],
+            level=builder["level"],
+            center=builder["center"],
+        )
+        supriya.ugens.Out.ar(bus=0, source=source)
+    py_synthdef = builder.build(name="test")
+    return py_synthdef
+
+
+@pytest.fixture
+def py_synthdef_06():
+    # The multichannel Splay graph from the Splay compiler tests
+    with supriya.synthdefs.SynthDefBuilder(spread=1, level=0.2) as builder:
+        source = supriya.ugens.Splay.ar(
+            source=supriya.ugens.In.ar(bus=0, channel_count=5),
+            spread=builder["spread"],
+            level=builder["level"],
+            center=[-0.25, 0.25],
+        )
+        supriya.ugens.Out.ar(bus=0, source=source)
+    py_synthdef = builder.build(name="test")
+    return py_synthdef
+
+
+def test_SynthDefCompiler_fusion_01_supriya_vs_bytes(py_synthdef_01):
+    assert [type(ugen).__name__ for ugen in py_synthdef_01.ugens] == [
+        "Control",
+        "SinOsc",
+        "MulAdd",
+        "SinOsc",
+        "BinaryOpUGen",
+        "Out",
+    ]
+    # fmt: off
+    test_compiled_synthdef = bytes(
+        b'SCgf'
+        b'\x00\x00\x00\x02'
+        b'\x00\x01'
+            b'\x06muladd'
+                b'\x00\x00\x00\x03'
+                    b'\x00\x00\x00\x00'
+                    b'B\xc8\x00\x00'
+                    b'C\xdc\x00\x00'
+                b'\x00\x00\x00\x02'
+                    b'=\xcc\xcc\xcd'
+                    b'?\x80\x00\x00'
+                b'\x00\x00\x00\x02'
+                    b'\tamplitude'
+                    b'\x00\x00\x00\x00'
+                    b'\tfrequency'
+                    b'\x00\x00\x00\x01'
+                b'\x00\x00\x00\x06'
+                    b'\x07Control'
+                        b'\x01'
+                        b'\x00\x00\x00\x00'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00'
+                            b'\x01'
+                            b'\x01'
+                    b'\x06SinOsc'
+                        b'\x01'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\x00\x00\x00\x00'
+                                b'\x00\x00\x00\x01'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x00'
+                            b'\x01'
+                    b'\x06MulAdd'
+                        b'\x01'
+                        b'\x00\x00\x00\x03'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\x00\x00\x00\x01'
+                                b'\x00\x00\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x01'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x02'
+                            b'\x01'
+                    b'\x06SinOsc'
+                        b'\x02'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\x00\x00\x00\x02'
+                                b'\x00\x00\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x00'
+                            b'\x02'
+                    b'\x0cBinaryOpUGen'
+                        b'\x02'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x02'
+                            b'\x00\x00\x00\x03'
+                                b'\x00\x00\x00\x00'
+                            b'\x00\x00\x00\x00'
+                                b'\x00\x00\x00\x00'
+                            b'\x02'
+                    b'\x03Out'
+                        b'\x02'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x00'
+                        b'\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x00'
+                            b'\x00\x00\x00\x04'
+                                b'\x00\x00\x00\x00'
+                b'\x00\x00'
+    )
+    # fmt: on
+    py_compiled_synthdef = py_synthdef_01.compile()
+    assert py_compiled_synthdef == test_compiled_synthdef
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="hangs on Windows")
+def test_SynthDefCompiler_fusion_01_supriya_vs_sclang(py_synthdef_01):
+    sc_synthdef = supriya.synthdefs.SuperColliderSynthDef(
+        "muladd",
+        r"""
+        arg amplitude=0.1, frequency=1;
+        Out.ar(0, SinOsc.ar(SinOsc.kr(frequency) * 100 + 440) * amplitude);
+        """,
+    )
+    sc_compiled_synthdef = bytes(sc_synthdef.compile())
+    py_compiled_synthdef = py_synthdef_01.compile()
+    assert py_compiled_synthdef == sc_compiled_synthdef
+
+
+def test_SynthDefCompiler_fusion_02_supriya_vs_bytes(py_synthdef_02):
+    # The chain of additions collapses into Sum3, then Sum4, with inputs
+    # sorted by calculation rate
+    assert [type(ugen).__name__ for ugen in py_synthdef_02.ugens] == [
+        "SinOsc",
+        "LFNoise1",
+        "Saw",
+        "WhiteNoise",
+        "Sum4",
+        "Out",
+    ]
+    # fmt: off
+    test_compiled_synthdef = bytes(
+        b'SCgf'
+        b'\x00\x00\x00\x02'
+        b'\x00\x01'
+            b'\x04sum4'
+                b'\x00\x00\x00\x03'
+                    b'C\xdc\x00\x00'
+                    b'\x00\x00\x00\x00'
+                    b'C\xfa\x00\x00'
+                b'\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00'
+                b'\x00\x00\x00\x06'
+                    b'\x06SinOsc'
+                        b'\x02'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x01'
+                            b'\x02'
+                    b'\x08LFNoise1'
+                        b'\x01'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x02'
+                            b'\x01'
+                    b'\x03Saw'
+                        b'\x02'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x00'
+                            b'\x02'
+                    b'\nWhiteNoise'
+                        b'\x02'
+                        b'\x00\x00\x00\x00'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\x02'
+                    b'\x04Sum4'
+                        b'\x02'
+                        b'\x00\x00\x00\x04'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\x00\x00\x00\x00'
+                                b'\x00\x00\x00\x00'
+                            b'\x00\x00\x00\x02'
+                                b'\x00\x00\x00\x00'
+                            b'\x00\x00\x00\x03'
+                                b'\x00\x00\x00\x00'
+                            b'\x00\x00\x00\x01'
+                                b'\x00\x00\x00\x00'
+                            b'\x02'
+                    b'\x03Out'
+                        b'\x02'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x00'
+                        b'\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x01'
+                            b'\x00\x00\x00\x04'
+                                b'\x00\x00\x00\x00'
+                b'\x00\x00'
+    )
+    # fmt: on
+    py_compiled_synthdef = py_synthdef_02.compile()
+    assert py_compiled_synthdef == test_compiled_synthdef
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="hangs on Windows")
+def test_SynthDefCompiler_fusion_02_supriya_vs_sclang(py_synthdef_02):
+    sc_synthdef = supriya.synthdefs.SuperColliderSynthDef(
+        "sum4",
+        r"""
+        Out.ar(0, SinOsc.ar + LFNoise1.kr + Saw.ar + WhiteNoise.ar);
+        """,
+    )
+    sc_compiled_synthdef = bytes(sc_synthdef.compile())
+    py_compiled_synthdef = py_synthdef_02.compile()
+    assert py_compiled_synthdef == sc_compiled_synthdef
+
+
+def test_SynthDefCompiler_fusion_03_supriya_vs_bytes(py_synthdef_03):
+    # The multiplication has two descendants, so is not fused
+    assert [type(ugen).__name__ for ugen in py_synthdef_03.ugens] == [
+        "SinOsc",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "Out",
+    ]
+    # fmt: off
+    test_compiled_synthdef = bytes(
+        b'SCgf'
+        b'\x00\x00\x00\x02'
+        b'\x00\x01'
+            b'\x06shared'
+                b'\x00\x00\x00\x04'
+                    b'C\xdc\x00\x00'
+                    b'\x00\x00\x00\x00'
+                    b'?\x00\x00\x00'
+                    b'>\x80\x00\x00'
+                b'\x00\x00\x00\x00'
+                b'\x00\x00\x00\x00'
+                b'\x00\x00\x00\x04'
+                    b'\x06SinOsc'
+                        b'\x02'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x01'
+                            b'\x02'
+                    b'\x0cBinaryOpUGen'
+                        b'\x02'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x02'
+                            b'\x00\x00\x00\x00'
+                                b'\x00\x00\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x02'
+                            b'\x02'
+                    b'\x0cBinaryOpUGen'
+                        b'\x02'
+                        b'\x00\x00\x00\x02'
+                        b'\x00\x00\x00\x01'
+                        b'\x00\x00'
+                            b'\x00\x00\x00\x01'
+                                b'\x00\x00\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x03'
+                            b'\x02'
+                    b'\x03Out'
+                        b'\x02'
+                        b'\x00\x00\x00\x03'
+                        b'\x00\x00\x00\x00'
+                        b'\x00\x00'
+                            b'\xff\xff\xff\xff'
+                                b'\x00\x00\x00\x01'
+                            b'\x00\x00\x00\x02'
+                                b'\x00\x00\x00\x00'
+                            b'\x00\x00\x00\x01'
+                                b'\x00\x00\x00\x00'
+                b'\x00\x00'
+    )
+    # fmt: on
+    py_compiled_synthdef = py_synthdef_03.compile()
+    assert py_compiled_synthdef == test_compiled_synthdef
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="hangs on Windows")
+def test_SynthDefCompiler_fusion_03_supriya_vs_sclang(py_synthdef_03):
+    sc_synthdef = supriya.synthdefs.SuperColliderSynthDef(
+        "shared",
+        r"""
+        var source;
+        source = SinOsc.ar * 0.5;
+        Out.ar(0, [source + 0.25, source]);
+        """,
+    )
+    sc_compiled_synthdef = bytes(sc_synthdef.compile())
+    py_compiled_synthdef = py_synthdef_03.compile()
+    assert py_compiled_synthdef == sc_compiled_synthdef
+
+
+def test_SynthDefCompiler_fusion_04_rebuild(caplog):
+    caplog.set_level("DEBUG", logger="supriya.synthdefs")
+    with supriya.synthdefs.SynthDefBuilder(amplitude=0.1) as builder:
+        source = supriya.ugens.SinOsc.ar() * builder["amplitude"] + 0.5
+        supriya.ugens.Out.ar(bus=0, source=source)
+    synthdef = builder.build("rebuilt")
+    assert "1 fused" in caplog.text
+    # Fused UGens aren't collected by the builder they're built under
+    assert not any(isinstance(ugen, supriya.ugens.MulAdd) for ugen in builder._ugens)
+    assert builder.build("rebuilt").compile() == synthdef.compile()
+    unoptimized = builder.build("rebuilt", optimize=False)
+    assert [type(ugen).__name__ for ugen in unoptimized.ugens] == [
+        "Control",
+        "SinOsc",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "Out",
+    ]
+
+
+def test_SynthDefCompiler_fusion_05_splay(py_synthdef_05):
+    # Like sclang, the inner positions fuse into MulAdd. sclang rewrites the
+    # first position, -1 * spread + center, as a subtraction, which isn't
+    # implemented.
+    assert normalize(str(py_synthdef_05)) == normalize(
+        """
+        synthdef:
+            name: test
+            ugens:
+            -   Control.kr: null
+            -   BinaryOpUGen(MULTIPLICATION).kr/0:
+                    left: -1.0
+                    right: Control.kr[2:spread]
+            -   BinaryOpUGen(ADDITION).kr/0:
+                    left: BinaryOpUGen(MULTIPLICATION).kr/0[0]
+                    right: Control.kr[0:center]
+            -   MulAdd.kr/0:
+                    source: Control.kr[2:spread]
+                    multiplier: -0.5
+                    addend: Control.kr[0:center]
+            -   MulAdd.kr/1:
+                    source: Control.kr[2:spread]
+                    multiplier: 0.5
+                    addend: Control.kr[0:center]
+            -   BinaryOpUGen(ADDITION).kr/1:
+                    left: Control.kr[2:spread]
+                    right: Control.kr[0:center]
+            -   BinaryOpUGen(MULTIPLICATION).kr/1:
+                    left: Control.kr[1:level]
+                    right: 0.4472135954999579
+            -   In.ar:
+                    bus: 0.0
+            -   Pan2.ar/0:
+                    source: In.ar[0]
+                    position: BinaryOpUGen(ADDITION).kr/0[0]
+                    level: 1.0
+            -   Pan2.ar/1:
+                    source: In.ar[1]
+                    position: MulAdd.kr/0[0]
+                    level: 1.0
+            -   Pan2.ar/2:
+                    source: In.ar[2]
+                    position: Control.kr[0:center]
+                    level: 1.0
+            -   Pan2.ar/3:
+                    source: In.ar[3]
+                    position: MulAdd.kr/1[0]
+                    level: 1.0
+            -   Sum4.ar/0:
+                    input_one: Pan2.ar/0[0]
+                    input_two: Pan2.ar/1[0]
+                    input_three: Pan2.ar/2[0]
+                    input_four: Pan2.ar/3[0]
+            -   Sum4.ar/1:
+                    input_one: Pan2.ar/0[1]
+                    input_two: Pan2.ar/1[1]
+                    input_three: Pan2.ar/2[1]
+                    input_four: Pan2.ar/3[1]
+            -   Pan2.ar/4:
+                    source: In.ar[4]
+                    position: BinaryOpUGen(ADDITION).kr/1[0]
+                    level: 1.0
+            -   BinaryOpUGen(ADDITION).ar/0:
+                    left: Sum4.ar/0[0]
+                    right: Pan2.ar/4[0]
+            -   BinaryOpUGen(MULTIPLICATION).ar/0:
+                    left: BinaryOpUGen(ADDITION).ar/0[0]
+                    right: BinaryOpUGen(MULTIPLICATION).kr/1[0]
+            -   BinaryOpUGen(ADDITION).ar/1:
+                    left: Sum4.ar/1[0]
+                    right: Pan2.ar/4[1]
+            -   BinaryOpUGen(MULTIPLICATION).ar/1:
+                    left: BinaryOpUGen(ADDITION).ar/1[0]
+                    right: BinaryOpUGen(MULTIPLICATION).kr/1[0]
+            -   Out.ar:
+                    bus: 0.0
+                    source[0]: BinaryOpUGen(MULTIPLICATION).ar/0[0]
+                    source[1]: BinaryOpUGen(MULTIPLICATION).ar/1[0]
+        """
+    )
+
+
+def test_SynthDefCompiler_fusion_06_splay(py_synthdef_06):
+    # Each position multiplication is shared by both centers, so only the
+    # level multiplications fuse into the final mix
+    assert [type(ugen).__name__ for ugen in py_synthdef_06.ugens] == [
+        "Control",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "In",
+        "Pan2",
+        "Pan2",
+        "Pan2",
+        "Pan2",
+        "Sum4",
+        "Sum4",
+        "Pan2",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "BinaryOpUGen",
+        "Pan2",
+        "Pan2",
+        "Pan2",
+        "Pan2",
+        "Sum4",
+        "Sum4",
+        "Pan2",
+        "BinaryOpUGen",
+        "MulAdd",
+        "BinaryOpUGen",
+        "MulAdd",
+        "Out",
+    ]
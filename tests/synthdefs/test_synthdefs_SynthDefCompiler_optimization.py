@@ -74,3 +74,110 @@ def test_SynthDefCompiler_optimization_01_supriya_vs_sclang(py_synthdef):
     sc_compiled_synthdef = bytes(sc_synthdef.compile())
     py_compiled_synthdef = py_synthdef.compile()
     assert py_compiled_synthdef == sc_compiled_synthdef
+
+
+def test_SynthDefCompiler_optimization_02_common_subexpressions(caplog):
+    caplog.set_level("DEBUG", logger="supriya.synthdefs")
+    with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        # Multichannel expansion duplicates the (frequency * 2) subgraph
+        sines = supriya.ugens.SinOsc.ar(frequency=builder["frequency"] * [2, 2])
+        # Noise generators are impure, so are never merged
+        noises = [supriya.ugens.WhiteNoise.ar() * 0.5 for _ in range(2)]
+        supriya.ugens.Out.ar(bus=0, source=[sines[0] + sines[1]] + noises)
+    optimized = builder.build("cse")
+    unoptimized = builder.build("cse", optimize=False)
+    assert len(unoptimized.ugens) == 11
+    assert [type(ugen).__name__ for ugen in optimized.ugens] == [
+        "Control",
+        "BinaryOpUGen",
+        "SinOsc",
+        "BinaryOpUGen",
+        "WhiteNoise",
+        "BinaryOpUGen",
+        "WhiteNoise",
+        "BinaryOpUGen",
+        "Out",
+    ]
+    # The merged SinOsc is summed with itself
+    sin_osc = optimized.ugens[2]
+    assert optimized.ugens[3].inputs == (sin_osc[0], sin_osc[0])
+    assert "11 UGens to 9: 2 merged, 0 folded, 0 eliminated" in caplog.text
+    assert optimized.optimization_counts == dict(
+        eliminated=0, folded=0, fused=0, merged=2
+    )
+    assert unoptimized.optimization_counts is None
+
+
+def test_SynthDefCompiler_optimization_03_constant_folding():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        midi = supriya.ugens.BinaryOpUGen(
+            calculation_rate=supriya.CalculationRate.SCALAR,
+            special_index=supriya.BinaryOperator.ADDITION,
+            left=60,
+            right=9,
+        )
+        frequency = supriya.ugens.UnaryOpUGen(
+            calculation_rate=supriya.CalculationRate.SCALAR,
+            special_index=supriya.UnaryOperator.MIDI_TO_HZ,
+            source=midi,
+        )
+        inverse = supriya.ugens.BinaryOpUGen(
+            calculation_rate=supriya.CalculationRate.SCALAR,
+            special_index=supriya.BinaryOperator.FLOAT_DIVISION,
+            left=1,
+            right=0,
+        )
+        supriya.ugens.Out.ar(bus=0, source=supriya.ugens.SinOsc.ar(frequency=frequency))
+        supriya.ugens.Out.ar(bus=1, source=supriya.ugens.DC.ar(source=inverse))
+    synthdef = builder.build("folded")
+    assert [type(ugen).__name__ for ugen in synthdef.ugens] == [
+        "BinaryOpUGen",
+        "DC",
+        "Out",
+        "SinOsc",
+        "Out",
+    ]
+    # Division by zero is left for the server to evaluate
+    assert synthdef.ugens[0].inputs == (1.0, 0.0)
+    assert synthdef.ugens[3].inputs == (440.0, 0.0)
+
+
+def test_SynthDefCompiler_optimization_04_random_operators():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        source = supriya.ugens.SinOsc.kr()
+        rands = [
+            supriya.ugens.UnaryOpUGen(
+                calculation_rate=supriya.CalculationRate.CONTROL,
+                special_index=supriya.UnaryOperator.RAND,
+                source=source,
+            )
+            for _ in range(2)
+        ]
+        supriya.ugens.Out.kr(bus=0, source=rands)
+    synthdef = builder.build("random")
+    assert [type(ugen).__name__ for ugen in synthdef.ugens] == [
+        "SinOsc",
+        "UnaryOpUGen",
+        "UnaryOpUGen",
+        "Out",
+    ]
+
+
+def test_SynthDefCompiler_optimization_05_stateful_ugens():
+    with supriya.synthdefs.SynthDefBuilder(buffer_id=0) as builder:
+        source = supriya.ugens.In.ar(bus=0)
+        # Both delays write into the same buffer, so neither can stand in for
+        # the other, though both are pure
+        delays = [
+            supriya.ugens.BufDelayN.ar(
+                buffer_id=builder["buffer_id"], source=source, delay_time=0.1
+            )
+            for _ in range(2)
+        ]
+        # Vibrato's variations are random
+        vibratos = [supriya.ugens.Vibrato.ar(rate_variation=0.1) for _ in range(2)]
+        supriya.ugens.Out.ar(bus=0, source=delays + vibratos)
+    optimized = builder.build("stateful")
+    unoptimized = builder.build("stateful", optimize=False)
+    assert len(optimized.ugens) == len(unoptimized.ugens) == 7
+    assert optimized.optimization_counts["merged"] == 0
@@ -117,22 +117,18 @@ def test_Splay_01_supriya(server):
             -   BinaryOpUGen(ADDITION).kr/0:
                     left: BinaryOpUGen(MULTIPLICATION).kr/0[0]
                     right: Control.kr[0:center]
-            -   BinaryOpUGen(MULTIPLICATION).kr/1:
-                    left: -0.5
-                    right: Control.kr[2:spread]
+            -   MulAdd.kr/0:
+                    source: Control.kr[2:spread]
+                    multiplier: -0.5
+                    addend: Control.kr[0:center]
+            -   MulAdd.kr/1:
+                    source: Control.kr[2:spread]
+                    multiplier: 0.5
+                    addend: Control.kr[0:center]
             -   BinaryOpUGen(ADDITION).kr/1:
-                    left: BinaryOpUGen(MULTIPLICATION).kr/1[0]
-                    right: Control.kr[0:center]
-            -   BinaryOpUGen(MULTIPLICATION).kr/2:
-                    left: 0.5
-                    right: Control.kr[2:spread]
-            -   BinaryOpUGen(ADDITION).kr/2:
-                    left: BinaryOpUGen(MULTIPLICATION).kr/2[0]
-                    right: Control.kr[0:center]
-            -   BinaryOpUGen(ADDITION).kr/3:
                     left: Control.kr[2:spread]
                     right: Control.kr[0:center]
-            -   BinaryOpUGen(MULTIPLICATION).kr/3:
+            -   BinaryOpUGen(MULTIPLICATION).kr/1:
                     left: Control.kr[1:level]
                     right: 0.4472135954999579
             -   In.ar:
@@ -143,7 +139,7 @@ def test_Splay_01_supriya(server):
                     level: 1.0
             -   Pan2.ar/1:
                     source: In.ar[1]
-                    position: BinaryOpUGen(ADDITION).kr/1[0]
+                    position: MulAdd.kr/0[0]
                     level: 1.0
             -   Pan2.ar/2:
                     source: In.ar[2]
@@ -151,7 +147,7 @@ def test_Splay_01_supriya(server):
                     level: 1.0
             -   Pan2.ar/3:
                     source: In.ar[3]
-                    position: BinaryOpUGen(ADDITION).kr/2[0]
+                    position: MulAdd.kr/1[0]
                     level: 1.0
             -   Sum4.ar/0:
                     input_one: Pan2.ar/0[0]
@@ -165,20 +161,20 @@ def test_Splay_01_supriya(server):
                     input_four: Pan2.ar/3[1]
             -   Pan2.ar/4:
                     source: In.ar[4]
-                    position: BinaryOpUGen(ADDITION).kr/3[0]
+                    position: BinaryOpUGen(ADDITION).kr/1[0]
                     level: 1.0
             -   BinaryOpUGen(ADDITION).ar/0:
                     left: Sum4.ar/0[0]
                     right: Pan2.ar/4[0]
             -   BinaryOpUGen(MULTIPLICATION).ar/0:
                     left: BinaryOpUGen(ADDITION).ar/0[0]
-                    right: BinaryOpUGen(MULTIPLICATION).kr/3[0]
+                    right: BinaryOpUGen(MULTIPLICATION).kr/1[0]
             -   BinaryOpUGen(ADDITION).ar/1:
                     left: Sum4.ar/1[0]
                     right: Pan2.ar/4[1]
             -   BinaryOpUGen(MULTIPLICATION).ar/1:
                     left: BinaryOpUGen(ADDITION).ar/1[0]
-                    right: BinaryOpUGen(MULTIPLICATION).kr/3[0]
+                    right: BinaryOpUGen(MULTIPLICATION).kr/1[0]
             -   Out.ar:
                     bus: 0.0
                     source[0]: BinaryOpUGen(MULTIPLICATION).ar/0[0]
@@ -361,48 +357,36 @@ def test_Splay_02_supriya(server):
             -   BinaryOpUGen(ADDITION).kr/0:
                     left: BinaryOpUGen(MULTIPLICATION).kr/0[0]
                     right: -0.25
+            -   BinaryOpUGen(ADDITION).kr/1:
+                    left: BinaryOpUGen(MULTIPLICATION).kr/0[0]
+                    right: 0.25
             -   BinaryOpUGen(MULTIPLICATION).kr/1:
                     left: -0.5
                     right: Control.kr[1:spread]
-            -   BinaryOpUGen(ADDITION).kr/1:
+            -   BinaryOpUGen(ADDITION).kr/2:
                     left: BinaryOpUGen(MULTIPLICATION).kr/1[0]
                     right: -0.25
+            -   BinaryOpUGen(ADDITION).kr/3:
+                    left: BinaryOpUGen(MULTIPLICATION).kr/1[0]
+                    right: 0.25
             -   BinaryOpUGen(MULTIPLICATION).kr/2:
                     left: 0.5
                     right: Control.kr[1:spread]
-            -   BinaryOpUGen(ADDITION).kr/2:
+            -   BinaryOpUGen(ADDITION).kr/4:
                     left: BinaryOpUGen(MULTIPLICATION).kr/2[0]
                     right: -0.25
-            -   BinaryOpUGen(ADDITION).kr/3:
+            -   BinaryOpUGen(ADDITION).kr/5:
+                    left: BinaryOpUGen(MULTIPLICATION).kr/2[0]
+                    right: 0.25
+            -   BinaryOpUGen(ADDITION).kr/6:
                     left: Control.kr[1:spread]
                     right: -0.25
             -   BinaryOpUGen(MULTIPLICATION).kr/3:
                     left: Control.kr[0:level]
                     right: 0.4472135954999579
-            -   BinaryOpUGen(MULTIPLICATION).kr/4:
-                    left: -1.0
-                    right: Control.kr[1:spread]
-            -   BinaryOpUGen(ADDITION).kr/4:
-                    left: BinaryOpUGen(MULTIPLICATION).kr/4[0]
-                    right: 0.25
-            -   BinaryOpUGen(MULTIPLICATION).kr/5:
-                    left: -0.5
-                    right: Control.kr[1:spread]
-            -   BinaryOpUGen(ADDITION).kr/5:
-                    left: BinaryOpUGen(MULTIPLICATION).kr/5[0]
-                    right: 0.25
-            -   BinaryOpUGen(MULTIPLICATION).kr/6:
-                    left: 0.5
-                    right: Control.kr[1:spread]
-            -   BinaryOpUGen(ADDITION).kr/6:
-                    left: BinaryOpUGen(MULTIPLICATION).kr/6[0]
-                    right: 0.25
             -   BinaryOpUGen(ADDITION).kr/7:
                     left: Control.kr[1:spread]
                     right: 0.25
-            -   BinaryOpUGen(MULTIPLICATION).kr/7:
-                    left: Control.kr[0:level]
-                    right: 0.4472135954999579
             -   In.ar:
                     bus: 0.0
             -   Pan2.ar/0:
@@ -411,7 +395,7 @@ def test_Splay_02_supriya(server):
                     level: 1.0
             -   Pan2.ar/1:
                     source: In.ar[1]
-                    position: BinaryOpUGen(ADDITION).kr/1[0]
+                    position: BinaryOpUGen(ADDITION).kr/2[0]
                     level: 1.0
             -   Pan2.ar/2:
                     source: In.ar[2]
@@ -419,7 +403,7 @@ def test_Splay_02_supriya(server):
                     level: 1.0
             -   Pan2.ar/3:
                     source: In.ar[3]
-                    position: BinaryOpUGen(ADDITION).kr/2[0]
+                    position: BinaryOpUGen(ADDITION).kr/4[0]
                     level: 1.0
             -   Sum4.ar/0:
                     input_one: Pan2.ar/0[0]
@@ -433,7 +417,7 @@ def test_Splay_02_supriya(server):
                     input_four: Pan2.ar/3[1]
             -   Pan2.ar/4:
                     source: In.ar[4]
-                    position: BinaryOpUGen(ADDITION).kr/3[0]
+                    position: BinaryOpUGen(ADDITION).kr/6[0]
                     level: 1.0
             -   BinaryOpUGen(ADDITION).ar/0:
                     left: Sum4.ar/0[0]
@@ -449,11 +433,11 @@ def test_Splay_02_supriya(server):
                     right: BinaryOpUGen(MULTIPLICATION).kr/3[0]
             -   Pan2.ar/5:
                     source: In.ar[0]
-                    position: BinaryOpUGen(ADDITION).kr/4[0]
+                    position: BinaryOpUGen(ADDITION).kr/1[0]
                     level: 1.0
             -   Pan2.ar/6:
                     source: In.ar[1]
-                    position: BinaryOpUGen(ADDITION).kr/5[0]
+                    position: BinaryOpUGen(ADDITION).kr/3[0]
                     level: 1.0
             -   Pan2.ar/7:
                     source: In.ar[2]
@@ -461,7 +445,7 @@ def test_Splay_02_supriya(server):
                     level: 1.0
             -   Pan2.ar/8:
                     source: In.ar[3]
-                    position: BinaryOpUGen(ADDITION).kr/6[0]
+                    position: BinaryOpUGen(ADDITION).kr/5[0]
                     level: 1.0
             -   Sum4.ar/2:
                     input_one: Pan2.ar/5[0]
@@ -480,25 +464,21 @@ def test_Splay_02_supriya(server):
             -   BinaryOpUGen(ADDITION).ar/2:
                     left: Sum4.ar/2[0]
                     right: Pan2.ar/9[0]
-            -   BinaryOpUGen(MULTIPLICATION).ar/2:
-                    left: BinaryOpUGen(ADDITION).ar/2[0]
-                    right: BinaryOpUGen(MULTIPLICATION).kr/7[0]
+            -   MulAdd.ar/0:
+                    source: BinaryOpUGen(ADDITION).ar/2[0]
+                    multiplier: BinaryOpUGen(MULTIPLICATION).kr/3[0]
+                    addend: BinaryOpUGen(MULTIPLICATION).ar/0[0]
             -   BinaryOpUGen(ADDITION).ar/3:
-                    left: BinaryOpUGen(MULTIPLICATION).ar/0[0]
-                    right: BinaryOpUGen(MULTIPLICATION).ar/2[0]
-            -   BinaryOpUGen(ADDITION).ar/4:
                     left: Sum4.ar/3[0]
                     right: Pan2.ar/9[1]
-            -   BinaryOpUGen(MULTIPLICATION).ar/3:
-                    left: BinaryOpUGen(ADDITION).ar/4[0]
-                    right: BinaryOpUGen(MULTIPLICATION).kr/7[0]
-            -   BinaryOpUGen(ADDITION).ar/5:
-                    left: BinaryOpUGen(MULTIPLICATION).ar/1[0]
-                    right: BinaryOpUGen(MULTIPLICATION).ar/3[0]
+            -   MulAdd.ar/1:
+                    source: BinaryOpUGen(ADDITION).ar/3[0]
+                    multiplier: BinaryOpUGen(MULTIPLICATION).kr/3[0]
+                    addend: BinaryOpUGen(MULTIPLICATION).ar/1[0]
             -   Out.ar:
                     bus: 0.0
-                    source[0]: BinaryOpUGen(ADDITION).ar/3[0]
-                    source[1]: BinaryOpUGen(ADDITION).ar/5[0]
+                    source[0]: MulAdd.ar/0[0]
+                    source[1]: MulAdd.ar/1[0]
         """
     )
     py_synthdef.allocate(server=server)
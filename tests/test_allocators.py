@@ -1,4 +1,9 @@
-from supriya.allocators import BlockAllocator
+import random
+
+import pytest
+
+from supriya.allocators import BlockAllocator, NodeIdAllocator
+from supriya.exceptions import NodeIdsExhausted
 
 
 def test_allocate():
@@ -33,3 +38,169 @@ def test_allocate_block_within_block():
     assert allocator.allocate_at(0, 9) is None
     assert allocator.allocate_at(3, 3) == 3
     assert allocator.free(99) is None
+
+
+def test_allocate_first_fit():
+    allocator = BlockAllocator()
+    assert [allocator.allocate(x) for x in (10, 1, 3, 1)] == [0, 10, 11, 14]
+    allocator.free(0)
+    allocator.free(11)
+    # The lowest sufficient free block wins over the smallest one
+    assert allocator.allocate(2) == 0
+    assert allocator.allocate(3) == 2
+    assert allocator.allocate(3) == 5
+    assert allocator.allocate(3) == 11
+    assert allocator.allocate(6) == 15
+
+
+def test_allocate_first_fit_random():
+    # Compare against a linear first-fit scan over sorted free blocks
+    random_ = random.Random(0)
+    allocator = BlockAllocator(heap_maximum=4096)
+    free_blocks = [[0, 4096]]
+    used = {}
+    for _ in range(10000):
+        if used and random_.random() < 0.5:
+            block_id = random_.choice(list(used))
+            allocator.free(block_id)
+            free_blocks.append([block_id, block_id + used.pop(block_id)])
+            free_blocks.sort()
+            for i in range(len(free_blocks) - 1, 0, -1):
+                if free_blocks[i - 1][1] == free_blocks[i][0]:
+                    free_blocks[i - 1][1] = free_blocks.pop(i)[1]
+            continue
+        size = random_.choice([1, 2, 3, 4, 7, 8, 9, 16, 33, 64])
+        expected = None
+        for free_block in free_blocks:
+            if size <= free_block[1] - free_block[0]:
+                expected = free_block[0]
+                free_block[0] += size
+                if free_block[0] == free_block[1]:
+                    free_blocks.remove(free_block)
+                break
+        assert allocator.allocate(size) == expected
+        if expected is not None:
+            used[expected] = size
+
+
+def test_free_within_block():
+    allocator = BlockAllocator(heap_maximum=8)
+    assert allocator.allocate(4) == 0
+    assert allocator.allocate(4) == 4
+    allocator.free(6)
+    assert allocator.allocate_at(4, 4) == 4
+
+
+def test_fragmentation():
+    random.seed(0)
+    allocator = BlockAllocator(heap_maximum=4096)
+    used = {}
+    for _ in range(10000):
+        if used and random.random() < 0.5:
+            block_id = random.choice(list(used))
+            allocator.free(block_id)
+            del used[block_id]
+            continue
+        size = random.randint(1, 16)
+        block_id = allocator.allocate(size)
+        if block_id is None:
+            continue
+        assert 0 <= block_id and block_id + size <= 4096
+        for other_id, other_size in used.items():
+            assert block_id + size <= other_id or other_id + other_size <= block_id
+        used[block_id] = size
+    for block_id in used:
+        allocator.free(block_id)
+    assert allocator.allocate(4096) == 0
+
+
+def test_allocate_many():
+    allocator = BlockAllocator(heap_maximum=16)
+    assert allocator.allocate_at(6, 2) == 6
+    assert allocator.allocate_many(3, 2) == [0, 2, 4]
+    # All or nothing
+    assert allocator.allocate_many(5, 2) is None
+    assert allocator.allocate_many(4, 2) == [8, 10, 12, 14]
+    allocator.free_many([0, 4, 10, 14])
+    assert allocator.allocate(4) is None
+    assert allocator.allocate_many(4, 2) == [0, 4, 10, 14]
+
+
+def test_node_id_allocate_many():
+    allocator = NodeIdAllocator(client_id=1, initial_node_id=1000)
+    assert allocator.allocate_many(3) == [
+        (1 << 26) | 1000,
+        (1 << 26) | 1001,
+        (1 << 26) | 1002,
+    ]
+    assert allocator.allocate_node_id() == (1 << 26) | 1003
+    # Wraps around exactly like allocate_node_id()
+    allocator._temp = 0x03FFFFFF - 1
+    node_ids = allocator.allocate_many(3)
+    allocator._temp = 0x03FFFFFF - 1
+    assert node_ids == [allocator.allocate_node_id() for _ in range(3)]
+
+
+def test_permanent_node_ids_lowest_freed_first():
+    allocator = NodeIdAllocator()
+    assert [allocator.allocate_permanent_node_id() for _ in range(5)] == [1, 2, 3, 4, 5]
+    for node_id in [4, 2, 2, 5000]:
+        allocator.free_permanent_node_id(node_id)
+    assert allocator.permanent_ids_in_use == 3
+    assert [allocator.allocate_permanent_node_id() for _ in range(3)] == [2, 4, 6]
+    assert allocator.permanent_ids_in_use == 6
+
+
+@pytest.mark.parametrize(
+    "exhaustion_policy, expected",
+    [
+        ("error", NodeIdsExhausted),
+        ("expand", [1, 2, 3, 4, 5, 6, 8, 9, 10, 11]),
+        ("wrap", [1, 2, 3, 1, 2, 3, 1, 2, 3, 1]),
+    ],
+)
+def test_permanent_node_id_exhaustion(exhaustion_policy, expected):
+    allocator = NodeIdAllocator(initial_node_id=4, exhaustion_policy=exhaustion_policy)
+    if not isinstance(expected, list):
+        for _ in range(3):
+            allocator.allocate_permanent_node_id()
+        with pytest.raises(expected):
+            allocator.allocate_permanent_node_id()
+        assert allocator.permanent_exhaustion_count == 1
+        return
+    node_ids = [allocator.allocate_permanent_node_id() for _ in range(6)]
+    assert allocator.allocate_node_id() == (4 if exhaustion_policy == "wrap" else 7)
+    node_ids.extend(allocator.allocate_permanent_node_id() for _ in range(4))
+    assert node_ids == expected
+    assert allocator.permanent_exhaustion_count == 3
+
+
+def test_permanent_node_id_expansion_wrap():
+    allocator = NodeIdAllocator(initial_node_id=4, exhaustion_policy="expand")
+    assert [allocator.allocate_permanent_node_id() for _ in range(6)] == [
+        1,
+        2,
+        3,
+        4,
+        5,
+        6,
+    ]
+    # Wrapping temporary IDs step over the expanded permanent IDs
+    allocator._temp = 0x03FFFFFF
+    assert allocator.allocate_node_id() == 0x03FFFFFF
+    assert allocator.allocate_node_id() == 7
+    allocator._temp = 0x03FFFFFF - 1
+    assert allocator.allocate_many(3) == [0x03FFFFFF - 1, 0x03FFFFFF, 7]
+    allocator._temp = 5
+    assert allocator.allocate_node_id(count=2) == 7
+    assert allocator.allocate_permanent_node_id() == 9
+    # Expanding after a wrap reserves around earlier expansions
+    allocator._temp = 0x03FFFFFF - 1
+    assert [allocator.allocate_permanent_node_id() for _ in range(3)] == [10, 11, 12]
+    assert allocator._permanent_id_ranges[-1] == (12, 15)
+    assert allocator.allocate_node_id() == 15
+
+
+def test_permanent_node_id_bad_exhaustion_policy():
+    with pytest.raises(ValueError):
+        NodeIdAllocator(exhaustion_policy="bogus")